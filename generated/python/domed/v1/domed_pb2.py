@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x64omed/v1/domed.proto\x12\x08\x64omed.v1\"^\n\tRpcStatus\x12\n\n\x02ok\x18\x01 \x01(\x08\x12!\n\x04\x63ode\x18\x02 \x01(\x0e\x32\x13.domed.v1.ErrorCode\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x11\n\tretryable\x18\x04 \x01(\x08\"\x0f\n\rHealthRequest\"Y\n\x0eHealthResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\n\n\x02ts\x18\x02 \x01(\t\x12\x16\n\x0e\x64\x61\x65mon_version\x18\x03 \x01(\t\"*\n\x17ListCapabilitiesRequest\x12\x0f\n\x07profile\x18\x01 \x01(\t\"Z\n\nCapability\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x16\n\x0eschema_version\x18\x03 \x01(\t\x12\x15\n\rfeature_flags\x18\x04 \x03(\t\"\x99\x01\n\x18ListCapabilitiesResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x16\n\x0eserver_version\x18\x02 \x01(\t\x12\x14\n\x0c\x61pi_versions\x18\x03 \x03(\t\x12*\n\x0c\x63\x61pabilities\x18\x04 \x03(\x0b\x32\x14.domed.v1.Capability\"\x12\n\x10ListToolsRequest\"g\n\x0bToolSummary\x12\x0f\n\x07tool_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x19\n\x11short_description\x18\x04 \x01(\t\x12\x0c\n\x04kind\x18\x05 \x01(\t\"\xf9\x01\n\x0eToolDescriptor\x12\x0f\n\x07tool_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x18\n\x10input_schema_ref\x18\x04 \x01(\t\x12\x19\n\x11output_schema_ref\x18\x05 \x01(\t\x12\x18\n\x10\x65xecutor_backend\x18\x06 \x01(\t\x12\r\n\x05title\x18\x07 \x01(\t\x12\x19\n\x11short_description\x18\x08 \x01(\t\x12\x0c\n\x04kind\x18\t \x01(\t\x12\x13\n\x0bpermissions\x18\n \x03(\t\x12\x14\n\x0cside_effects\x18\x0b \x03(\t\"^\n\x11ListToolsResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12$\n\x05tools\x18\x02 \x03(\x0b\x32\x15.domed.v1.ToolSummary\"!\n\x0eGetToolRequest\x12\x0f\n\x07tool_id\x18\x01 \x01(\t\"^\n\x0fGetToolResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12&\n\x04tool\x18\x02 \x01(\x0b\x32\x18.domed.v1.ToolDescriptor\"~\n\x13SkillExecuteRequest\x12\x10\n\x08skill_id\x18\x01 \x01(\t\x12\x0f\n\x07profile\x18\x02 \x01(\t\x12\x17\n\x0fidempotency_key\x18\x03 \x01(\t\x12\x11\n\ttask_json\x18\x04 \x01(\t\x12\x18\n\x10\x63onstraints_json\x18\x05 \x01(\t\")\n\x0b\x41rtifactRef\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\"\xa8\x01\n\x14SkillExecuteResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12\x0e\n\x06job_id\x18\x03 \x01(\t\x12!\n\x05state\x18\x04 \x01(\x0e\x32\x12.domed.v1.JobState\x12(\n\tartifacts\x18\x05 \x03(\x0b\x32\x15.domed.v1.ArtifactRef\"%\n\x13GetJobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\xac\x01\n\rRunProvenance\x12\x0c\n\x04repo\x18\x01 \x01(\t\x12\x12\n\ncommit_sha\x18\x02 \x01(\t\x12\x12\n\ndirty_flag\x18\x03 \x01(\x08\x12\x1c\n\x14\x63ontract_hashes_json\x18\x04 \x01(\t\x12\x1a\n\x12tool_versions_json\x18\x05 \x01(\t\x12\x12\n\ninput_hash\x18\x06 \x01(\t\x12\x17\n\x0f\x65nv_fingerprint\x18\x07 \x01(\t\"\xd5\x01\n\x14GetJobStatusResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12\x0e\n\x06job_id\x18\x03 \x01(\t\x12!\n\x05state\x18\x04 \x01(\x0e\x32\x12.domed.v1.JobState\x12(\n\tartifacts\x18\x05 \x03(\x0b\x32\x15.domed.v1.ArtifactRef\x12+\n\nprovenance\x18\x06 \x01(\x0b\x32\x17.domed.v1.RunProvenance\";\n\x10\x43\x61ncelJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x17\n\x0fidempotency_key\x18\x02 \x01(\t\"k\n\x11\x43\x61ncelJobResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06job_id\x18\x02 \x01(\t\x12!\n\x05state\x18\x03 \x01(\x0e\x32\x12.domed.v1.JobState\"K\n\x16StreamJobEventsRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06\x66ollow\x18\x02 \x01(\x08\x12\x11\n\tsince_seq\x18\x03 \x01(\x04\"\xa3\x01\n\x17StreamJobEventsResponse\x12\x0b\n\x03seq\x18\x01 \x01(\x04\x12\x10\n\x08\x65vent_id\x18\x02 \x01(\t\x12\n\n\x02ts\x18\x03 \x01(\t\x12\x0e\n\x06run_id\x18\x04 \x01(\t\x12\x0e\n\x06job_id\x18\x05 \x01(\t\x12\'\n\nevent_type\x18\x06 \x01(\x0e\x32\x13.domed.v1.EventType\x12\x14\n\x0cpayload_json\x18\x07 \x01(\t\"(\n\x16GetGateDecisionRequest\x12\x0e\n\x06run_id\x18\x01 \x01(\t\"j\n\x17GetGateDecisionResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12\x1a\n\x12gate_decision_path\x18\x03 \x01(\t\"-\n\x1bGetPromotionDecisionRequest\x12\x0e\n\x06run_id\x18\x01 \x01(\t\"t\n\x1cGetPromotionDecisionResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12\x1f\n\x17promotion_decision_path\x18\x03 \x01(\t*\x99\x01\n\x08JobState\x12\x19\n\x15JOB_STATE_UNSPECIFIED\x10\x00\x12\x14\n\x10JOB_STATE_QUEUED\x10\x01\x12\x15\n\x11JOB_STATE_RUNNING\x10\x02\x12\x17\n\x13JOB_STATE_SUCCEEDED\x10\x03\x12\x14\n\x10JOB_STATE_FAILED\x10\x04\x12\x16\n\x12JOB_STATE_CANCELED\x10\x05*\x84\x01\n\tEventType\x12\x1a\n\x16\x45VENT_TYPE_UNSPECIFIED\x10\x00\x12\x1b\n\x17\x45VENT_TYPE_STATE_CHANGE\x10\x01\x12\x12\n\x0e\x45VENT_TYPE_LOG\x10\x02\x12\x14\n\x10\x45VENT_TYPE_GUARD\x10\x03\x12\x14\n\x10\x45VENT_TYPE_ERROR\x10\x04*\xd0\x01\n\tErrorCode\x12\x1a\n\x16\x45RROR_CODE_UNSPECIFIED\x10\x00\x12\x15\n\x11\x45_INVALID_REQUEST\x10\x01\x12\x18\n\x14\x45_INVALID_TRANSITION\x10\x02\x12\x0f\n\x0b\x45_NOT_FOUND\x10\x03\x12\x13\n\x0f\x45_LOCK_CONFLICT\x10\x04\x12\x1c\n\x18\x45_IDEMPOTENCY_KEY_REUSED\x10\x05\x12\x13\n\x0f\x45_POLICY_DENIED\x10\x06\x12\r\n\tE_TIMEOUT\x10\x07\x12\x0e\n\nE_INTERNAL\x10\x08\x32\xa9\x06\n\x0c\x44omedService\x12;\n\x06Health\x12\x17.domed.v1.HealthRequest\x1a\x18.domed.v1.HealthResponse\x12Y\n\x10ListCapabilities\x12!.domed.v1.ListCapabilitiesRequest\x1a\".domed.v1.ListCapabilitiesResponse\x12\x44\n\tListTools\x12\x1a.domed.v1.ListToolsRequest\x1a\x1b.domed.v1.ListToolsResponse\x12>\n\x07GetTool\x12\x18.domed.v1.GetToolRequest\x1a\x19.domed.v1.GetToolResponse\x12M\n\x0cSkillExecute\x12\x1d.domed.v1.SkillExecuteRequest\x1a\x1e.domed.v1.SkillExecuteResponse\x12M\n\x0cGetJobStatus\x12\x1d.domed.v1.GetJobStatusRequest\x1a\x1e.domed.v1.GetJobStatusResponse\x12\x44\n\tCancelJob\x12\x1a.domed.v1.CancelJobRequest\x1a\x1b.domed.v1.CancelJobResponse\x12X\n\x0fStreamJobEvents\x12 .domed.v1.StreamJobEventsRequest\x1a!.domed.v1.StreamJobEventsResponse0\x01\x12V\n\x0fGetGateDecision\x12 .domed.v1.GetGateDecisionRequest\x1a!.domed.v1.GetGateDecisionResponse\x12\x65\n\x14GetPromotionDecision\x12%.domed.v1.GetPromotionDecisionRequest\x1a&.domed.v1.GetPromotionDecisionResponseB\x02P\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x64omed/v1/domed.proto\x12\x08\x64omed.v1\"^\n\tRpcStatus\x12\n\n\x02ok\x18\x01 \x01(\x08\x12!\n\x04\x63ode\x18\x02 \x01(\x0e\x32\x13.domed.v1.ErrorCode\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x11\n\tretryable\x18\x04 \x01(\x08\"\x0f\n\rHealthRequest\"Y\n\x0eHealthResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\n\n\x02ts\x18\x02 \x01(\t\x12\x16\n\x0e\x64\x61\x65mon_version\x18\x03 \x01(\t\"A\n\x17ListCapabilitiesRequest\x12\x0f\n\x07profile\x18\x01 \x01(\t\x12\x15\n\rif_none_match\x18\x02 \x01(\t\"Z\n\nCapability\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x16\n\x0eschema_version\x18\x03 \x01(\t\x12\x15\n\rfeature_flags\x18\x04 \x03(\t\"\xc9\x01\n\x18ListCapabilitiesResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x16\n\x0eserver_version\x18\x02 \x01(\t\x12\x14\n\x0c\x61pi_versions\x18\x03 \x03(\t\x12*\n\x0c\x63\x61pabilities\x18\x04 \x03(\x0b\x32\x14.domed.v1.Capability\x12\x18\n\x10registry_version\x18\x05 \x01(\t\x12\x14\n\x0cnot_modified\x18\x06 \x01(\x08\")\n\x10ListToolsRequest\x12\x15\n\rif_none_match\x18\x01 \x01(\t\"g\n\x0bToolSummary\x12\x0f\n\x07tool_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x19\n\x11short_description\x18\x04 \x01(\t\x12\x0c\n\x04kind\x18\x05 \x01(\t\"\xf9\x01\n\x0eToolDescriptor\x12\x0f\n\x07tool_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x18\n\x10input_schema_ref\x18\x04 \x01(\t\x12\x19\n\x11output_schema_ref\x18\x05 \x01(\t\x12\x18\n\x10\x65xecutor_backend\x18\x06 \x01(\t\x12\r\n\x05title\x18\x07 \x01(\t\x12\x19\n\x11short_description\x18\x08 \x01(\t\x12\x0c\n\x04kind\x18\t \x01(\t\x12\x13\n\x0bpermissions\x18\n \x03(\t\x12\x14\n\x0cside_effects\x18\x0b \x03(\t\"\x8e\x01\n\x11ListToolsResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12$\n\x05tools\x18\x02 \x03(\x0b\x32\x15.domed.v1.ToolSummary\x12\x18\n\x10registry_version\x18\x03 \x01(\t\x12\x14\n\x0cnot_modified\x18\x04 \x01(\x08\"!\n\x0eGetToolRequest\x12\x0f\n\x07tool_id\x18\x01 \x01(\t\"x\n\x0fGetToolResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12&\n\x04tool\x18\x02 \x01(\x0b\x32\x18.domed.v1.ToolDescriptor\x12\x18\n\x10registry_version\x18\x03 \x01(\t\"~\n\x13SkillExecuteRequest\x12\x10\n\x08skill_id\x18\x01 \x01(\t\x12\x0f\n\x07profile\x18\x02 \x01(\t\x12\x17\n\x0fidempotency_key\x18\x03 \x01(\t\x12\x11\n\ttask_json\x18\x04 \x01(\t\x12\x18\n\x10\x63onstraints_json\x18\x05 \x01(\t\")\n\x0b\x41rtifactRef\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\"\xa8\x01\n\x14SkillExecuteResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12\x0e\n\x06job_id\x18\x03 \x01(\t\x12!\n\x05state\x18\x04 \x01(\x0e\x32\x12.domed.v1.JobState\x12(\n\tartifacts\x18\x05 \x03(\x0b\x32\x15.domed.v1.ArtifactRef\"%\n\x13GetJobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\xdc\x01\n\rRunProvenance\x12\x0c\n\x04repo\x18\x01 \x01(\t\x12\x12\n\ncommit_sha\x18\x02 \x01(\t\x12\x12\n\ndirty_flag\x18\x03 \x01(\x08\x12\x1c\n\x14\x63ontract_hashes_json\x18\x04 \x01(\t\x12\x1a\n\x12tool_versions_json\x18\x05 \x01(\t\x12\x12\n\ninput_hash\x18\x06 \x01(\t\x12\x17\n\x0f\x65nv_fingerprint\x18\x07 \x01(\t\x12\x11\n\tcache_hit\x18\x08 \x01(\x08\x12\x1b\n\x13\x63\x61\x63he_source_job_id\x18\t \x01(\t\"\xd5\x01\n\x14GetJobStatusResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12\x0e\n\x06job_id\x18\x03 \x01(\t\x12!\n\x05state\x18\x04 \x01(\x0e\x32\x12.domed.v1.JobState\x12(\n\tartifacts\x18\x05 \x03(\x0b\x32\x15.domed.v1.ArtifactRef\x12+\n\nprovenance\x18\x06 \x01(\x0b\x32\x17.domed.v1.RunProvenance\"K\n\x18SkillExecuteBatchRequest\x12/\n\x08requests\x18\x01 \x03(\x0b\x32\x1d.domed.v1.SkillExecuteRequest\"s\n\x19SkillExecuteBatchResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x31\n\tresponses\x18\x02 \x03(\x0b\x32\x1e.domed.v1.SkillExecuteResponse\"+\n\x18GetJobStatusBatchRequest\x12\x0f\n\x07job_ids\x18\x01 \x03(\t\"s\n\x19GetJobStatusBatchResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x31\n\tresponses\x18\x02 \x03(\x0b\x32\x1e.domed.v1.GetJobStatusResponse\"\xae\x01\n\x0fListJobsRequest\x12\"\n\x06states\x18\x01 \x03(\x0e\x32\x12.domed.v1.JobState\x12\x10\n\x08skill_id\x18\x02 \x01(\t\x12\x0f\n\x07profile\x18\x03 \x01(\t\x12\x15\n\rupdated_after\x18\x04 \x01(\x01\x12\x16\n\x0eupdated_before\x18\x05 \x01(\x01\x12\x11\n\tpage_size\x18\x06 \x01(\r\x12\x12\n\npage_token\x18\x07 \x01(\t\"\x9a\x01\n\nJobSummary\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12!\n\x05state\x18\x03 \x01(\x0e\x32\x12.domed.v1.JobState\x12\x10\n\x08skill_id\x18\x04 \x01(\t\x12\x0f\n\x07profile\x18\x05 \x01(\t\x12\x12\n\ncreated_at\x18\x06 \x01(\x01\x12\x12\n\nupdated_at\x18\x07 \x01(\x01\"t\n\x10ListJobsResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\"\n\x04jobs\x18\x02 \x03(\x0b\x32\x14.domed.v1.JobSummary\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"4\n\x11GetMetricsRequest\x12\x1f\n\x17include_prometheus_text\x18\x01 \x01(\x08\"*\n\x0bMetricLabel\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"R\n\x0cMetricSample\x12\x0c\n\x04name\x18\x01 \x01(\t\x12%\n\x06labels\x18\x02 \x03(\x0b\x32\x15.domed.v1.MetricLabel\x12\r\n\x05value\x18\x03 \x01(\x01\"\x8f\x01\n\x0fHistogramSample\x12\x0c\n\x04name\x18\x01 \x01(\t\x12%\n\x06labels\x18\x02 \x03(\x0b\x32\x15.domed.v1.MetricLabel\x12\x14\n\x0cupper_bounds\x18\x03 \x03(\x01\x12\x15\n\rbucket_counts\x18\x04 \x03(\x04\x12\r\n\x05\x63ount\x18\x05 \x01(\x04\x12\x0b\n\x03sum\x18\x06 \x01(\x01\"\xeb\x01\n\x12GetMetricsResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12(\n\x08\x63ounters\x18\x02 \x03(\x0b\x32\x16.domed.v1.MetricSample\x12&\n\x06gauges\x18\x03 \x03(\x0b\x32\x16.domed.v1.MetricSample\x12-\n\nhistograms\x18\x04 \x03(\x0b\x32\x19.domed.v1.HistogramSample\x12\x16\n\x0euptime_seconds\x18\x05 \x01(\x01\x12\x17\n\x0fprometheus_text\x18\x06 \x01(\t\";\n\x10\x43\x61ncelJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x17\n\x0fidempotency_key\x18\x02 \x01(\t\"k\n\x11\x43\x61ncelJobResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06job_id\x18\x02 \x01(\t\x12!\n\x05state\x18\x03 \x01(\x0e\x32\x12.domed.v1.JobState\"K\n\x16StreamJobEventsRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06\x66ollow\x18\x02 \x01(\x08\x12\x11\n\tsince_seq\x18\x03 \x01(\x04\"\xa3\x01\n\x17StreamJobEventsResponse\x12\x0b\n\x03seq\x18\x01 \x01(\x04\x12\x10\n\x08\x65vent_id\x18\x02 \x01(\t\x12\n\n\x02ts\x18\x03 \x01(\t\x12\x0e\n\x06run_id\x18\x04 \x01(\t\x12\x0e\n\x06job_id\x18\x05 \x01(\t\x12\'\n\nevent_type\x18\x06 \x01(\x0e\x32\x13.domed.v1.EventType\x12\x14\n\x0cpayload_json\x18\x07 \x01(\t\"(\n\x16GetGateDecisionRequest\x12\x0e\n\x06run_id\x18\x01 \x01(\t\"j\n\x17GetGateDecisionResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12\x1a\n\x12gate_decision_path\x18\x03 \x01(\t\"-\n\x1bGetPromotionDecisionRequest\x12\x0e\n\x06run_id\x18\x01 \x01(\t\"t\n\x1cGetPromotionDecisionResponse\x12#\n\x06status\x18\x01 \x01(\x0b\x32\x13.domed.v1.RpcStatus\x12\x0e\n\x06run_id\x18\x02 \x01(\t\x12\x1f\n\x17promotion_decision_path\x18\x03 \x01(\t*\x99\x01\n\x08JobState\x12\x19\n\x15JOB_STATE_UNSPECIFIED\x10\x00\x12\x14\n\x10JOB_STATE_QUEUED\x10\x01\x12\x15\n\x11JOB_STATE_RUNNING\x10\x02\x12\x17\n\x13JOB_STATE_SUCCEEDED\x10\x03\x12\x14\n\x10JOB_STATE_FAILED\x10\x04\x12\x16\n\x12JOB_STATE_CANCELED\x10\x05*\x84\x01\n\tEventType\x12\x1a\n\x16\x45VENT_TYPE_UNSPECIFIED\x10\x00\x12\x1b\n\x17\x45VENT_TYPE_STATE_CHANGE\x10\x01\x12\x12\n\x0e\x45VENT_TYPE_LOG\x10\x02\x12\x14\n\x10\x45VENT_TYPE_GUARD\x10\x03\x12\x14\n\x10\x45VENT_TYPE_ERROR\x10\x04*\xd0\x01\n\tErrorCode\x12\x1a\n\x16\x45RROR_CODE_UNSPECIFIED\x10\x00\x12\x15\n\x11\x45_INVALID_REQUEST\x10\x01\x12\x18\n\x14\x45_INVALID_TRANSITION\x10\x02\x12\x0f\n\x0b\x45_NOT_FOUND\x10\x03\x12\x13\n\x0f\x45_LOCK_CONFLICT\x10\x04\x12\x1c\n\x18\x45_IDEMPOTENCY_KEY_REUSED\x10\x05\x12\x13\n\x0f\x45_POLICY_DENIED\x10\x06\x12\r\n\tE_TIMEOUT\x10\x07\x12\x0e\n\nE_INTERNAL\x10\x08\x32\xf1\x08\n\x0c\x44omedService\x12;\n\x06Health\x12\x17.domed.v1.HealthRequest\x1a\x18.domed.v1.HealthResponse\x12Y\n\x10ListCapabilities\x12!.domed.v1.ListCapabilitiesRequest\x1a\".domed.v1.ListCapabilitiesResponse\x12\x44\n\tListTools\x12\x1a.domed.v1.ListToolsRequest\x1a\x1b.domed.v1.ListToolsResponse\x12>\n\x07GetTool\x12\x18.domed.v1.GetToolRequest\x1a\x19.domed.v1.GetToolResponse\x12M\n\x0cSkillExecute\x12\x1d.domed.v1.SkillExecuteRequest\x1a\x1e.domed.v1.SkillExecuteResponse\x12M\n\x0cGetJobStatus\x12\x1d.domed.v1.GetJobStatusRequest\x1a\x1e.domed.v1.GetJobStatusResponse\x12\x44\n\tCancelJob\x12\x1a.domed.v1.CancelJobRequest\x1a\x1b.domed.v1.CancelJobResponse\x12X\n\x0fStreamJobEvents\x12 .domed.v1.StreamJobEventsRequest\x1a!.domed.v1.StreamJobEventsResponse0\x01\x12V\n\x0fGetGateDecision\x12 .domed.v1.GetGateDecisionRequest\x1a!.domed.v1.GetGateDecisionResponse\x12\x65\n\x14GetPromotionDecision\x12%.domed.v1.GetPromotionDecisionRequest\x1a&.domed.v1.GetPromotionDecisionResponse\x12\\\n\x11SkillExecuteBatch\x12\".domed.v1.SkillExecuteBatchRequest\x1a#.domed.v1.SkillExecuteBatchResponse\x12\\\n\x11GetJobStatusBatch\x12\".domed.v1.GetJobStatusBatchRequest\x1a#.domed.v1.GetJobStatusBatchResponse\x12\x41\n\x08ListJobs\x12\x19.domed.v1.ListJobsRequest\x1a\x1a.domed.v1.ListJobsResponse\x12G\n\nGetMetrics\x12\x1b.domed.v1.GetMetricsRequest\x1a\x1c.domed.v1.GetMetricsResponseB\x02P\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -32,12 +32,12 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'domed.v1.domed_pb2', _globa
 if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'P\001'
-  _globals['_JOBSTATE']._serialized_start=2635
-  _globals['_JOBSTATE']._serialized_end=2788
-  _globals['_EVENTTYPE']._serialized_start=2791
-  _globals['_EVENTTYPE']._serialized_end=2923
-  _globals['_ERRORCODE']._serialized_start=2926
-  _globals['_ERRORCODE']._serialized_end=3134
+  _globals['_JOBSTATE']._serialized_start=4226
+  _globals['_JOBSTATE']._serialized_end=4379
+  _globals['_EVENTTYPE']._serialized_start=4382
+  _globals['_EVENTTYPE']._serialized_end=4514
+  _globals['_ERRORCODE']._serialized_start=4517
+  _globals['_ERRORCODE']._serialized_end=4725
   _globals['_RPCSTATUS']._serialized_start=34
   _globals['_RPCSTATUS']._serialized_end=128
   _globals['_HEALTHREQUEST']._serialized_start=130
@@ -45,51 +45,75 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_HEALTHRESPONSE']._serialized_start=147
   _globals['_HEALTHRESPONSE']._serialized_end=236
   _globals['_LISTCAPABILITIESREQUEST']._serialized_start=238
-  _globals['_LISTCAPABILITIESREQUEST']._serialized_end=280
-  _globals['_CAPABILITY']._serialized_start=282
-  _globals['_CAPABILITY']._serialized_end=372
-  _globals['_LISTCAPABILITIESRESPONSE']._serialized_start=375
-  _globals['_LISTCAPABILITIESRESPONSE']._serialized_end=528
-  _globals['_LISTTOOLSREQUEST']._serialized_start=530
-  _globals['_LISTTOOLSREQUEST']._serialized_end=548
-  _globals['_TOOLSUMMARY']._serialized_start=550
-  _globals['_TOOLSUMMARY']._serialized_end=653
-  _globals['_TOOLDESCRIPTOR']._serialized_start=656
-  _globals['_TOOLDESCRIPTOR']._serialized_end=905
-  _globals['_LISTTOOLSRESPONSE']._serialized_start=907
-  _globals['_LISTTOOLSRESPONSE']._serialized_end=1001
-  _globals['_GETTOOLREQUEST']._serialized_start=1003
-  _globals['_GETTOOLREQUEST']._serialized_end=1036
-  _globals['_GETTOOLRESPONSE']._serialized_start=1038
-  _globals['_GETTOOLRESPONSE']._serialized_end=1132
-  _globals['_SKILLEXECUTEREQUEST']._serialized_start=1134
-  _globals['_SKILLEXECUTEREQUEST']._serialized_end=1260
-  _globals['_ARTIFACTREF']._serialized_start=1262
-  _globals['_ARTIFACTREF']._serialized_end=1303
-  _globals['_SKILLEXECUTERESPONSE']._serialized_start=1306
-  _globals['_SKILLEXECUTERESPONSE']._serialized_end=1474
-  _globals['_GETJOBSTATUSREQUEST']._serialized_start=1476
-  _globals['_GETJOBSTATUSREQUEST']._serialized_end=1513
-  _globals['_RUNPROVENANCE']._serialized_start=1516
-  _globals['_RUNPROVENANCE']._serialized_end=1688
-  _globals['_GETJOBSTATUSRESPONSE']._serialized_start=1691
-  _globals['_GETJOBSTATUSRESPONSE']._serialized_end=1904
-  _globals['_CANCELJOBREQUEST']._serialized_start=1906
-  _globals['_CANCELJOBREQUEST']._serialized_end=1965
-  _globals['_CANCELJOBRESPONSE']._serialized_start=1967
-  _globals['_CANCELJOBRESPONSE']._serialized_end=2074
-  _globals['_STREAMJOBEVENTSREQUEST']._serialized_start=2076
-  _globals['_STREAMJOBEVENTSREQUEST']._serialized_end=2151
-  _globals['_STREAMJOBEVENTSRESPONSE']._serialized_start=2154
-  _globals['_STREAMJOBEVENTSRESPONSE']._serialized_end=2317
-  _globals['_GETGATEDECISIONREQUEST']._serialized_start=2319
-  _globals['_GETGATEDECISIONREQUEST']._serialized_end=2359
-  _globals['_GETGATEDECISIONRESPONSE']._serialized_start=2361
-  _globals['_GETGATEDECISIONRESPONSE']._serialized_end=2467
-  _globals['_GETPROMOTIONDECISIONREQUEST']._serialized_start=2469
-  _globals['_GETPROMOTIONDECISIONREQUEST']._serialized_end=2514
-  _globals['_GETPROMOTIONDECISIONRESPONSE']._serialized_start=2516
-  _globals['_GETPROMOTIONDECISIONRESPONSE']._serialized_end=2632
-  _globals['_DOMEDSERVICE']._serialized_start=3137
-  _globals['_DOMEDSERVICE']._serialized_end=3946
+  _globals['_LISTCAPABILITIESREQUEST']._serialized_end=303
+  _globals['_CAPABILITY']._serialized_start=305
+  _globals['_CAPABILITY']._serialized_end=395
+  _globals['_LISTCAPABILITIESRESPONSE']._serialized_start=398
+  _globals['_LISTCAPABILITIESRESPONSE']._serialized_end=599
+  _globals['_LISTTOOLSREQUEST']._serialized_start=601
+  _globals['_LISTTOOLSREQUEST']._serialized_end=642
+  _globals['_TOOLSUMMARY']._serialized_start=644
+  _globals['_TOOLSUMMARY']._serialized_end=747
+  _globals['_TOOLDESCRIPTOR']._serialized_start=750
+  _globals['_TOOLDESCRIPTOR']._serialized_end=999
+  _globals['_LISTTOOLSRESPONSE']._serialized_start=1002
+  _globals['_LISTTOOLSRESPONSE']._serialized_end=1144
+  _globals['_GETTOOLREQUEST']._serialized_start=1146
+  _globals['_GETTOOLREQUEST']._serialized_end=1179
+  _globals['_GETTOOLRESPONSE']._serialized_start=1181
+  _globals['_GETTOOLRESPONSE']._serialized_end=1301
+  _globals['_SKILLEXECUTEREQUEST']._serialized_start=1303
+  _globals['_SKILLEXECUTEREQUEST']._serialized_end=1429
+  _globals['_ARTIFACTREF']._serialized_start=1431
+  _globals['_ARTIFACTREF']._serialized_end=1472
+  _globals['_SKILLEXECUTERESPONSE']._serialized_start=1475
+  _globals['_SKILLEXECUTERESPONSE']._serialized_end=1643
+  _globals['_GETJOBSTATUSREQUEST']._serialized_start=1645
+  _globals['_GETJOBSTATUSREQUEST']._serialized_end=1682
+  _globals['_RUNPROVENANCE']._serialized_start=1685
+  _globals['_RUNPROVENANCE']._serialized_end=1905
+  _globals['_GETJOBSTATUSRESPONSE']._serialized_start=1908
+  _globals['_GETJOBSTATUSRESPONSE']._serialized_end=2121
+  _globals['_SKILLEXECUTEBATCHREQUEST']._serialized_start=2123
+  _globals['_SKILLEXECUTEBATCHREQUEST']._serialized_end=2198
+  _globals['_SKILLEXECUTEBATCHRESPONSE']._serialized_start=2200
+  _globals['_SKILLEXECUTEBATCHRESPONSE']._serialized_end=2315
+  _globals['_GETJOBSTATUSBATCHREQUEST']._serialized_start=2317
+  _globals['_GETJOBSTATUSBATCHREQUEST']._serialized_end=2360
+  _globals['_GETJOBSTATUSBATCHRESPONSE']._serialized_start=2362
+  _globals['_GETJOBSTATUSBATCHRESPONSE']._serialized_end=2477
+  _globals['_LISTJOBSREQUEST']._serialized_start=2480
+  _globals['_LISTJOBSREQUEST']._serialized_end=2654
+  _globals['_JOBSUMMARY']._serialized_start=2657
+  _globals['_JOBSUMMARY']._serialized_end=2811
+  _globals['_LISTJOBSRESPONSE']._serialized_start=2813
+  _globals['_LISTJOBSRESPONSE']._serialized_end=2929
+  _globals['_GETMETRICSREQUEST']._serialized_start=2931
+  _globals['_GETMETRICSREQUEST']._serialized_end=2983
+  _globals['_METRICLABEL']._serialized_start=2985
+  _globals['_METRICLABEL']._serialized_end=3027
+  _globals['_METRICSAMPLE']._serialized_start=3029
+  _globals['_METRICSAMPLE']._serialized_end=3111
+  _globals['_HISTOGRAMSAMPLE']._serialized_start=3114
+  _globals['_HISTOGRAMSAMPLE']._serialized_end=3257
+  _globals['_GETMETRICSRESPONSE']._serialized_start=3260
+  _globals['_GETMETRICSRESPONSE']._serialized_end=3495
+  _globals['_CANCELJOBREQUEST']._serialized_start=3497
+  _globals['_CANCELJOBREQUEST']._serialized_end=3556
+  _globals['_CANCELJOBRESPONSE']._serialized_start=3558
+  _globals['_CANCELJOBRESPONSE']._serialized_end=3665
+  _globals['_STREAMJOBEVENTSREQUEST']._serialized_start=3667
+  _globals['_STREAMJOBEVENTSREQUEST']._serialized_end=3742
+  _globals['_STREAMJOBEVENTSRESPONSE']._serialized_start=3745
+  _globals['_STREAMJOBEVENTSRESPONSE']._serialized_end=3908
+  _globals['_GETGATEDECISIONREQUEST']._serialized_start=3910
+  _globals['_GETGATEDECISIONREQUEST']._serialized_end=3950
+  _globals['_GETGATEDECISIONRESPONSE']._serialized_start=3952
+  _globals['_GETGATEDECISIONRESPONSE']._serialized_end=4058
+  _globals['_GETPROMOTIONDECISIONREQUEST']._serialized_start=4060
+  _globals['_GETPROMOTIONDECISIONREQUEST']._serialized_end=4105
+  _globals['_GETPROMOTIONDECISIONRESPONSE']._serialized_start=4107
+  _globals['_GETPROMOTIONDECISIONRESPONSE']._serialized_end=4223
+  _globals['_DOMEDSERVICE']._serialized_start=4728
+  _globals['_DOMEDSERVICE']._serialized_end=5865
 # @@protoc_insertion_point(module_scope)
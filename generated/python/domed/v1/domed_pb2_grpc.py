@@ -84,6 +84,26 @@ class DomedServiceStub(object):
                 request_serializer=domed_dot_v1_dot_domed__pb2.GetPromotionDecisionRequest.SerializeToString,
                 response_deserializer=domed_dot_v1_dot_domed__pb2.GetPromotionDecisionResponse.FromString,
                 _registered_method=True)
+        self.SkillExecuteBatch = channel.unary_unary(
+                '/domed.v1.DomedService/SkillExecuteBatch',
+                request_serializer=domed_dot_v1_dot_domed__pb2.SkillExecuteBatchRequest.SerializeToString,
+                response_deserializer=domed_dot_v1_dot_domed__pb2.SkillExecuteBatchResponse.FromString,
+                _registered_method=True)
+        self.GetJobStatusBatch = channel.unary_unary(
+                '/domed.v1.DomedService/GetJobStatusBatch',
+                request_serializer=domed_dot_v1_dot_domed__pb2.GetJobStatusBatchRequest.SerializeToString,
+                response_deserializer=domed_dot_v1_dot_domed__pb2.GetJobStatusBatchResponse.FromString,
+                _registered_method=True)
+        self.ListJobs = channel.unary_unary(
+                '/domed.v1.DomedService/ListJobs',
+                request_serializer=domed_dot_v1_dot_domed__pb2.ListJobsRequest.SerializeToString,
+                response_deserializer=domed_dot_v1_dot_domed__pb2.ListJobsResponse.FromString,
+                _registered_method=True)
+        self.GetMetrics = channel.unary_unary(
+                '/domed.v1.DomedService/GetMetrics',
+                request_serializer=domed_dot_v1_dot_domed__pb2.GetMetricsRequest.SerializeToString,
+                response_deserializer=domed_dot_v1_dot_domed__pb2.GetMetricsResponse.FromString,
+                _registered_method=True)
 
 
 class DomedServiceServicer(object):
@@ -149,6 +169,30 @@ class DomedServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SkillExecuteBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetJobStatusBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListJobs(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetMetrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_DomedServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -202,6 +246,26 @@ def add_DomedServiceServicer_to_server(servicer, server):
                     request_deserializer=domed_dot_v1_dot_domed__pb2.GetPromotionDecisionRequest.FromString,
                     response_serializer=domed_dot_v1_dot_domed__pb2.GetPromotionDecisionResponse.SerializeToString,
             ),
+            'SkillExecuteBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.SkillExecuteBatch,
+                    request_deserializer=domed_dot_v1_dot_domed__pb2.SkillExecuteBatchRequest.FromString,
+                    response_serializer=domed_dot_v1_dot_domed__pb2.SkillExecuteBatchResponse.SerializeToString,
+            ),
+            'GetJobStatusBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetJobStatusBatch,
+                    request_deserializer=domed_dot_v1_dot_domed__pb2.GetJobStatusBatchRequest.FromString,
+                    response_serializer=domed_dot_v1_dot_domed__pb2.GetJobStatusBatchResponse.SerializeToString,
+            ),
+            'ListJobs': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListJobs,
+                    request_deserializer=domed_dot_v1_dot_domed__pb2.ListJobsRequest.FromString,
+                    response_serializer=domed_dot_v1_dot_domed__pb2.ListJobsResponse.SerializeToString,
+            ),
+            'GetMetrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMetrics,
+                    request_deserializer=domed_dot_v1_dot_domed__pb2.GetMetricsRequest.FromString,
+                    response_serializer=domed_dot_v1_dot_domed__pb2.GetMetricsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'domed.v1.DomedService', rpc_method_handlers)
@@ -482,3 +546,111 @@ class DomedService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def SkillExecuteBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/domed.v1.DomedService/SkillExecuteBatch',
+            domed_dot_v1_dot_domed__pb2.SkillExecuteBatchRequest.SerializeToString,
+            domed_dot_v1_dot_domed__pb2.SkillExecuteBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetJobStatusBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/domed.v1.DomedService/GetJobStatusBatch',
+            domed_dot_v1_dot_domed__pb2.GetJobStatusBatchRequest.SerializeToString,
+            domed_dot_v1_dot_domed__pb2.GetJobStatusBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListJobs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/domed.v1.DomedService/ListJobs',
+            domed_dot_v1_dot_domed__pb2.ListJobsRequest.SerializeToString,
+            domed_dot_v1_dot_domed__pb2.ListJobsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetMetrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/domed.v1.DomedService/GetMetrics',
+            domed_dot_v1_dot_domed__pb2.GetMetricsRequest.SerializeToString,
+            domed_dot_v1_dot_domed__pb2.GetMetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -30,7 +30,7 @@ def test_run_task_via_domed_uses_client(monkeypatch) -> None:  # type: ignore[no
             )
 
     class FakeCfg:
-        def __init__(self, endpoint: str) -> None:
+        def __init__(self, endpoint: str, **kwargs) -> None:
             self.endpoint = endpoint
 
     fake_module = types.SimpleNamespace(DomedClient=FakeClient, DomedClientConfig=FakeCfg)
@@ -46,7 +46,7 @@ def test_dome_cli_list_tools(monkeypatch) -> None:  # type: ignore[no-untyped-de
             )
 
     class FakeCfg:
-        def __init__(self, endpoint: str | None) -> None:
+        def __init__(self, endpoint: str | None, **kwargs) -> None:
             self.endpoint = endpoint
 
     monkeypatch.setitem(
@@ -102,7 +102,7 @@ def test_dome_cli_get_tool(monkeypatch) -> None:  # type: ignore[no-untyped-def]
             )
 
     class FakeCfg:
-        def __init__(self, endpoint: str | None) -> None:
+        def __init__(self, endpoint: str | None, **kwargs) -> None:
             self.endpoint = endpoint
 
     monkeypatch.setitem(
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.domed.admission import AdmissionController
+from tools.domed.scheduler import QueuedJob
+
+
+def _tool(**limits: int) -> dict:
+    return {"tool_id": "heavy", **limits}
+
+
+def _item(job_id: str, tool: dict, profile: str = "work") -> QueuedJob:
+    return QueuedJob(job_id=job_id, tool=tool, task_json="{}", constraints_json="{}", profile=profile)
+
+
+def test_admission_unlimited_tool_bypasses_accounting() -> None:
+    ctl = AdmissionController()
+    tool = _tool()
+    assert all(ctl.admit(tool, "work") is None for _ in range(100))
+    assert ctl.start(_item("j1", tool)) is True
+    assert ctl.finish(_item("j1", tool), started=True) is None
+    assert ctl.snapshot() == {}
+
+
+def test_admission_parks_over_concurrency_and_rejects_past_queue_depth() -> None:
+    ctl = AdmissionController()
+    tool = _tool(max_concurrency=1, max_queue_depth=2)
+    assert ctl.admit(tool, "work") is None
+    assert ctl.admit(tool, "work") is None
+    assert ctl.admit(tool, "work") is not None
+
+    first, second = _item("j1", tool), _item("j2", tool)
+    assert ctl.start(first) is True
+    assert ctl.start(second) is False
+    assert ctl.snapshot()["heavy"] == {"running": 1, "waiting": 1, "parked": 1}
+    assert ctl.admit(tool, "work") is None
+    assert ctl.admit(tool, "work") is not None
+
+    assert ctl.finish(first, started=True) is second
+    assert ctl.start(second) is True
+
+
+def test_admission_without_queue_depth_only_admits_runnable_jobs() -> None:
+    ctl = AdmissionController()
+    tool = _tool(max_concurrency=2)
+    assert ctl.admit(tool, "work") is None
+    assert ctl.admit(tool, "work") is None
+    assert "saturated" in (ctl.admit(tool, "work") or "")
+    ctl.release(tool, "work")
+    assert ctl.admit(tool, "work") is None
+
+
+def test_admission_profile_quota_is_per_profile() -> None:
+    ctl = AdmissionController()
+    tool = _tool(profile_quota=1)
+    assert ctl.admit(tool, "work") is None
+    assert "quota" in (ctl.admit(tool, "work") or "")
+    assert ctl.admit(tool, "home") is None
+    assert ctl.finish(_item("j1", tool, "work"), started=False) is None
+    assert ctl.admit(tool, "work") is None
+
+
+def test_service_rejects_saturated_tool_with_retryable_lock_conflict() -> None:
+    pytest.importorskip("grpc")
+    pytest.importorskip("google.protobuf")
+    from tools.domed import service as domed_service
+    from tools.domed.tool_registry import ToolRegistry
+
+    tool = domed_service._normalize_tool_item(  # noqa: SLF001
+        {"tool_id": "heavy", "executor_backend": "inmemory", "max_concurrency": 1}
+    )
+    registry = ToolRegistry(lambda: [tool], tools_root=ROOT / "missing", fallback_registry=ROOT / "missing")
+    service = domed_service.InMemoryDomedService(registry=registry)
+    service.scheduler.close(wait=True)
+    service.scheduler = domed_service.JobScheduler(lambda _item: None, max_workers=1)
+    pb2 = domed_service.domed_pb2
+    try:
+        def submit(key: str):  # type: ignore[no-untyped-def]
+            return service.SkillExecute(
+                pb2.SkillExecuteRequest(skill_id="heavy", profile="work", idempotency_key=key, task_json="{}"),
+                None,
+            )
+
+        assert submit("k1").status.ok is True
+        rejected = submit("k2")
+        assert rejected.status.ok is False
+        assert rejected.status.code == pb2.E_LOCK_CONFLICT
+        assert rejected.status.retryable is True
+        assert rejected.job_id == ""
+        assert submit("k1").status.message == "replayed"
+        assert service.admission.snapshot()["heavy"] == {"running": 0, "waiting": 1, "parked": 0}
+    finally:
+        service.close()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+grpc = pytest.importorskip("grpc")
+pytest.importorskip("google.protobuf")
+
+from tools.domed.log_payload import payload_lines
+from tools.domed.scheduler import JobScheduler
+from tools.domed.service import AsyncDomedService, InMemoryDomedService, start_async_server, domed_pb2, domed_pb2_grpc
+
+
+def _submit(skill_id: str, idem: str, task: dict[str, object]) -> object:
+    return domed_pb2.SkillExecuteRequest(
+        skill_id=skill_id,
+        profile="work",
+        idempotency_key=idem,
+        task_json=json.dumps(task, sort_keys=True),
+        constraints_json="{}",
+    )
+
+
+def test_aio_server_runs_local_process_tool_to_terminal() -> None:
+    async def scenario() -> list[dict[str, object]]:
+        server, port, service = await start_async_server()
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = domed_pb2_grpc.DomedServiceStub(channel)
+                submit = await stub.SkillExecute(
+                    _submit("domed.exec-probe", "idem-aio-1", {"stdout": ["aio"], "exit_code": 0})
+                )
+                assert submit.status.ok is True
+                req = domed_pb2.StreamJobEventsRequest(job_id=submit.job_id, follow=True)
+                return [json.loads(e.payload_json) async for e in stub.StreamJobEvents(req)]
+        finally:
+            await server.stop(grace=0)
+            service.close()
+
+    payloads = asyncio.run(scenario())
+    assert [line.text for p in payloads for line in payload_lines(p)] == ["aio"], payloads
+    assert any(p.get("to") == "succeeded" for p in payloads)
+
+
+def test_aio_followers_do_not_starve_unary_rpcs() -> None:
+    followers = 32
+
+    async def scenario() -> list[list[int]]:
+        inner = InMemoryDomedService()
+        inner.scheduler.close(wait=True)
+        inner.scheduler = JobScheduler(lambda _item: None, max_workers=1)
+        server, port, service = await start_async_server(
+            service=AsyncDomedService(inner, stream_buffer_size=2)
+        )
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = domed_pb2_grpc.DomedServiceStub(channel)
+                submit = await stub.SkillExecute(_submit("job.noop", "idem-aio-2", {}))
+
+                async def follow() -> list[int]:
+                    req = domed_pb2.StreamJobEventsRequest(job_id=submit.job_id, follow=True)
+                    return [e.seq async for e in stub.StreamJobEvents(req)]
+
+                tasks = [asyncio.create_task(follow()) for _ in range(followers)]
+                await asyncio.sleep(0.2)
+                health = await asyncio.wait_for(stub.Health(domed_pb2.HealthRequest()), timeout=2.0)
+                assert health.status.ok is True
+                for idx in range(5):
+                    inner.store.append_event(job_id=submit.job_id, event_type="log", payload={"line": str(idx)})
+                inner.store.transition(job_id=submit.job_id, to_state="succeeded")
+                return await asyncio.wait_for(asyncio.gather(*tasks), timeout=5.0)
+        finally:
+            await server.stop(grace=0)
+            service.close()
+
+    results = asyncio.run(scenario())
+    assert len(results) == followers
+    assert all(seqs == [1, 2, 3, 4, 5, 6] for seqs in results)
+
+
+def test_aio_server_serves_get_metrics() -> None:
+    async def scenario() -> object:
+        server, port, service = await start_async_server()
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = domed_pb2_grpc.DomedServiceStub(channel)
+                await stub.Health(domed_pb2.HealthRequest())
+                return await stub.GetMetrics(domed_pb2.GetMetricsRequest(include_prometheus_text=True))
+        finally:
+            await server.stop(grace=0)
+            service.close()
+
+    response = asyncio.run(scenario())
+    assert response.status.ok is True
+    assert 'domed_rpc_total{method="Health",outcome="ok"} 1' in response.prometheus_text
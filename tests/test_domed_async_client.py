@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+grpc = pytest.importorskip("grpc")
+pytest.importorskip("google.protobuf")
+
+from tools.codex.domed_async_client import AsyncDomedClient, gather_limited
+from tools.codex.domed_client import DomedClient, DomedClientConfig
+from tools.domed.service import domed_pb2, start_insecure_server
+
+
+def _public_methods(cls: type) -> set[str]:
+    return {name for name, _ in inspect.getmembers(cls, inspect.isfunction) if not name.startswith("_")}
+
+
+def test_async_client_mirrors_sync_client() -> None:
+    assert _public_methods(DomedClient) <= _public_methods(AsyncDomedClient)
+
+
+def test_gather_limited_bounds_concurrency_and_keeps_order() -> None:
+    active = {"now": 0, "peak": 0}
+
+    async def work(n: int) -> int:
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.001)
+        active["now"] -= 1
+        return n
+
+    out = asyncio.run(gather_limited([lambda n=n: work(n) for n in range(20)], 3))
+    assert out == list(range(20))
+    assert active["peak"] == 3
+
+
+def test_execute_many_drives_jobs_to_terminal_from_one_loop() -> None:
+    server, port, _service = start_insecure_server()
+
+    async def scenario() -> tuple[list, object]:
+        async with AsyncDomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}")) as client:
+            items = [
+                {
+                    "skill_id": "job.noop",
+                    "profile": "work",
+                    "idempotency_key": f"idem-async-{n}",
+                    "task": {"n": n},
+                }
+                for n in range(60)
+            ]
+            outcomes = await client.execute_many(items, concurrency=16)
+            missing = await client.get_tool("does-not-exist")
+            return outcomes, missing
+
+    try:
+        outcomes, missing = asyncio.run(scenario())
+    finally:
+        server.stop(grace=0).wait()
+    assert len({o.job_id for o in outcomes}) == 60
+    assert {o.state for o in outcomes} == {domed_pb2.JOB_STATE_SUCCEEDED}
+    assert all(o.ok and o.events >= 3 for o in outcomes)
+    assert missing.status.ok is False
+
+
+def test_execute_and_wait_reports_rejected_submit() -> None:
+    server, port, _service = start_insecure_server()
+
+    async def scenario() -> object:
+        async with AsyncDomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}")) as client:
+            return await client.execute_and_wait(
+                skill_id="no.such.tool",
+                profile="work",
+                idempotency_key="idem-async-bad",
+                task={},
+            )
+
+    try:
+        outcome = asyncio.run(scenario())
+    finally:
+        server.stop(grace=0).wait()
+    assert outcome.ok is False
+    assert outcome.status_message
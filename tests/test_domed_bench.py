@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+grpc = pytest.importorskip("grpc")
+pytest.importorskip("google.protobuf")
+
+from tools.domed import bench
+
+
+def test_percentiles_are_nearest_rank_in_ms() -> None:
+    out = bench.percentiles([n / 1000.0 for n in range(1, 101)])
+    assert out == {"p50": 50.0, "p95": 95.0, "p99": 99.0, "max": 100.0}
+    assert bench.percentiles([]) == {"p50": None, "p95": None, "p99": None, "max": None}
+
+
+def test_parse_mix_rejects_empty_weights() -> None:
+    assert bench.parse_mix("job.noop=3, job.log") == [("job.noop", 3), ("job.log", 1)]
+    with pytest.raises(ValueError):
+        bench.parse_mix("job.noop=0")
+
+
+def test_run_store_smoke_against_real_daemon() -> None:
+    args = argparse.Namespace(
+        server_mode="thread",
+        jobs=12,
+        clients=2,
+        concurrency=3,
+        mix="job.noop=1,job.log=1",
+        log_lines=5,
+        poll_fraction=0.5,
+        poll_interval_ms=2.0,
+        extra_followers=1,
+        seed=7,
+        daemon_arg=[],
+    )
+    result = bench.run_store("memory", args)
+    assert result["finished"] == 12 and result["rejected"] == 0
+    assert result["states"] == {"JOB_STATE_SUCCEEDED": 12}
+    assert result["events_received"] > 0
+    assert result["latency_ms"]["end_to_end"]["p50"] is not None
+    assert result["daemon"]["rpc_total"] >= 12
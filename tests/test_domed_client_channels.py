@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+grpc = pytest.importorskip("grpc")
+pytest.importorskip("google.protobuf")
+
+from tools.codex.domed_client import DomedClient, DomedClientConfig, close_shared_channels, retry_service_config
+from tools.domed.service import start_insecure_server
+
+
+def test_retry_service_config_retries_unavailable_only() -> None:
+    config = json.loads(retry_service_config(3, 0.05))
+    policy = config["methodConfig"][0]["retryPolicy"]
+    assert policy["maxAttempts"] == 3
+    assert policy["retryableStatusCodes"] == ["UNAVAILABLE"]
+    assert policy["initialBackoff"] == "0.050s"
+    assert "retryPolicy" not in json.loads(retry_service_config(1, 0.05))["methodConfig"][0]
+
+
+def test_clients_share_one_channel_per_endpoint() -> None:
+    server, port, _service = start_insecure_server()
+    endpoint = f"127.0.0.1:{port}"
+    try:
+        first = DomedClient(DomedClientConfig(endpoint=endpoint))
+        with DomedClient(DomedClientConfig(endpoint=endpoint)) as second:
+            assert second._channel is first._channel
+            assert second.health().status.ok is True
+        # Leaving the block must not close the shared channel under other clients.
+        assert first.health().status.ok is True
+
+        owned = DomedClient(DomedClientConfig(endpoint=endpoint, shared_channel=False))
+        assert owned._channel is not first._channel
+        owned.close()
+        with pytest.raises(ValueError):
+            owned.health()
+
+        close_shared_channels()
+        assert DomedClient(DomedClientConfig(endpoint=endpoint))._channel is not first._channel
+    finally:
+        close_shared_channels()
+        server.stop(grace=0).wait()
+
+
+def test_unreachable_endpoint_fails_after_grpc_retries() -> None:
+    client = DomedClient(DomedClientConfig(endpoint="127.0.0.1:9", max_attempts=3, initial_backoff_seconds=0.01))
+    with pytest.raises(grpc.RpcError) as exc_info:
+        client.health()
+    assert exc_info.value.code() == grpc.StatusCode.UNAVAILABLE
+
+
+class _UnavailableFirst(grpc.ServerInterceptor):
+    """Fail the first ``failures`` Health calls with UNAVAILABLE, counting every attempt."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.attempts = 0
+
+    def intercept_service(self, continuation, handler_call_details):  # type: ignore[no-untyped-def]
+        if not handler_call_details.method.endswith("/Health"):
+            return continuation(handler_call_details)
+        self.attempts += 1
+        if self.attempts > self.failures:
+            return continuation(handler_call_details)
+
+        def _abort(request, context):  # type: ignore[no-untyped-def]
+            context.abort(grpc.StatusCode.UNAVAILABLE, "warming up")
+
+        return grpc.unary_unary_rpc_method_handler(_abort)
+
+
+def test_unavailable_is_retried_by_the_channel_until_it_succeeds() -> None:
+    flaky = _UnavailableFirst(failures=2)
+    server, port, _service = start_insecure_server(interceptors=[flaky])
+    try:
+        cfg = DomedClientConfig(
+            endpoint=f"127.0.0.1:{port}",
+            max_attempts=3,
+            initial_backoff_seconds=0.01,
+            shared_channel=False,
+        )
+        with DomedClient(cfg) as client:
+            assert client.health().status.ok is True
+        assert flaky.attempts == 3
+
+        flaky.attempts = 0
+        with DomedClient(DomedClientConfig(endpoint=cfg.endpoint, max_attempts=2, shared_channel=False)) as client:
+            with pytest.raises(grpc.RpcError) as exc_info:
+                client.health()
+        assert exc_info.value.code() == grpc.StatusCode.UNAVAILABLE
+        assert flaky.attempts == 2
+    finally:
+        server.stop(grace=0).wait()
@@ -26,6 +26,8 @@ class _FakePB2:
     GetJobStatusRequest = _Req
     CancelJobRequest = _Req
     StreamJobEventsRequest = _Req
+    SkillExecuteBatchRequest = _Req
+    GetJobStatusBatchRequest = _Req
 
 
 class _FakeStub:
@@ -66,6 +68,14 @@ class _FakeStub:
         self.calls.append(("CancelJob", req))
         return SimpleNamespace(status=SimpleNamespace(ok=True))
 
+    def SkillExecuteBatch(self, req: object) -> object:
+        self.calls.append(("SkillExecuteBatch", req))
+        return SimpleNamespace(status=SimpleNamespace(ok=True), responses=list(getattr(req, "requests")))
+
+    def GetJobStatusBatch(self, req: object) -> object:
+        self.calls.append(("GetJobStatusBatch", req))
+        return SimpleNamespace(status=SimpleNamespace(ok=True), responses=list(getattr(req, "job_ids")))
+
     def StreamJobEvents(self, req: object) -> object:
         self.calls.append(("StreamJobEvents", req))
         return iter([SimpleNamespace(seq=1), SimpleNamespace(seq=2)])
@@ -125,3 +135,18 @@ def test_stub_matrix_stream_resume_cursor() -> None:
     name, req = stub.calls[-1]
     assert name == "StreamJobEvents"
     assert getattr(req, "since_seq") == 1
+
+
+def test_stub_matrix_batch_helpers() -> None:
+    c, stub = _client_with_fake_stub()
+    out = c.skill_execute_batch(
+        [
+            {"skill_id": "job.noop", "profile": "work", "idempotency_key": "a", "task": {"x": 1}},
+            {"skill_id": "job.noop", "profile": "work", "idempotency_key": "b", "task": {}},
+        ]
+    )
+    statuses = c.get_job_status_batch(["job-1", "job-2"])
+    assert len(out.responses) == 2
+    assert getattr(out.responses[0], "task_json") == '{"x": 1}'
+    assert statuses.responses == ["job-1", "job-2"]
+    assert [name for name, _ in stub.calls] == ["SkillExecuteBatch", "GetJobStatusBatch"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+import signal
+import subprocess
+import sys
+from time import monotonic, sleep
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+pytest.importorskip("grpc")
+pytest.importorskip("google.protobuf")
+
+
+def test_startup_profile_reports_phases(tmp_path: Path) -> None:
+    log_path = tmp_path / "domed.log"
+    with log_path.open("wb") as log:
+        proc = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "tools.domed.daemon",
+                "--store",
+                "memory",
+                "--bind",
+                f"unix://{tmp_path}/domed.sock",
+                "--db-path",
+                str(tmp_path / "state.db"),
+                "--registry-snapshot",
+                str(tmp_path / "missing-snapshot.json"),
+                "--startup-profile",
+            ],
+            cwd=ROOT,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    try:
+        deadline = monotonic() + 30.0
+        while monotonic() < deadline and proc.poll() is None:
+            if "domed startup warm" in log_path.read_text(encoding="utf-8", errors="replace"):
+                break
+            sleep(0.05)
+    finally:
+        proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(timeout=10.0)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()
+    phases = {
+        line.split("phase=", 1)[1].split()[0]
+        for line in lines
+        if line.startswith("domed startup phase=") and " ms=" in line
+    }
+    assert {"import_grpc", "import_service", "import_store_memory", "init_service", "start_server"} <= phases
+    assert {"warm_executors", "import_opentelemetry"} <= phases
+    ready = [line for line in lines if line.startswith("domed startup ready ")]
+    assert len(ready) == 1 and "since_daemon_import_ms=" in ready[0]
+    assert any(line.startswith("domed listening ") for line in lines)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+grpc = pytest.importorskip("grpc")
+pytest.importorskip("google.protobuf")
+
+from tools.codex.domed_client import DomedClient, DomedClientConfig
+from tools.domed import service as domed_service
+from tools.domed.tool_registry import ToolRegistry
+
+
+def _rpc_count(service: domed_service.InMemoryDomedService, method: str) -> int:
+    counters = service.metrics.snapshot().counters
+    return int(sum(v for (name, lbls), v in counters.items() if name == "domed_rpc_total" and ("method", method) in lbls))
+
+
+def test_registry_version_and_if_none_match() -> None:
+    service = domed_service.InMemoryDomedService()
+    pb2 = domed_service.domed_pb2
+    try:
+        tools = service.ListTools(pb2.ListToolsRequest(), None)
+        assert len(tools.registry_version) == 64
+        assert tools.not_modified is False and tools.tools
+
+        same = service.ListTools(pb2.ListToolsRequest(if_none_match=tools.registry_version), None)
+        assert same.not_modified is True
+        assert same.status.ok is True and not same.tools
+
+        stale = service.ListTools(pb2.ListToolsRequest(if_none_match="old"), None)
+        assert stale.not_modified is False and stale.tools
+
+        caps = service.ListCapabilities(pb2.ListCapabilitiesRequest(profile="work"), None)
+        assert caps.registry_version == tools.registry_version
+        caps_same = service.ListCapabilities(
+            pb2.ListCapabilitiesRequest(profile="work", if_none_match=caps.registry_version), None
+        )
+        assert caps_same.not_modified is True and not caps_same.capabilities
+    finally:
+        service.close()
+
+
+def test_client_descriptor_cache_revalidates_and_honours_ttl(tmp_path: Path) -> None:
+    tools = [domed_service._normalize_tool_item({"tool_id": "job.noop", "executor_backend": "inmemory"})]  # noqa: SLF001
+    registry = ToolRegistry(lambda: list(tools), tools_root=ROOT / "missing", fallback_registry=ROOT / "missing")
+    server, port, service = domed_service.start_insecure_server(
+        service=domed_service.InMemoryDomedService(registry=registry)
+    )
+    endpoint = f"127.0.0.1:{port}"
+
+    def client(ttl: float) -> DomedClient:
+        return DomedClient(
+            DomedClientConfig(endpoint=endpoint, descriptor_cache_dir=tmp_path, descriptor_cache_ttl_seconds=ttl)
+        )
+
+    try:
+        first = client(0.0).get_tool("job.noop")
+        assert first.status.ok is True
+        assert _rpc_count(service, "GetTool") == 1
+
+        # Past the TTL: one ListTools(if_none_match) probe, no GetTool.
+        again = client(0.0).get_tool("job.noop")
+        assert again.tool.tool_id == "job.noop"
+        assert (_rpc_count(service, "GetTool"), _rpc_count(service, "ListTools")) == (1, 1)
+
+        # Within the TTL: no RPC at all.
+        listed = client(60.0).list_tools()
+        assert [t.tool_id for t in listed.tools] == ["job.noop"]
+        assert _rpc_count(service, "ListTools") == 2
+        cached = client(60.0).get_tool("job.noop")
+        assert cached.tool.executor_backend == "inmemory"
+        assert client(60.0).list_tools().registry_version == listed.registry_version
+        assert (_rpc_count(service, "GetTool"), _rpc_count(service, "ListTools")) == (1, 2)
+
+        # Misses are never cached.
+        assert client(60.0).get_tool("missing.tool").status.ok is False
+        assert _rpc_count(service, "GetTool") == 2
+
+        # A manifest change invalidates every cached descriptor.
+        tools.append(domed_service._normalize_tool_item({"tool_id": "job.log", "executor_backend": "inmemory"}))  # noqa: SLF001
+        registry.reload()
+        refreshed = client(0.0).list_tools()
+        assert {t.tool_id for t in refreshed.tools} == {"job.noop", "job.log"}
+        assert refreshed.registry_version != listed.registry_version
+        client(0.0).get_tool("job.noop")
+        assert _rpc_count(service, "GetTool") == 3
+    finally:
+        server.stop(grace=0).wait()
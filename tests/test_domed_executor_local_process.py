@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 from pathlib import Path
+import signal
+import subprocess
 import sys
+from threading import Thread
+from time import monotonic, sleep
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from tools.domed.executor import ExecutionRequest
-from tools.domed.executors.local_process import LocalProcessExecutor
+from tools.domed.executor import CancelToken, ExecutionRequest
+from tools.domed.executors import local_process
+from tools.domed.executors.local_process import CancelGuard, LocalProcessExecutor
+from tools.domed.log_payload import payload_lines
+
+
+def _texts(payload: dict) -> list[str]:
+    return [line.text for line in payload_lines(payload)]
 
 
 def test_local_process_executor_success_and_logs() -> None:
@@ -28,9 +40,10 @@ def test_local_process_executor_success_and_logs() -> None:
     assert result.terminal_state == "succeeded"
     assert result.exit_code == 0
     payloads = [evt.payload for evt in events]
-    assert any(p.get("line") == "ok-a" and p.get("stream") == "stdout" for p in payloads)
-    assert any(p.get("line") == "warn-b" and p.get("stream") == "stderr" for p in payloads)
-    assert any("value" in p for p in payloads)
+    stdout = [line for p in payloads if p.get("stream") == "stdout" for line in payload_lines(p)]
+    assert [(line.line_no, line.text) for line in stdout] == [(0, "ok-a"), (1, "PROGRESS:0.1"), (2, "PROGRESS:0.9")]
+    assert {"stream": "stderr", "lines": ["warn-b"], "first_line": 0, "last_line": 0} in payloads
+    assert [p["value"] for p in payloads if "value" in p] == [0.1, 0.9]
 
 
 def test_local_process_executor_failure_exit_code() -> None:
@@ -48,3 +61,132 @@ def test_local_process_executor_failure_exit_code() -> None:
     result = exe.execute(req, lambda _evt: None)
     assert result.terminal_state == "failed"
     assert result.exit_code == 3
+
+
+def _py_request(job_id: str, code: str, *, timeout_seconds: int = 30) -> ExecutionRequest:
+    return ExecutionRequest(
+        run_id=f"run-{job_id}",
+        job_id=job_id,
+        tool_id="inline.python",
+        profile="work",
+        task={},
+        constraints={},
+        entrypoint=[sys.executable, "-c", code],
+        cwd=ROOT,
+        timeout_seconds=timeout_seconds,
+    )
+
+
+def test_local_process_executor_streams_lines_before_exit() -> None:
+    exe = LocalProcessExecutor()
+    seen: list[tuple[float, dict]] = []
+    code = "import sys, time\nprint('early', flush=True)\ntime.sleep(0.5)\nprint('late', flush=True)\n"
+    started = monotonic()
+    result = exe.execute(_py_request("job-stream", code), lambda evt: seen.append((monotonic(), evt.payload)))
+    finished = monotonic()
+    assert result.terminal_state == "succeeded"
+    early_at = next(ts for ts, p in seen if _texts(p) == ["early"])
+    assert early_at - started < finished - started - 0.3
+
+
+def test_local_process_executor_timeout_keeps_partial_output() -> None:
+    exe = LocalProcessExecutor()
+    events = []
+    code = "import time\nprint('partial', flush=True)\ntime.sleep(30)\n"
+    result = exe.execute(_py_request("job-timeout", code, timeout_seconds=1), lambda evt: events.append(evt))
+    assert result.exit_code == 124
+    payloads = [evt.payload for evt in events]
+    assert any(_texts(p) == ["partial"] for p in payloads)
+    assert events[-1].kind == "error"
+
+
+def test_local_process_executor_caps_stream_bytes() -> None:
+    exe = LocalProcessExecutor(max_line_bytes=64, max_stream_bytes=1024)
+    events = []
+    code = "import sys\nfor _ in range(2000):\n    sys.stdout.write('x' * 200 + '\\n')\n"
+    result = exe.execute(_py_request("job-cap", code), lambda evt: events.append(evt))
+    assert result.terminal_state == "succeeded"
+    lines = [text for evt in events for text in _texts(evt.payload)]
+    assert all(len(line) <= 64 for line in lines)
+    assert sum(len(line) for line in lines) <= 1024
+    assert sum(1 for evt in events if evt.payload.get("truncated")) == 1
+
+
+def test_local_process_executor_cancel_kills_process_group() -> None:
+    exe = LocalProcessExecutor(cancel_grace_seconds=0.2)
+    token = CancelToken()
+    req = ExecutionRequest(
+        run_id="run-c",
+        job_id="job-c",
+        tool_id="sleeper",
+        profile="work",
+        task={},
+        constraints={},
+        # The shell ignores SIGTERM, so only the group SIGKILL after the grace period stops it;
+        # the background sleep shares its process group.
+        entrypoint=["bash", "-c", "trap '' TERM; sleep 30 & echo started; wait"],
+        cwd=ROOT,
+        timeout_seconds=30,
+        cancel_token=token,
+    )
+    events = []
+
+    def sink(evt) -> None:  # type: ignore[no-untyped-def]
+        events.append(evt)
+        if "started" in _texts(evt.payload):
+            token.cancel()
+
+    started = monotonic()
+    result = exe.execute(req, sink)
+    assert monotonic() - started < 1.5
+    assert result.terminal_state == "canceled"
+
+
+def test_cancel_never_signals_a_reaped_process_group(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[int] = []
+    monkeypatch.setattr(local_process, "signal_process_group", lambda _proc, sig: sent.append(sig))
+    proc = subprocess.Popen(["true"], start_new_session=True)
+    guard = CancelGuard(proc, 0.01)
+    racer = Thread(target=guard.cancel)
+    poll = proc.poll
+
+    def _poll_then_race() -> int | None:
+        # A cancel arriving right after the reap must wait for the guard to be released.
+        returncode = poll()
+        if returncode is not None and not racer.is_alive():
+            racer.start()
+            racer.join(0.05)
+            assert racer.is_alive()
+        return returncode
+
+    monkeypatch.setattr(proc, "poll", _poll_then_race)
+    assert guard.wait(timeout=5.0) == 0
+    racer.join()
+    assert sent == []
+    assert guard.release() is False
+
+
+def test_cancel_guard_timer_skips_sigkill_once_reaped(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[int] = []
+    monkeypatch.setattr(local_process, "signal_process_group", lambda _proc, sig: sent.append(sig))
+    proc = subprocess.Popen(["sleep", "0.1"], start_new_session=True)
+    guard = CancelGuard(proc, 0.3)
+    guard.cancel()
+    assert guard.wait(timeout=5.0) == 0
+    sleep(0.4)
+    assert sent == [signal.SIGTERM]
+
+
+def test_local_process_executor_coalesces_lines_into_chunks() -> None:
+    exe = LocalProcessExecutor(log_chunk_lines=100, log_flush_seconds=5.0)
+    events = []
+    code = "import sys\nfor n in range(250):\n    print(f'line {n}')\nprint('err', file=sys.stderr)\n"
+    result = exe.execute(_py_request("job-chunks", code), lambda evt: events.append(evt))
+    assert result.terminal_state == "succeeded"
+    stdout = [evt.payload for evt in events if evt.payload.get("stream") == "stdout"]
+    assert [(p["first_line"], p["last_line"]) for p in stdout] == [(0, 99), (100, 199), (200, 249)]
+    assert [line.text for p in stdout for line in payload_lines(p)] == [f"line {n}" for n in range(250)]
+    assert [line.line_no for line in payload_lines(stdout[1])][:2] == [100, 101]
+    assert [p for p in (evt.payload for evt in events) if p.get("stream") == "stderr"] == [
+        {"stream": "stderr", "lines": ["err"], "first_line": 0, "last_line": 0}
+    ]
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from time import monotonic
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.domed.executor import ExecutionRequest
+from tools.domed.executors.local_process import LocalProcessExecutor
+from tools.domed.executors.python_pool import PythonPoolExecutor, python_module_from_entrypoint
+from tools.domed.log_payload import payload_lines
+
+_PROBE = ["python3", "-m", "tools.domed.executor_probe"]
+
+
+def _request(job_id: str, task: dict, *, entrypoint: list[str] | None = None, timeout: int = 30) -> ExecutionRequest:
+    return ExecutionRequest(
+        run_id=f"run-{job_id}",
+        job_id=job_id,
+        tool_id="domed.pool-probe",
+        profile="work",
+        task=task,
+        constraints={},
+        entrypoint=entrypoint or _PROBE,
+        cwd=ROOT,
+        timeout_seconds=timeout,
+    )
+
+
+def test_python_module_from_entrypoint() -> None:
+    assert python_module_from_entrypoint(_PROBE) == "tools.domed.executor_probe"
+    assert python_module_from_entrypoint(["bash", "-c", "true"]) is None
+    assert python_module_from_entrypoint(["python3", "script.py"]) is None
+
+
+def test_python_pool_reuses_warm_worker_and_streams_output() -> None:
+    exe = PythonPoolExecutor(max_idle_per_module=1)
+    try:
+        exe.warm("tools.domed.executor_probe", str(ROOT))
+        assert exe.idle_count("tools.domed.executor_probe", str(ROOT)) == 1
+        events = []
+        started = monotonic()
+        result = exe.execute(
+            _request("j1", {"stdout": ["ok-a"], "stderr": ["warn-b"], "progress": [0.5], "exit_code": 0}),
+            events.append,
+        )
+        assert monotonic() - started < 1.0
+        assert result.terminal_state == "succeeded"
+        payloads = [evt.payload for evt in events]
+        lines = [(line.stream, line.line_no, line.text) for p in payloads for line in payload_lines(p)]
+        assert ("stdout", 0, "ok-a") in lines
+        assert ("stderr", 0, "warn-b") in lines
+        assert {"value": 0.5} in payloads
+
+        failed = exe.execute(_request("j2", {"stdout": ["x"], "exit_code": 3}), lambda _evt: None)
+        assert (failed.terminal_state, failed.exit_code) == ("failed", 3)
+        assert exe.idle_count("tools.domed.executor_probe", str(ROOT)) == 1
+    finally:
+        exe.close()
+
+
+def test_python_pool_recycles_worker_after_max_jobs() -> None:
+    exe = PythonPoolExecutor(max_jobs_per_worker=1)
+    try:
+        result = exe.execute(_request("j1", {"exit_code": 0}), lambda _evt: None)
+        assert result.terminal_state == "succeeded"
+        assert exe.idle_count("tools.domed.executor_probe", str(ROOT)) == 0
+    finally:
+        exe.close()
+
+
+def test_python_pool_rejects_non_module_entrypoint() -> None:
+    exe = PythonPoolExecutor()
+    result = exe.execute(_request("j1", {}, entrypoint=["bash", "-c", "true"]), lambda _evt: None)
+    assert (result.terminal_state, result.exit_code) == ("failed", 127)
+
+
+def test_python_pool_gives_tools_their_own_argv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "argtool.py").write_text(
+        "import argparse\n"
+        "import os\n"
+        "import sys\n"
+        "\n"
+        "def main():\n"
+        "    parser = argparse.ArgumentParser()\n"
+        "    parser.add_argument('--count', type=int, default=1)\n"
+        "    args = parser.parse_args()\n"
+        "    print(f'count={args.count} argv0={os.path.basename(sys.argv[0])} argc={len(sys.argv)}')\n"
+        "    return 0\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("PYTHONPATH", str(ROOT))
+    exe = PythonPoolExecutor()
+    try:
+        request = _request("j1", {}, entrypoint=["python3", "-m", "argtool"])
+        request.cwd = tmp_path
+        events = []
+        result = exe.execute(request, events.append)
+        assert result.terminal_state == "succeeded"
+        lines = [line.text for evt in events for line in payload_lines(evt.payload)]
+        assert lines == ["count=1 argv0=argtool.py argc=1"]
+    finally:
+        exe.close()
+
+
+def test_python_pool_tool_reading_stdin_matches_local_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "stdintool.py").write_text(
+        "import sys\n"
+        "\n"
+        "def main():\n"
+        "    print(f'stdin={sys.stdin.read()!r}')\n"
+        "    return 0\n"
+        "\n"
+        "if __name__ == '__main__':\n"
+        "    raise SystemExit(main())\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("PYTHONPATH", str(ROOT))
+    entrypoint = [sys.executable, "-m", "stdintool"]
+    pool = PythonPoolExecutor()
+    try:
+        outcomes = []
+        for exe in (LocalProcessExecutor(), pool, pool):
+            request = _request("j1", {}, entrypoint=entrypoint, timeout=5)
+            request.cwd = tmp_path
+            events = []
+            result = exe.execute(request, events.append)
+            lines = [line.text for evt in events for line in payload_lines(evt.payload)]
+            outcomes.append((result.terminal_state, result.exit_code, lines))
+        assert outcomes == [("succeeded", 0, ["stdin=''"])] * 3
+    finally:
+        pool.close()
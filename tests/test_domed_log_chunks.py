@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+import subprocess
+import sys
+from time import sleep
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.domed.executor import ExecutionEvent
+from tools.domed.log_chunks import LogChunker
+from tools.domed.log_payload import chunk_lines, payload_lines
+
+
+def test_chunker_flushes_by_lines_bytes_and_keeps_order() -> None:
+    out: list[ExecutionEvent] = []
+    chunker = LogChunker(out.append, max_lines=3, max_bytes=10, max_delay_seconds=60.0)
+    for text in ("a", "b", "c", "d"):
+        chunker.line("stdout", text)
+    assert [evt.payload["lines"] for evt in out] == [["a", "b", "c"]]
+
+    chunker.line("stdout", "0123456789")  # crosses max_bytes with "d"
+    assert out[-1].payload == {"stream": "stdout", "lines": ["d", "0123456789"], "first_line": 3, "last_line": 4}
+
+    chunker.line("stderr", "e")
+    chunker.line("stdout", "f")
+    chunker.event(ExecutionEvent(kind="progress", payload={"value": 0.5}))
+    assert [evt.payload for evt in out[2:]] == [
+        {"stream": "stderr", "lines": ["e"], "first_line": 0, "last_line": 0},
+        {"stream": "stdout", "lines": ["f"], "first_line": 5, "last_line": 5},
+        {"value": 0.5},
+    ]
+
+
+def test_chunker_flush_due_honours_delay() -> None:
+    out: list[ExecutionEvent] = []
+    chunker = LogChunker(out.append, max_delay_seconds=0.02)
+    chunker.line("stdout", "x")
+    assert chunker.deadline(float("inf")) < float("inf")
+    chunker.flush_due()
+    assert out == []
+    sleep(0.03)
+    chunker.flush_due()
+    assert [evt.payload["lines"] for evt in out] == [["x"]]
+    assert chunker.deadline(123.0) == 123.0
+
+
+def test_payload_lines_reads_chunks_and_legacy_lines() -> None:
+    chunk = chunk_lines("stdout", ["a", "b", "c"], max_lines=2)
+    assert [(c["first_line"], c["last_line"]) for c in chunk] == [(0, 1), (2, 2)]
+    assert [(ln.line_no, ln.text, ln.seq) for ln in payload_lines(chunk[1], seq=7)] == [(2, "c", 7)]
+    assert [(ln.line_no, ln.text) for ln in payload_lines({"line": "old"})] == [(None, "old")]
+    assert payload_lines({"value": 0.5}) == []
+
+
+def test_thin_client_does_not_import_daemon_internals() -> None:
+    code = (
+        "import sys\n"
+        "import tools.codex.domed_client, tools.codex.domed_async_client\n"
+        "leaked = sorted(m for m in sys.modules if m.startswith(('tools.domed.executor', 'tools.domed.log_chunks')))\n"
+        "print(','.join(leaked))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
+
+
+def test_job_log_is_one_event_and_client_resumes_mid_chunk() -> None:
+    pytest.importorskip("grpc")
+    pytest.importorskip("google.protobuf")
+    from tools.codex.domed_client import DomedClient, DomedClientConfig, iter_log_lines
+    from tools.domed.service import start_insecure_server
+
+    server, port, _service = start_insecure_server()
+    client = DomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}", shared_channel=False))
+    try:
+        submit = client.skill_execute(
+            skill_id="job.log",
+            profile="work",
+            idempotency_key="idem-log-chunks",
+            task={"lines": [f"l{n}" for n in range(50)]},
+        )
+        events = list(client.stream_job_events(job_id=submit.job_id, follow=True))
+        lines = list(iter_log_lines(events))
+        assert [ln.text for ln in lines] == [f"l{n}" for n in range(50)]
+        assert len({ln.seq for ln in lines}) == 1
+
+        seq = lines[0].seq
+        resumed = client.stream_job_events(job_id=submit.job_id, since_seq=seq - 1)
+        tail = list(iter_log_lines(resumed, after={"stdout": 41}))
+        assert [ln.text for ln in tail] == [f"l{n}" for n in range(42, 50)]
+    finally:
+        client.close()
+        server.stop(grace=0).wait()
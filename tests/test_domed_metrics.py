@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from threading import Thread
+from time import monotonic, sleep
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.domed.metrics import MetricsRegistry, TimedLock, labels
+from tools.domed.runtime_state import JobRecord, RuntimeStateStore
+
+
+def test_metrics_registry_snapshot_and_prometheus_text() -> None:
+    metrics = MetricsRegistry()
+    metrics.describe("demo_total", "Demo counter.")
+    metrics.inc("demo_total", 2, labels(kind="a"))
+    metrics.inc("demo_total", 1, labels(kind="a"))
+    metrics.observe("demo_seconds", 0.003, buckets=(0.001, 0.01))
+    metrics.observe("demo_seconds", 5.0, buckets=(0.001, 0.01))
+    metrics.gauge("demo_depth", lambda: 7)
+    metrics.gauge("demo_by_tool", lambda: {labels(tool="x"): 1, labels(tool="y"): 2})
+
+    snap = metrics.snapshot()
+    assert snap.counters[("demo_total", (("kind", "a"),))] == 3
+    assert snap.gauges[("demo_depth", ())] == 7
+    assert snap.gauges[("demo_by_tool", (("tool", "y"),))] == 2
+    hist = snap.histograms[("demo_seconds", ())]
+    assert (hist.counts, hist.count) == ([0, 1, 1], 2)
+
+    text = metrics.render_prometheus()
+    assert "# HELP demo_total Demo counter.\n# TYPE demo_total counter\n" in text
+    assert 'demo_total{kind="a"} 3\n' in text
+    assert "demo_depth 7\n" in text
+    assert 'demo_seconds_bucket{le="0.001"} 0\n' in text
+    assert 'demo_seconds_bucket{le="0.01"} 1\n' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 2\n' in text
+    assert "demo_seconds_count 2\n" in text
+
+
+def test_timed_lock_records_contended_wait() -> None:
+    metrics = MetricsRegistry()
+    lock = TimedLock(metrics, "wait_seconds")
+
+    def _hold() -> None:
+        with lock:
+            sleep(0.05)
+
+    holder = Thread(target=_hold)
+    holder.start()
+    sleep(0.01)
+    with lock:
+        pass
+    holder.join()
+    hist = metrics.snapshot().histograms[("wait_seconds", ())]
+    assert hist.count == 2
+    assert hist.total >= 0.02
+
+
+def test_timed_lock_does_not_take_the_registry_lock() -> None:
+    metrics = MetricsRegistry()
+    lock = TimedLock(metrics, "wait_seconds")
+    entered = []
+
+    def _use() -> None:
+        with lock:
+            entered.append(True)
+
+    with metrics._lock:  # noqa: SLF001
+        user = Thread(target=_use)
+        user.start()
+        user.join(timeout=1.0)
+        assert entered == [True]
+    assert metrics.snapshot().histograms[("wait_seconds", ())].count == 1
+
+
+def test_counter_callbacks_render_as_counters() -> None:
+    metrics = MetricsRegistry()
+    hits = [3]
+    metrics.counter("demo_hits_total", lambda: hits[0])
+    metrics.counter("demo_by_kind_total", lambda: {labels(kind="a"): 1})
+    hits[0] += 1
+    snap = metrics.snapshot()
+    assert snap.counters[("demo_hits_total", ())] == 4
+    assert snap.counters[("demo_by_kind_total", (("kind", "a"),))] == 1
+    assert "# TYPE demo_hits_total counter\ndemo_hits_total 4\n" in metrics.render_prometheus()
+
+
+def test_memory_store_counts_appended_events() -> None:
+    store = RuntimeStateStore()
+    job = JobRecord(
+        job_id="j1",
+        run_id="run-j1",
+        state="queued",
+        skill_id="job.noop",
+        profile="work",
+        idempotency_key="k1",
+        request_hash="h1",
+    )
+    store.submit(job=job, client_id="c1")
+    store.append_events(job_id="j1", events=[("log", {"n": 1}), ("log", {"n": 2})])
+    snap = store.metrics.snapshot()
+    assert snap.counters[("domed_store_events_appended_total", (("store", "memory"),))] == 2
+    assert snap.histograms[("domed_store_lock_wait_seconds", (("store", "memory"),))].count >= 2
+
+
+def test_get_metrics_rpc_reports_service_and_store_metrics() -> None:
+    pytest.importorskip("grpc")
+    pytest.importorskip("google.protobuf")
+    from tools.codex.domed_client import DomedClient, DomedClientConfig
+    from tools.domed.service import start_insecure_server
+
+    server, port, service = start_insecure_server()
+    client = DomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}"))
+    try:
+        submit = client.skill_execute(skill_id="job.noop", profile="work", idempotency_key="idem-m1", task={})
+        list(client.stream_job_events(job_id=submit.job_id, follow=True))
+        client.get_tool("does-not-exist")
+
+        finished = ("domed_jobs_finished_total", (("state", "succeeded"), ("tool", "job.noop")))
+        deadline = monotonic() + 5.0
+        while True:
+            response = client.get_metrics(include_prometheus_text=True)
+            counters = {(c.name, tuple((lbl.name, lbl.value) for lbl in c.labels)): c.value for c in response.counters}
+            if finished in counters or monotonic() > deadline:
+                break
+            sleep(0.01)
+        assert response.status.ok is True
+        assert response.uptime_seconds > 0
+        assert counters[finished] == 1
+        assert counters[("domed_jobs_submitted_total", (("tool", "job.noop"),))] == 1
+        assert counters[("domed_store_events_appended_total", (("store", "memory"),))] >= 3
+        assert counters[("domed_rpc_total", (("method", "GetTool"), ("outcome", "E_NOT_FOUND")))] == 1
+        assert counters[("domed_rpc_streams_total", (("method", "StreamJobEvents"),))] == 1
+        assert counters[("domed_result_cache_misses_total", ())] == 0
+        gauges = {g.name for g in response.gauges}
+        assert {"domed_scheduler_queue_depth", "domed_result_cache_entries"} <= gauges
+        latency = [h for h in response.histograms if h.name == "domed_rpc_latency_seconds"]
+        assert any(h.labels[0].value == "SkillExecute" and h.count == 1 for h in latency)
+        assert "domed_job_run_seconds" in {h.name for h in response.histograms}
+        assert 'domed_rpc_latency_seconds_bucket{method="SkillExecute",le="+Inf"} 1' in response.prometheus_text
+        assert not client.get_metrics().prometheus_text
+        assert service.metrics is service.store.metrics
+    finally:
+        server.stop(grace=0).wait()
@@ -14,6 +14,8 @@ pytest.importorskip("grpc")
 pytest.importorskip("google.protobuf")
 
 from tools.codex.domed_client import DomedClient, DomedClientConfig
+from tools.domed import provenance as domed_provenance
+from tools.domed import service as domed_service
 from tools.domed.service import start_insecure_server
 
 
@@ -46,3 +48,52 @@ def test_get_job_status_populates_provenance_fields() -> None:
     finally:
         server.stop(grace=0).wait()
 
+
+
+def test_git_snapshot_is_cached_until_head_or_index_changes(monkeypatch, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+    (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n", encoding="utf-8")
+    (git_dir / "index").write_bytes(b"idx")
+    calls: list[list[str]] = []
+
+    def fake_git(args: list[str], cwd) -> str:  # type: ignore[no-untyped-def]
+        calls.append(args)
+        return "a" * 40 if args[0] == "rev-parse" else ""
+
+    monkeypatch.setattr(domed_provenance, "_git_output", fake_git)
+    assert domed_provenance.git_snapshot(tmp_path) == ("a" * 40, False)
+    assert domed_provenance.git_snapshot(tmp_path) == ("a" * 40, False)
+    assert len(calls) == 2
+
+    (git_dir / "refs" / "heads" / "main").write_text("b" * 40 + "\n", encoding="utf-8")
+    domed_provenance.git_snapshot(tmp_path)
+    assert len(calls) == 4
+
+
+def test_job_status_reads_provenance_captured_at_submit(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    server, port, service = start_insecure_server()
+    client = DomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}"))
+    try:
+        submit = client.skill_execute(
+            skill_id="job.noop",
+            profile="work",
+            idempotency_key="idem-prov-2",
+            task={},
+            constraints={},
+        )
+        captured = service.store.get(submit.job_id).provenance
+        assert captured["commit_sha"]
+
+        def fail(*_args, **_kwargs):  # type: ignore[no-untyped-def]
+            raise AssertionError("provenance recomputed on status read")
+
+        monkeypatch.setattr(domed_service, "collect_runtime_provenance", fail)
+        status = client.get_job_status(submit.job_id)
+        assert status.status.ok is True
+        assert status.provenance.commit_sha == captured["commit_sha"]
+        assert status.provenance.input_hash
+    finally:
+        server.stop(grace=0).wait()
+        service.close()
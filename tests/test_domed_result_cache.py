@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+from time import sleep
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.domed.result_cache import CachedResult, ResultCache, result_size
+
+
+def _result(source: str) -> CachedResult:
+    return CachedResult(terminal_state="succeeded", events=(("log", {"line": source}),), source_job_id=source)
+
+
+def test_result_cache_lru_eviction_and_ttl() -> None:
+    cache = ResultCache(max_entries=2, ttl_seconds=0.05)
+    cache.put(("m", "sha", "a"), _result("a"))
+    cache.put(("m", "sha", "b"), _result("b"))
+    assert cache.get(("m", "sha", "a")) is not None
+    cache.put(("m", "sha", "c"), _result("c"))
+    assert cache.get(("m", "sha", "b")) is None
+    assert cache.get(("m", "sha", "a")).source_job_id == "a"
+    assert len(cache) == 2
+    sleep(0.06)
+    assert cache.get(("m", "sha", "c")) is None
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_result_cache_bounds_bytes_and_skips_oversized_results() -> None:
+    size = result_size(_result("a"))
+    cache = ResultCache(max_entries=10, max_bytes=2 * size, max_entry_bytes=size)
+    cache.put(("m", "sha", "a"), _result("a"))
+    cache.put(("m", "sha", "b"), _result("b"))
+    cache.put(("m", "sha", "a"), _result("a"))
+    assert (len(cache), cache.bytes) == (2, 2 * size)
+    cache.put(("m", "sha", "c"), _result("c"))
+    assert cache.get(("m", "sha", "b")) is None
+    assert cache.bytes == 2 * size
+    cache.put(("m", "sha", "big"), _result("big"))
+    assert cache.get(("m", "sha", "big")) is None
+    assert cache.get(("m", "sha", "a")) is not None and cache.get(("m", "sha", "c")) is not None
+
+
+def _wait_entries(service, count: int) -> None:  # type: ignore[no-untyped-def]
+    for _ in range(100):
+        if len(service.result_cache) >= count:
+            return
+        sleep(0.01)
+
+
+def _cacheable_service(monkeypatch: pytest.MonkeyPatch, git: dict):  # type: ignore[no-untyped-def]
+    pytest.importorskip("grpc")
+    pytest.importorskip("google.protobuf")
+    from tools.domed import service as domed_service
+    from tools.domed.tool_registry import ToolRegistry
+
+    collect = domed_service.collect_runtime_provenance
+
+    def fake_provenance(*args, **kwargs):  # type: ignore[no-untyped-def]
+        return {**collect(*args, **kwargs), **git}
+
+    monkeypatch.setattr(domed_service, "collect_runtime_provenance", fake_provenance)
+    monkeypatch.setattr(domed_service, "git_snapshot", lambda _root: (git["commit_sha"], git["dirty_flag"]))
+    monkeypatch.setattr(domed_service, "worktree_dirty", lambda _root: git["dirty_flag"])
+    tool = domed_service._normalize_tool_item(  # noqa: SLF001
+        {"tool_id": "job.noop", "executor_backend": "inmemory", "cacheable": True}
+    )
+    registry = ToolRegistry(lambda: [tool], tools_root=ROOT / "missing", fallback_registry=ROOT / "missing")
+    service = domed_service.InMemoryDomedService(registry=registry)
+    pb2 = domed_service.domed_pb2
+
+    def run(key: str, task_json: str = '{"n": 1}'):  # type: ignore[no-untyped-def]
+        out = service.SkillExecute(
+            pb2.SkillExecuteRequest(skill_id="job.noop", profile="work", idempotency_key=key, task_json=task_json),
+            None,
+        )
+        events = list(service.StreamJobEvents(pb2.StreamJobEventsRequest(job_id=out.job_id, follow=True), None))
+        return out, events
+
+    return service, pb2, run
+
+
+def test_cacheable_tool_completes_from_cache_with_provenance_flag(monkeypatch: pytest.MonkeyPatch) -> None:
+    git = {"commit_sha": "a" * 40, "dirty_flag": False}
+    service, pb2, run = _cacheable_service(monkeypatch, git)
+    try:
+        first, _ = run("k1")
+        assert first.status.message == "submitted"
+        _wait_entries(service, 1)
+        hit, events = run("k2")
+        assert hit.status.message == "cached"
+        assert hit.state == pb2.JOB_STATE_SUCCEEDED
+        assert '"cache_hit": true' in events[-1].payload_json
+        status = service.GetJobStatus(pb2.GetJobStatusRequest(job_id=hit.job_id), None)
+        assert status.provenance.cache_hit is True
+        assert status.provenance.cache_source_job_id == first.job_id
+
+        miss, _ = run("k3", task_json='{"n": 2}')
+        assert miss.status.message == "submitted"
+        first_status = service.GetJobStatus(pb2.GetJobStatusRequest(job_id=first.job_id), None)
+        assert first_status.provenance.cache_hit is False
+    finally:
+        service.close()
+
+
+def test_result_cache_keys_on_commit_and_skips_dirty_trees_and_replays(monkeypatch: pytest.MonkeyPatch) -> None:
+    git = {"commit_sha": "a" * 40, "dirty_flag": False}
+    service, _pb2, run = _cacheable_service(monkeypatch, git)
+    try:
+        assert run("k1")[0].status.message == "submitted"
+        _wait_entries(service, 1)
+        counts = (service.result_cache.hits, service.result_cache.misses)
+        assert run("k1")[0].status.message == "replayed"
+        assert (service.result_cache.hits, service.result_cache.misses) == counts
+
+        git["commit_sha"] = "b" * 40
+        assert run("k2")[0].status.message == "submitted"
+        _wait_entries(service, 2)
+
+        git["dirty_flag"] = True
+        assert run("k3")[0].status.message == "submitted"
+        sleep(0.05)
+        assert run("k4")[0].status.message == "submitted"
+        assert len(service.result_cache) == 2
+    finally:
+        service.close()
+
+
+def test_result_cache_misses_after_an_unstaged_source_edit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git not available")
+    pytest.importorskip("grpc")
+    pytest.importorskip("google.protobuf")
+    from tools.domed import provenance
+    from tools.domed import service as domed_service
+    from tools.domed.tool_registry import ToolRegistry
+
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    source = tmp_path / "tool.py"
+    source.write_text("VALUE = 1\n", encoding="utf-8")
+    git("init", "-q")
+    git("add", "tool.py")
+    git("commit", "-q", "-m", "init")
+    monkeypatch.setattr(domed_service, "_ROOT", tmp_path)
+    # Pin git_snapshot to its clean answer, as its HEAD/index-mtime cache does when a tracked
+    # file is edited without touching the index.
+    clean = provenance.git_snapshot(tmp_path)
+    assert clean[1] is False
+    monkeypatch.setattr(provenance, "git_snapshot", lambda _root: clean)
+    monkeypatch.setattr(domed_service, "git_snapshot", lambda _root: clean)
+
+    tool = domed_service._normalize_tool_item(  # noqa: SLF001
+        {"tool_id": "job.noop", "executor_backend": "inmemory", "cacheable": True}
+    )
+    registry = ToolRegistry(lambda: [tool], tools_root=ROOT / "missing", fallback_registry=ROOT / "missing")
+    service = domed_service.InMemoryDomedService(registry=registry)
+    pb2 = domed_service.domed_pb2
+
+    def run(key: str):  # type: ignore[no-untyped-def]
+        out = service.SkillExecute(
+            pb2.SkillExecuteRequest(skill_id="job.noop", profile="work", idempotency_key=key, task_json="{}"),
+            None,
+        )
+        list(service.StreamJobEvents(pb2.StreamJobEventsRequest(job_id=out.job_id, follow=True), None))
+        return out.status.message
+
+    try:
+        assert run("k1") == "submitted"
+        _wait_entries(service, 1)
+        assert run("k2") == "cached"
+
+        source.write_text("VALUE = 2\n", encoding="utf-8")
+        assert run("k3") == "submitted"
+        sleep(0.05)
+        assert len(service.result_cache) == 1
+    finally:
+        service.close()
@@ -63,3 +63,79 @@ def test_terminal_state_blocks_transition() -> None:
         assert "terminal job cannot transition" in str(exc)
     else:  # pragma: no cover
         raise AssertionError("expected terminal transition rejection")
+
+
+def test_subscribe_wakes_on_append_and_transition() -> None:
+    store = RuntimeStateStore()
+    store.submit(job=_job("j1", idem="k1", req_hash="h1"), client_id="c1")
+    waiter = store.subscribe("j1")
+    assert not waiter.is_set()
+    store.append_event(job_id="j1", event_type="log", payload={"line": "x"})
+    assert waiter.wait(timeout=1.0)
+    waiter.clear()
+    store.transition(job_id="j1", to_state="running")
+    assert waiter.is_set()
+    store.unsubscribe("j1", waiter)
+    waiter.clear()
+    store.append_event(job_id="j1", event_type="log", payload={"line": "y"})
+    assert not waiter.is_set()
+
+
+def test_list_jobs_orders_by_updated_at_and_pages_with_cursor() -> None:
+    store = RuntimeStateStore()
+    for n in range(3):
+        store.submit(job=_job(f"j{n}", idem=f"k{n}", req_hash=f"h{n}"))
+    store.append_event(job_id="j0", event_type="log", payload={"line": "x"})
+    store.cancel("j2")
+
+    page = store.list_jobs(limit=2)
+    assert [j.job_id for j in page] == ["j2", "j0"]
+    rest = store.list_jobs(after=(page[-1].updated_at, page[-1].job_id))
+    assert [j.job_id for j in rest] == ["j1"]
+    assert [j.job_id for j in store.list_jobs(states=["canceled"])] == ["j2"]
+
+
+def test_per_job_ring_buffer_emits_truncation_marker() -> None:
+    store = RuntimeStateStore(max_events_per_job=3)
+    store.submit(job=_job("j1", idem="k1", req_hash="h1"))
+    store.append_events(job_id="j1", events=[("log", {"n": n}) for n in range(5)])
+    store.append_event(job_id="j1", event_type="log", payload={"n": 5})
+
+    events = store.events_since(job_id="j1", since_seq=0)
+    assert [e.seq for e in events] == [3, 4, 5, 6]
+    assert events[0].payload == {"truncated": True, "truncated_before_seq": 4}
+    assert [e.payload["n"] for e in events[1:]] == [3, 4, 5]
+    assert [e.seq for e in store.events_since(job_id="j1", since_seq=4)] == [5, 6]
+    assert [e.seq for e in store.events_since(job_id="j1", since_seq=0, limit=2)] == [3, 4]
+    assert store.events_since(job_id="j1", since_seq=6) == []
+
+
+def test_global_event_budget_evicts_terminal_jobs_first() -> None:
+    store = RuntimeStateStore(max_events_per_job=None, max_total_events=5)
+    for job_id in ("done", "live"):
+        store.submit(job=_job(job_id, idem=job_id, req_hash=job_id))
+    store.append_events(job_id="done", events=[("log", {"n": n}) for n in range(3)])
+    store.cancel("done")
+    store.append_events(job_id="live", events=[("log", {"n": n}) for n in range(3)])
+
+    assert store.get("done").events == []
+    assert [e.seq for e in store.events_since(job_id="done", since_seq=0)] == [3]
+    assert [e.seq for e in store.events_since(job_id="live", since_seq=0)] == [1, 2, 3]
+
+    store.append_events(job_id="live", events=[("log", {"n": n}) for n in range(3, 7)])
+    live = store.events_since(job_id="live", since_seq=0)
+    assert live[0].payload["truncated_before_seq"] == 3
+    assert [e.seq for e in live[1:]] == [3, 4, 5, 6, 7]
+
+
+def test_global_event_budget_forgets_emptied_live_jobs() -> None:
+    store = RuntimeStateStore(max_events_per_job=None, max_total_events=10)
+    for n in range(200):
+        store.submit(job=_job(f"j{n}", idem=f"k{n}", req_hash=f"h{n}"))
+        store.append_events(job_id=f"j{n}", events=[("log", {"n": 1}), ("log", {"n": 2})])
+    assert store._total_events == 10  # noqa: SLF001
+    # Only jobs still holding events remain eviction candidates, so the next eviction starts
+    # at the oldest of those instead of walking past every emptied job.
+    assert len(store._holding) <= 6  # noqa: SLF001
+    assert [e.seq for e in store.events_since(job_id="j199", since_seq=0)] == [1, 2]
+    assert store.get("j0").events == []
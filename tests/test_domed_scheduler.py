@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from threading import Event
+from time import monotonic
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.domed.scheduler import JobScheduler, QueuedJob
+
+
+def _item(job_id: str) -> QueuedJob:
+    return QueuedJob(job_id=job_id, tool={"tool_id": "job.noop"}, task_json="{}", constraints_json="{}")
+
+
+def test_scheduler_submit_does_not_block_on_handler() -> None:
+    release = Event()
+    done: list[str] = []
+
+    def handler(item: QueuedJob) -> None:
+        release.wait(timeout=5.0)
+        done.append(item.job_id)
+
+    sched = JobScheduler(handler, max_workers=2)
+    started = monotonic()
+    for idx in range(5):
+        sched.submit(_item(f"j{idx}"))
+    assert monotonic() - started < 1.0
+    assert done == []
+    release.set()
+    sched.close(wait=True, timeout=5.0)
+    assert sorted(done) == [f"j{idx}" for idx in range(5)]
+
+
+def test_scheduler_survives_handler_errors_and_rejects_after_close() -> None:
+    done: list[str] = []
+
+    def handler(item: QueuedJob) -> None:
+        if item.job_id == "boom":
+            raise RuntimeError("boom")
+        done.append(item.job_id)
+
+    sched = JobScheduler(handler, max_workers=1)
+    sched.submit(_item("boom"))
+    sched.submit(_item("ok"))
+    sched.close(wait=True, timeout=5.0)
+    assert done == ["ok"]
+    with pytest.raises(RuntimeError):
+        sched.submit(_item("late"))
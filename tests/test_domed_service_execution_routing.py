@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 import json
 import sys
+import time
 
 import pytest
 
@@ -13,7 +14,7 @@ if str(ROOT) not in sys.path:
 pytest.importorskip("grpc")
 pytest.importorskip("google.protobuf")
 
-from tools.codex.domed_client import DomedClient, DomedClientConfig
+from tools.codex.domed_client import DomedClient, DomedClientConfig, iter_log_lines
 from tools.domed import service as domed_service
 from tools.domed.service import start_insecure_server
 
@@ -30,13 +31,13 @@ def test_skill_execute_routes_real_local_process_tool() -> None:
             constraints={},
         )
         assert submit.status.ok is True
+        events = list(client.stream_job_events(job_id=submit.job_id, since_seq=0, follow=True))
         status = client.get_job_status(submit.job_id)
         assert status.status.ok is True
         assert status.state != 0
-        events = list(client.stream_job_events(job_id=submit.job_id, since_seq=0, follow=False))
         payloads = [json.loads(e.payload_json) for e in events]
-        assert any(p.get("line") == "alpha" for p in payloads)
-        assert any(p.get("line") == "beta" for p in payloads)
+        lines = {(line.stream, line.text) for line in iter_log_lines(events)}
+        assert {("stdout", "alpha"), ("stderr", "beta")} <= lines
         assert any("progress" in p or "value" in p for p in payloads)
         assert any(p.get("exit_code") == 0 for p in payloads if isinstance(p, dict))
     finally:
@@ -83,3 +84,89 @@ def test_manifest_catalog_takes_precedence_over_registry(monkeypatch) -> None:
     monkeypatch.setattr(domed_service, "_load_tool_manifests", lambda: manifest_tools)
     out = domed_service._load_tool_registry()  # noqa: SLF001
     assert out == manifest_tools
+
+
+def test_skill_execute_returns_queued_before_execution() -> None:
+    server, port, service = start_insecure_server()
+    client = DomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}"))
+    service.scheduler.close(wait=True)
+    service.scheduler = domed_service.JobScheduler(lambda _item: None, max_workers=1)
+    try:
+        submit = client.skill_execute(
+            skill_id="domed.exec-probe",
+            profile="work",
+            idempotency_key="idem-queued",
+            task={"stdout": ["x"], "exit_code": 0},
+            constraints={},
+        )
+        assert submit.status.ok is True
+        assert submit.state == domed_service.domed_pb2.JOB_STATE_QUEUED
+        status = client.get_job_status(submit.job_id)
+        assert status.state == domed_service.domed_pb2.JOB_STATE_QUEUED
+    finally:
+        server.stop(grace=0).wait()
+        service.close()
+
+
+def test_skill_execute_routes_python_pool_tool() -> None:
+    server, port, service = start_insecure_server()
+    client = DomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}"))
+    try:
+        submit = client.skill_execute(
+            skill_id="domed.pool-probe",
+            profile="work",
+            idempotency_key="idem-pool-probe",
+            task={"stdout": ["pooled"], "exit_code": 0},
+            constraints={},
+        )
+        assert submit.status.ok is True
+        events = list(client.stream_job_events(job_id=submit.job_id, since_seq=0, follow=True))
+        payloads = [json.loads(e.payload_json) for e in events]
+        assert [line.text for line in iter_log_lines(events)] == ["pooled"]
+        assert payloads[-1].get("to") == "succeeded"
+    finally:
+        server.stop(grace=0).wait()
+        service.close()
+
+
+def test_cancel_job_terminates_running_process_and_frees_worker() -> None:
+    from tools.domed.tool_registry import ToolRegistry
+
+    tools = [
+        domed_service._normalize_tool_item(  # noqa: SLF001
+            {
+                "tool_id": "sleeper",
+                "executor_backend": "local-process",
+                "entrypoint": ["bash", "-c", "echo started; sleep 30"],
+            }
+        ),
+        domed_service._normalize_tool_item({"tool_id": "job.noop", "executor_backend": "inmemory"}),  # noqa: SLF001
+    ]
+    registry = ToolRegistry(lambda: tools, tools_root=ROOT / "missing", fallback_registry=ROOT / "missing")
+    service = domed_service.InMemoryDomedService(executor_workers=1, registry=registry)
+    pb2 = domed_service.domed_pb2
+
+    def submit(skill_id: str, key: str):  # type: ignore[no-untyped-def]
+        return service.SkillExecute(
+            pb2.SkillExecuteRequest(skill_id=skill_id, profile="work", idempotency_key=key, task_json="{}"), None
+        )
+
+    try:
+        job_id = submit("sleeper", "idem-sleeper").job_id
+        stream = service.StreamJobEvents(pb2.StreamJobEventsRequest(job_id=job_id, follow=True), None)
+        for evt in stream:
+            if '"started"' in evt.payload_json:
+                break
+        started = time.monotonic()
+        out = service.CancelJob(pb2.CancelJobRequest(job_id=job_id, idempotency_key="c1"), None)
+        assert out.state == pb2.JOB_STATE_CANCELED
+
+        follow_up = submit("job.noop", "idem-after-cancel").job_id
+        for _evt in service.StreamJobEvents(pb2.StreamJobEventsRequest(job_id=follow_up, follow=True), None):
+            pass
+        assert service.store.get(follow_up).state == "succeeded"
+        assert time.monotonic() - started < 1.0
+        assert service.store.get(job_id).state == "canceled"
+        assert not service._running  # noqa: SLF001
+    finally:
+        service.close()
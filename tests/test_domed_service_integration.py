@@ -96,3 +96,69 @@ def test_domed_service_concrete_job_types() -> None:
         assert fail_status.state != 0
     finally:
         server.stop(grace=0).wait()
+
+
+def test_domed_batch_submit_and_status() -> None:
+    server, port, _service = start_insecure_server()
+    client = DomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}"))
+    try:
+        items = [
+            {"skill_id": "job.noop", "profile": "work", "idempotency_key": f"idem-batch-{n}", "task": {"n": n}}
+            for n in range(3)
+        ]
+        items.append({"skill_id": "job.noop", "profile": "work", "idempotency_key": "idem-batch-0", "task": {"n": 0}})
+        items.append({"skill_id": "job.noop", "profile": "work", "idempotency_key": "idem-batch-1", "task": {"n": 9}})
+        items.append({"skill_id": "does.not.exist", "profile": "work", "idempotency_key": "idem-batch-x"})
+        out = client.skill_execute_batch(items)
+        assert out.status.ok is True
+        assert len(out.responses) == len(items)
+        assert [r.status.ok for r in out.responses] == [True, True, True, True, False, False]
+        assert out.responses[3].status.message == "replayed"
+        assert out.responses[3].job_id == out.responses[0].job_id
+        assert out.responses[4].status.code == 5
+        assert "not found" in out.responses[5].status.message
+
+        job_ids = [r.job_id for r in out.responses[:3]] + ["job-missing"]
+        statuses = client.get_job_status_batch(job_ids)
+        assert statuses.status.ok is True
+        assert [r.job_id for r in statuses.responses] == job_ids
+        assert [r.status.ok for r in statuses.responses] == [True, True, True, False]
+        assert all(r.provenance.commit_sha for r in statuses.responses[:3])
+    finally:
+        server.stop(grace=0).wait()
+
+
+def test_domed_list_jobs_pages_and_filters() -> None:
+    server, port, _service = start_insecure_server()
+    client = DomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}"))
+    try:
+        items = [
+            {"skill_id": "job.noop", "profile": "work" if n % 2 else "home", "idempotency_key": f"idem-list-{n}"}
+            for n in range(5)
+        ]
+        submitted = {r.job_id for r in client.skill_execute_batch(items).responses}
+        for job_id in submitted:
+            list(client.stream_job_events(job_id=job_id, follow=True))
+
+        seen: list[str] = []
+        token = ""
+        while True:
+            page = client.list_jobs(page_size=2, page_token=token)
+            assert page.status.ok is True
+            assert len(page.jobs) <= 2
+            seen.extend(job.job_id for job in page.jobs)
+            token = page.next_page_token
+            if not token:
+                break
+        assert set(seen) == submitted
+        assert len(seen) == len(submitted)
+
+        work = client.list_jobs(profile="work")
+        assert {job.profile for job in work.jobs} == {"work"}
+        assert len(work.jobs) == 2
+
+        bad = client.list_jobs(page_token="not-a-token")
+        assert bad.status.ok is False
+        assert bad.status.code == 1
+    finally:
+        server.stop(grace=0).wait()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from pathlib import Path
+import sqlite3
 import sys
 from tempfile import TemporaryDirectory
+from threading import Thread
 from time import sleep
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -49,3 +51,212 @@ def test_sqlite_store_gc_ttl() -> None:
         assert store.get("j1") is None
         store.close()
 
+
+
+def test_sqlite_store_subscribe_notifies_on_append() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        store = SQLiteRuntimeStateStore(f"{td}/state.db")
+        store.submit(job=_job("j1", idem="k1", req_hash="h1"), client_id="c1")
+        waiter = store.subscribe("j1")
+        other = store.subscribe("j2")
+        store.append_event(job_id="j1", event_type="log", payload={"line": "x"})
+        assert waiter.wait(timeout=1.0)
+        assert not other.is_set()
+        store.unsubscribe("j1", waiter)
+        store.unsubscribe("j2", other)
+        store.close()
+
+
+def test_sqlite_store_persists_provenance_and_migrates_old_schema() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        conn = sqlite3.connect(f"{td}/state.db")
+        conn.execute(
+            """
+            CREATE TABLE jobs (
+              job_id TEXT PRIMARY KEY, run_id TEXT NOT NULL, state TEXT NOT NULL,
+              skill_id TEXT NOT NULL, profile TEXT NOT NULL, idempotency_key TEXT NOT NULL,
+              request_hash TEXT NOT NULL, artifacts_json TEXT NOT NULL,
+              created_at REAL NOT NULL, updated_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("INSERT INTO jobs VALUES('old', 'run-old', 'queued', 's', 'p', 'k0', 'h0', '[]', 0, 0)")
+        conn.commit()
+        conn.close()
+
+        store = SQLiteRuntimeStateStore(f"{td}/state.db")
+        assert store.get("old").provenance == {}
+        job = _job("j1", idem="k1", req_hash="h1")
+        job.provenance = {"commit_sha": "abc", "dirty_flag": False}
+        store.submit(job=job, client_id="c1")
+        assert store.get("j1").provenance == {"commit_sha": "abc", "dirty_flag": False}
+        assert store.transition(job_id="j1", to_state="running").provenance["commit_sha"] == "abc"
+        store.close()
+
+
+def test_sqlite_store_group_commit_batches_and_sequences() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        store = SQLiteRuntimeStateStore(f"{td}/state.db", group_commit_window_seconds=0.05)
+        store.submit(job=_job("j1", idem="k1", req_hash="h1"), client_id="c1")
+        store.submit(job=_job("j2", idem="k2", req_hash="h2"), client_id="c1")
+        first = store.append_event(job_id="j1", event_type="log", payload={"line": "a"})
+        batch = store.append_events(
+            job_id="j1",
+            events=[("log", {"line": "b"}), ("log", {"line": "c"})],
+        )
+        other = store.append_event(job_id="j2", event_type="log", payload={"line": "z"})
+        assert [first.seq, *[e.seq for e in batch]] == [1, 2, 3]
+        assert other.seq == 1
+        events = store.events_since(job_id="j1", since_seq=0)
+        assert [e.payload["line"] for e in events] == ["a", "b", "c"]
+        store.close()
+
+        reopened = SQLiteRuntimeStateStore(f"{td}/state.db", group_commit_window_seconds=0)
+        nxt = reopened.append_event(job_id="j1", event_type="log", payload={"line": "d"})
+        assert nxt.seq == 4
+        assert len(reopened.events_since(job_id="j2", since_seq=0)) == 1
+        reopened.close()
+
+
+def test_sqlite_store_failed_commit_is_retried_not_dropped() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        store = SQLiteRuntimeStateStore(f"{td}/state.db", group_commit_window_seconds=0.01)
+        store.submit(job=_job("j1", idem="k1", req_hash="h1"), client_id="c1")
+        write_batch = store._write_batch  # noqa: SLF001
+        broken = [True]
+
+        def flaky(batch):  # type: ignore[no-untyped-def]
+            if broken[0]:
+                raise sqlite3.OperationalError("disk I/O error")
+            return write_batch(batch)
+
+        store._write_batch = flaky  # type: ignore[method-assign]  # noqa: SLF001
+        store.append_event(job_id="j1", event_type="log", payload={"line": "a"})
+        try:
+            store.events_since(job_id="j1", since_seq=0)
+        except sqlite3.OperationalError:
+            pass
+        else:
+            raise AssertionError("flush should surface the commit error")
+
+        broken[0] = False
+        store.append_event(job_id="j1", event_type="log", payload={"line": "b"})
+        events = store.events_since(job_id="j1", since_seq=0)
+        assert [(e.seq, e.payload["line"]) for e in events] == [(1, "a"), (2, "b")]
+        errors = sum(v for (name, _), v in store.metrics.snapshot().counters.items() if name == "domed_store_write_errors_total")
+        assert errors >= 1
+        store.close()
+
+
+def test_sqlite_store_late_batch_never_moves_updated_at_backwards() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        store = SQLiteRuntimeStateStore(f"{td}/state.db", group_commit_window_seconds=0.3)
+        store.submit(job=_job("j1", idem="k1", req_hash="h1"), client_id="c1")
+        store.append_event(job_id="j1", event_type="log", payload={"line": "a"})
+        sleep(0.01)
+        store.transition(job_id="j1", to_state="running")
+        transitioned = store.get("j1").updated_at
+        store.flush()
+        assert store.get("j1").updated_at == transitioned
+        store.close()
+
+
+def test_sqlite_store_reads_do_not_wait_for_writer_lock() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        store = SQLiteRuntimeStateStore(f"{td}/state.db", read_pool_size=2)
+        store.submit(job=_job("j1", idem="k1", req_hash="h1"), client_id="c1")
+        store.append_event(job_id="j1", event_type="log", payload={"line": "x"})
+        store.flush()
+        results: list[object] = []
+        with store._lock:  # noqa: SLF001 - simulate a long writer transaction
+            reader = Thread(
+                target=lambda: results.extend(
+                    [store.get("j1"), store.events_since(job_id="j1", since_seq=0)]
+                )
+            )
+            reader.start()
+            reader.join(timeout=2.0)
+            assert not reader.is_alive()
+        assert results[0].job_id == "j1"
+        assert [e.seq for e in results[1]] == [1]
+        store.close()
+
+
+def test_sqlite_store_submit_many_single_transaction_per_item_results() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        store = SQLiteRuntimeStateStore(f"{td}/state.db")
+        out = store.submit_many(
+            jobs=[
+                _job("j1", idem="k1", req_hash="h1"),
+                _job("j2", idem="k2", req_hash="h2"),
+                _job("j3", idem="k1", req_hash="h1"),
+                _job("j4", idem="k2", req_hash="other"),
+            ],
+            client_id="c1",
+        )
+        assert [o[1] for o in out[:3]] == [False, False, True]
+        assert out[2][0].job_id == "j1"
+        assert isinstance(out[3], ValueError)
+        found = store.get_many(["j1", "j2", "j3"])
+        assert sorted(found) == ["j1", "j2"]
+        store.close()
+
+
+def test_sqlite_store_list_jobs_filters_and_keyset_pages() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        store = SQLiteRuntimeStateStore(f"{td}/state.db")
+        store.submit_many(jobs=[_job(f"j{n}", idem=f"k{n}", req_hash=f"h{n}") for n in range(5)])
+        store.transition(job_id="j1", to_state="running")
+        store.transition(job_id="j1", to_state="succeeded")
+
+        first = store.list_jobs(limit=2)
+        assert [j.job_id for j in first] == ["j1", "j4"]
+        rest = store.list_jobs(after=(first[-1].updated_at, first[-1].job_id), limit=10)
+        assert [j.job_id for j in rest] == ["j3", "j2", "j0"]
+
+        assert [j.job_id for j in store.list_jobs(states=["succeeded"])] == ["j1"]
+        assert len(store.list_jobs(states=["queued"], profile="work", skill_id="skill-execute")) == 4
+        assert store.list_jobs(profile="other") == []
+        assert store.list_jobs(updated_after=first[0].updated_at + 1.0) == []
+        assert first[0].updated_at >= first[0].created_at
+        store.close()
+
+
+def test_sqlite_store_events_since_raw_returns_stored_payload_text() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        store = SQLiteRuntimeStateStore(f"{td}/state.db")
+        store.submit(job=_job("j1", idem="k1", req_hash="h1"))
+        store.append_event(job_id="j1", event_type="log", payload={"z": 1, "line": "hello"})
+        raw = store.events_since_raw(job_id="j1", since_seq=0)
+        assert [(e.seq, e.event_type, e.payload_json) for e in raw] == [(1, "log", '{"line": "hello", "z": 1}')]
+        decoded = store.events_since(job_id="j1", since_seq=0)
+        assert decoded[0].payload == {"z": 1, "line": "hello"}
+        store.close()
+
+
+def test_sqlite_store_gc_chunks_and_reclaims_pages() -> None:
+    with TemporaryDirectory(prefix="domed-state-") as td:
+        db_path = f"{td}/state.db"
+        old = sqlite3.connect(f"{td}/legacy.db")
+        old.execute("CREATE TABLE t (x)")
+        old.commit()
+        old.close()
+        legacy = SQLiteRuntimeStateStore(f"{td}/legacy.db")
+        legacy.close()
+        assert sqlite3.connect(f"{td}/legacy.db").execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+        store = SQLiteRuntimeStateStore(db_path)
+        jobs = [_job(f"j{n}", idem=f"k{n}", req_hash=f"h{n}", state="succeeded") for n in range(7)]
+        store.submit_many(jobs=jobs)
+        for job in jobs:
+            store.append_events(job_id=job.job_id, events=[("log", {"line": "x" * 512})] * 20)
+        store.submit(job=_job("live", idem="kl", req_hash="hl", state="running"))
+        sleep(0.02)
+
+        report = store.gc_report(ttl_seconds=0, chunk_size=3)
+        assert (report.jobs, report.events, report.idempotency, report.chunks) == (7, 140, 7, 3)
+        assert report.pages_reclaimed > 0
+        assert report.seconds >= 0
+        assert store.get("live") is not None
+        assert store.gc(ttl_seconds=0) == 0
+        store.close()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 import sys
+from time import monotonic
 
 import pytest
 
@@ -13,7 +14,8 @@ if str(ROOT) not in sys.path:
 pytest.importorskip("grpc")
 pytest.importorskip("google.protobuf")
 
-from tools.codex.domed_client import DomedClient, DomedClientConfig
+from tools.codex.domed_client import DomedClient, DomedClientConfig, iter_log_lines
+from tools.domed.scheduler import JobScheduler
 from tools.domed.service import start_insecure_server
 
 
@@ -28,10 +30,13 @@ def test_stream_follow_true_tails_until_terminal() -> None:
             task={"stdout": ["s1", "s2"], "progress": [0.3], "exit_code": 0},
             constraints={},
         )
+        started = monotonic()
         events = list(client.stream_job_events(job_id=submit.job_id, since_seq=0, follow=True))
         assert events, "expected tail stream events"
+        # The stream closes right after the terminal event, not after an idle recheck.
+        assert monotonic() - started < 0.9
         payloads = [json.loads(e.payload_json) for e in events]
-        assert any(p.get("line") == "s1" for p in payloads)
+        assert [line.text for line in iter_log_lines(events)][:2] == ["s1", "s2"]
         assert any(p.get("exit_code") == 0 for p in payloads if isinstance(p, dict))
         status = client.get_job_status(submit.job_id)
         assert status.state != 0
@@ -61,3 +66,30 @@ def test_stream_since_seq_resume_is_deterministic() -> None:
     finally:
         server.stop(grace=0).wait()
 
+
+
+def test_stream_follow_wakes_on_pushed_events() -> None:
+    server, port, service = start_insecure_server()
+    client = DomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}"))
+    service.scheduler.close(wait=True)
+    service.scheduler = JobScheduler(lambda _item: None, max_workers=1)
+    try:
+        submit = client.skill_execute(
+            skill_id="job.noop",
+            profile="work",
+            idempotency_key="idem-push-1",
+            task={},
+            constraints={},
+        )
+        stream = client.stream_job_events(job_id=submit.job_id, since_seq=0, follow=True)
+        first = next(stream)
+        assert first.seq == 1
+        service.store.append_event(job_id=submit.job_id, event_type="log", payload={"line": "pushed"})
+        pushed = next(stream)
+        assert json.loads(pushed.payload_json) == {"line": "pushed"}
+        service.store.transition(job_id=submit.job_id, to_state="succeeded")
+        assert list(stream) == []
+        assert service.store._notifier.subscriber_count(submit.job_id) == 0  # noqa: SLF001
+    finally:
+        server.stop(grace=0).wait()
+        service.close()
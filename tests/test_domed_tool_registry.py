@@ -1,7 +1,15 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.domed.tool_registry import ToolRegistry, loader_code_version, write_registry_snapshot
 
 
 def test_tool_registry_schema_minimum() -> None:
@@ -39,3 +47,129 @@ def test_manifest_layout_exists_and_is_loadable() -> None:
         assert payload.get("title")
         assert payload.get("input_schema_ref")
         assert payload.get("output_schema_ref")
+
+
+def _write_manifest(root: Path, tool_id: str, title: str) -> Path:
+    path = root / tool_id / "manifest.yaml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"tool_id": tool_id, "title": title}), encoding="utf-8")
+    return path
+
+
+def test_tool_registry_caches_and_invalidates_on_mtime(tmp_path: Path) -> None:
+    tools_root = tmp_path / "tools"
+    manifest = _write_manifest(tools_root, "t.one", "One")
+    loads: list[int] = []
+
+    def loader() -> list[dict[str, object]]:
+        loads.append(1)
+        return [
+            {"tool_id": p.parent.name, **json.loads(p.read_text(encoding="utf-8"))}
+            for p in sorted(tools_root.glob("*/manifest.yaml"))
+        ]
+
+    registry = ToolRegistry(
+        loader,
+        tools_root=tools_root,
+        fallback_registry=tmp_path / "missing.json",
+        check_interval_seconds=0.0,
+    )
+    assert registry.get("t.one")["title"] == "One"
+    assert registry.get("t.one") is registry.get("t.one")
+    assert registry.manifest_hash("t.one")
+    assert len(loads) == 1
+
+    manifest.write_text(json.dumps({"tool_id": "t.one", "title": "Uno"}), encoding="utf-8")
+    os.utime(manifest, ns=(manifest.stat().st_atime_ns, manifest.stat().st_mtime_ns + 1_000_000))
+    assert registry.get("t.one")["title"] == "Uno"
+    assert len(loads) == 2
+
+    _write_manifest(tools_root, "t.two", "Two")
+    assert registry.get("t.two") is not None
+    assert registry.get("missing") is None
+
+    before = len(loads)
+    registry.reload()
+    assert len(loads) == before + 1
+
+
+def test_precompiled_snapshot_skips_loader_until_stale(tmp_path: Path) -> None:
+    tools_root = tmp_path / "tools"
+    manifest = _write_manifest(tools_root, "t.one", "One")
+    snapshot_path = tmp_path / "snapshot.json"
+    loads: list[int] = []
+
+    def loader() -> list[dict[str, object]]:
+        loads.append(1)
+        return [json.loads(p.read_text(encoding="utf-8")) for p in sorted(tools_root.glob("*/manifest.yaml"))]
+
+    def registry() -> ToolRegistry:
+        return ToolRegistry(
+            loader,
+            tools_root=tools_root,
+            fallback_registry=tmp_path / "missing.json",
+            check_interval_seconds=0.0,
+            snapshot_path=snapshot_path,
+        )
+
+    built = registry().snapshot()
+    assert len(loads) == 1  # no snapshot file yet
+    write_registry_snapshot(snapshot_path, built)
+
+    fast = registry()
+    assert fast.get("t.one")["title"] == "One"
+    assert fast.version() == built.version
+    assert fast.manifest_hash("t.one") == built.manifest_hashes["t.one"]
+    assert len(loads) == 1
+
+    fast.reload()
+    assert len(loads) == 2
+
+    manifest.write_text(json.dumps({"tool_id": "t.one", "title": "Uno"}), encoding="utf-8")
+    os.utime(manifest, ns=(manifest.stat().st_atime_ns, manifest.stat().st_mtime_ns + 1_000_000))
+    assert registry().get("t.one")["title"] == "Uno"
+    assert len(loads) == 3
+
+    snapshot_path.write_text("{not json", encoding="utf-8")
+    assert registry().get("t.one")["title"] == "Uno"
+
+
+def test_snapshot_from_an_older_normalizer_is_rejected(tmp_path: Path) -> None:
+    tools_root = tmp_path / "tools"
+    _write_manifest(tools_root, "t.one", "One")
+    snapshot_path = tmp_path / "snapshot.json"
+
+    def normalize_v1(item: dict[str, object]) -> dict[str, object]:
+        return {"tool_id": item["tool_id"], "title": item["title"]}
+
+    def normalize_v2(item: dict[str, object]) -> dict[str, object]:
+        return {"tool_id": item["tool_id"], "title": item["title"], "cacheable": False}
+
+    loads: list[str] = []
+
+    def registry(normalize) -> ToolRegistry:  # type: ignore[no-untyped-def]
+        def loader() -> list[dict[str, object]]:
+            loads.append(normalize.__name__)
+            return [
+                normalize(json.loads(p.read_text(encoding="utf-8")))
+                for p in sorted(tools_root.glob("*/manifest.yaml"))
+            ]
+
+        return ToolRegistry(
+            loader,
+            tools_root=tools_root,
+            fallback_registry=tmp_path / "missing.json",
+            snapshot_path=snapshot_path,
+            loader_version=loader_code_version(normalize),
+        )
+
+    assert loader_code_version(normalize_v1) == loader_code_version(normalize_v1)
+    assert loader_code_version(normalize_v1) != loader_code_version(normalize_v2)
+
+    write_registry_snapshot(snapshot_path, registry(normalize_v1).snapshot())
+    assert "cacheable" not in registry(normalize_v1).get("t.one")
+    assert loads == ["normalize_v1"]
+
+    upgraded = registry(normalize_v2).get("t.one")
+    assert upgraded["cacheable"] is False
+    assert loads == ["normalize_v1", "normalize_v2"]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from time import monotonic, sleep
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+grpc = pytest.importorskip("grpc")
+pytest.importorskip("google.protobuf")
+
+from tools.domed.tracing import configure_tracing, job_span
+
+
+def test_configure_tracing_none_and_invalid_exporter() -> None:
+    assert configure_tracing("none") is False
+    with pytest.raises(ValueError):
+        configure_tracing("jaeger")
+    with job_span("domed.test", {}, {"domed.job_id": "j1"}):
+        pass
+
+
+def _span_exporter() -> object:
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    provider = trace.get_tracer_provider()
+    if not isinstance(provider, TracerProvider):
+        trace.set_tracer_provider(TracerProvider())
+        provider = trace.get_tracer_provider()
+    exporter = InMemorySpanExporter()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return exporter
+
+
+def test_submit_execute_and_stream_share_one_trace() -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry import trace
+
+    from tools.codex.domed_client import DomedClient, DomedClientConfig
+    from tools.domed.service import start_insecure_server
+    from tools.domed.tracing import TracingServerInterceptor
+
+    exporter = _span_exporter()
+    server, port, _service = start_insecure_server(interceptors=[TracingServerInterceptor()])
+    client = DomedClient(DomedClientConfig(endpoint=f"127.0.0.1:{port}"))
+    try:
+        with trace.get_tracer("tests").start_as_current_span("orchestrator.stage") as root:
+            submit = client.skill_execute(skill_id="job.noop", profile="work", idempotency_key="idem-t1", task={})
+            list(client.stream_job_events(job_id=submit.job_id, follow=True))
+        deadline = monotonic() + 5.0
+        while monotonic() < deadline:
+            names = {span.name for span in exporter.get_finished_spans()}
+            if {"domed.job.execute", "domed/StreamJobEvents"} <= names:
+                break
+            sleep(0.01)
+    finally:
+        server.stop(grace=0).wait()
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    trace_id = root.get_span_context().trace_id
+    submit_span = spans["domed/SkillExecute"]
+    execute_span = spans["domed.job.execute"]
+    assert {span.context.trace_id for span in spans.values() if span.name != "orchestrator.stage"} == {trace_id}
+    assert spans["domed.client/SkillExecute"].parent.span_id == root.get_span_context().span_id
+    assert submit_span.parent.span_id == spans["domed.client/SkillExecute"].context.span_id
+    assert submit_span.attributes["domed.tool_id"] == "job.noop"
+    assert submit_span.attributes["domed.job_id"] == submit.job_id
+    assert execute_span.parent.span_id == submit_span.context.span_id
+    assert execute_span.attributes["domed.job_state"] == "succeeded"
+    assert spans["domed/StreamJobEvents"].attributes["domed.stream_messages"] >= 3
@@ -13,7 +13,42 @@ if str(ROOT) not in sys.path:
 from tools.codex.browse_skill import run_task_via_domed
 
 
-def test_run_task_via_domed_retries_then_succeeds(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+def test_run_task_via_domed_delegates_retries_to_channel(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    configs: list[dict[str, object]] = []
+
+    class FakeClient:
+        def __init__(self, cfg) -> None:
+            self.cfg = cfg
+
+        def skill_execute(self, **kwargs):
+            return types.SimpleNamespace(
+                status=types.SimpleNamespace(ok=True, message="ok"),
+                job_id="job-r",
+                run_id="run-r",
+                state=3,
+            )
+
+    class FakeCfg:
+        def __init__(self, **kwargs) -> None:
+            configs.append(kwargs)
+
+    monkeypatch.setitem(
+        sys.modules,
+        "tools.codex.domed_client",
+        types.SimpleNamespace(DomedClient=FakeClient, DomedClientConfig=FakeCfg),
+    )
+
+    out = run_task_via_domed(
+        task={"op": "x"},
+        domed_endpoint="127.0.0.1:50051",
+        max_attempts=2,
+        retry_sleep_seconds=0.0,
+    )
+    assert out["ok"] is True
+    assert configs == [{"endpoint": "127.0.0.1:50051", "max_attempts": 2, "initial_backoff_seconds": 0.0}]
+
+
+def test_run_task_via_domed_retries_timeouts_then_succeeds(monkeypatch) -> None:  # type: ignore[no-untyped-def]
     attempts = {"n": 0}
 
     class FakeClient:
@@ -32,7 +67,7 @@ def test_run_task_via_domed_retries_then_succeeds(monkeypatch) -> None:  # type:
             )
 
     class FakeCfg:
-        def __init__(self, endpoint: str) -> None:
+        def __init__(self, endpoint: str, **kwargs) -> None:
             self.endpoint = endpoint
 
     monkeypatch.setitem(
@@ -60,7 +95,7 @@ def test_run_task_via_domed_retries_then_fails(monkeypatch) -> None:  # type: ig
             raise TimeoutError("always timeout")
 
     class FakeCfg:
-        def __init__(self, endpoint: str) -> None:
+        def __init__(self, endpoint: str, **kwargs) -> None:
             self.endpoint = endpoint
 
     monkeypatch.setitem(
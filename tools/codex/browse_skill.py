@@ -84,6 +84,16 @@ def validate_identity_graph_contracts(identity_graph_root: Path) -> None:
         _ = _load_json(path)
 
 
+def _is_timeout(exc: Exception) -> bool:
+    code = getattr(exc, "code", None)
+    if callable(code):
+        try:
+            return getattr(code(), "name", "") == "DEADLINE_EXCEEDED"
+        except Exception:  # noqa: BLE001
+            return False
+    return isinstance(exc, TimeoutError)
+
+
 def run_task_via_domed(
     *,
     task: dict[str, Any],
@@ -93,12 +103,23 @@ def run_task_via_domed(
     max_attempts: int = 2,
     retry_sleep_seconds: float = 0.05,
 ) -> dict[str, Any]:
+    """Submit ``task`` to domed, making up to ``max_attempts`` attempts.
+
+    UNAVAILABLE is retried by the channel's gRPC retry policy. gRPC never retries a call that
+    ran out of time, so timeouts (DEADLINE_EXCEEDED) are retried here; the idempotency key
+    makes a resubmission of a job that did get through a replay.
+    """
     from tools.codex.domed_client import DomedClient, DomedClientConfig
 
-    client = DomedClient(DomedClientConfig(endpoint=domed_endpoint))
     if max_attempts < 1:
         raise ValueError("max_attempts must be >= 1")
-    last_exc: Exception | None = None
+    client = DomedClient(
+        DomedClientConfig(
+            endpoint=domed_endpoint,
+            max_attempts=max_attempts,
+            initial_backoff_seconds=retry_sleep_seconds,
+        )
+    )
     for attempt in range(1, max_attempts + 1):
         try:
             resp = client.skill_execute(
@@ -110,14 +131,9 @@ def run_task_via_domed(
             )
             break
         except Exception as exc:  # noqa: BLE001
-            last_exc = exc
-            if attempt >= max_attempts:
-                raise RuntimeError(
-                    f"domed skill_execute failed after {attempt} attempts: {exc}"
-                ) from exc
+            if attempt >= max_attempts or not _is_timeout(exc):
+                raise RuntimeError(f"domed skill_execute failed after {max_attempts} attempts: {exc}") from exc
             time.sleep(retry_sleep_seconds)
-    else:  # pragma: no cover
-        raise RuntimeError(f"domed skill_execute failed: {last_exc}")
     return {
         "ok": bool(resp.status.ok),
         "job_id": resp.job_id,
@@ -43,6 +43,7 @@ def main() -> int:
     # Enforce thin-client-only gRPC usage for codex consumers.
     allowed = {
         codex_root / "domed_client.py",
+        codex_root / "domed_async_client.py",
         codex_root / "check_generated_client_only.py",
     }
     bad_refs: list[str] = []
@@ -4,6 +4,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Any
 
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
@@ -32,13 +33,40 @@ def _parse_args() -> argparse.Namespace:
 
     lt = sub.add_parser("list-tools", help="List discoverable domed tools")
     lt.add_argument("--domed-endpoint")
+    _add_descriptor_cache_args(lt)
 
     gt = sub.add_parser("get-tool", help="Get full descriptor for one domed tool")
     gt.add_argument("--tool-id", required=True)
     gt.add_argument("--domed-endpoint")
+    _add_descriptor_cache_args(gt)
     return p.parse_args()
 
 
+def _add_descriptor_cache_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--no-descriptor-cache", action="store_true", help="always fetch descriptors from domed")
+    p.add_argument(
+        "--descriptor-cache-ttl-seconds",
+        type=float,
+        default=30.0,
+        help="serve cached descriptors without revalidating for this long",
+    )
+
+
+def _discovery_client(args: argparse.Namespace) -> Any:
+    from tools.codex.domed_client import DomedClient, DomedClientConfig
+    from tools.domed.endpoints import default_descriptor_cache_dir
+
+    if args.no_descriptor_cache:
+        return DomedClient(DomedClientConfig(endpoint=args.domed_endpoint))
+    return DomedClient(
+        DomedClientConfig(
+            endpoint=args.domed_endpoint,
+            descriptor_cache_dir=default_descriptor_cache_dir(),
+            descriptor_cache_ttl_seconds=args.descriptor_cache_ttl_seconds,
+        )
+    )
+
+
 def main() -> int:
     args = _parse_args()
     if args.cmd == "validate-contracts":
@@ -58,9 +86,7 @@ def main() -> int:
         print()
         return 0
     if args.cmd == "list-tools":
-        from tools.codex.domed_client import DomedClient, DomedClientConfig
-
-        client = DomedClient(DomedClientConfig(endpoint=args.domed_endpoint))
+        client = _discovery_client(args)
         resp = client.list_tools()
         out = []
         for item in resp.tools:
@@ -77,9 +103,7 @@ def main() -> int:
         print()
         return 0
     if args.cmd == "get-tool":
-        from tools.codex.domed_client import DomedClient, DomedClientConfig
-
-        client = DomedClient(DomedClientConfig(endpoint=args.domed_endpoint))
+        client = _discovery_client(args)
         resp = client.get_tool(args.tool_id)
         out = {
             "ok": bool(resp.status.ok),
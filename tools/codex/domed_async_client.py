@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+from tools.codex.domed_client import (
+    DomedClientConfig,
+    channel_options,
+    event_log_lines,
+    import_stubs,
+    list_jobs_request,
+    retry_settings,
+    skill_execute_batch_request,
+    skill_execute_request,
+)
+from tools.domed.endpoints import default_client_endpoint
+from tools.domed.log_payload import LogLine
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class JobOutcome:
+    job_id: str
+    run_id: str
+    state: int
+    ok: bool
+    status_message: str
+    events: int = 0
+
+
+async def gather_limited(factories: Iterable[Callable[[], Awaitable[T]]], limit: int) -> list[T]:
+    """``asyncio.gather`` over ``factories`` with at most ``limit`` awaitables in flight.
+
+    Results keep input order; the first exception cancels the remaining work and propagates.
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    gate = asyncio.Semaphore(limit)
+
+    async def _run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with gate:
+            return await factory()
+
+    tasks = [asyncio.ensure_future(_run(factory)) for factory in factories]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def aiter_log_lines(
+    events: AsyncIterable[Any], *, after: dict[str, int] | None = None
+) -> AsyncIterator[LogLine]:
+    """Async counterpart of ``iter_log_lines``."""
+    async for evt in events:
+        for line in event_log_lines(evt, after=after):
+            yield line
+
+
+class AsyncDomedClient:
+    """grpc.aio twin of ``DomedClient`` for driving many jobs from one event loop.
+
+    Each client owns its channel (aio channels are bound to the loop that created them), so
+    create it inside the loop and close it with ``await client.close()`` or ``async with``.
+    Retry and keepalive settings match ``DomedClient``.
+    """
+
+    def __init__(self, cfg: DomedClientConfig) -> None:
+        grpc, domed_pb2, domed_pb2_grpc = import_stubs()
+        self._pb2 = domed_pb2
+        endpoint = cfg.endpoint or default_client_endpoint()
+        interceptors = []
+        if cfg.tracing:
+            from tools.domed.tracing import async_tracing_client_interceptors, tracing_available
+
+            if tracing_available():
+                interceptors = async_tracing_client_interceptors()
+        self._channel = grpc.aio.insecure_channel(
+            endpoint,
+            options=channel_options(*retry_settings(cfg)),
+            interceptors=interceptors or None,
+        )
+        self._stub = domed_pb2_grpc.DomedServiceStub(self._channel)
+
+    async def close(self) -> None:
+        await self._channel.close()
+
+    async def __aenter__(self) -> "AsyncDomedClient":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def health(self) -> Any:
+        return await self._stub.Health(self._pb2.HealthRequest())
+
+    async def list_capabilities(self, profile: str, *, if_none_match: str = "") -> Any:
+        return await self._stub.ListCapabilities(
+            self._pb2.ListCapabilitiesRequest(profile=profile, if_none_match=if_none_match)
+        )
+
+    async def list_tools(self, *, if_none_match: str = "") -> Any:
+        return await self._stub.ListTools(self._pb2.ListToolsRequest(if_none_match=if_none_match))
+
+    async def get_tool(self, tool_id: str) -> Any:
+        return await self._stub.GetTool(self._pb2.GetToolRequest(tool_id=tool_id))
+
+    async def skill_execute(
+        self,
+        *,
+        skill_id: str,
+        profile: str,
+        idempotency_key: str,
+        task: dict[str, Any],
+        constraints: dict[str, Any] | None = None,
+    ) -> Any:
+        return await self._stub.SkillExecute(
+            skill_execute_request(
+                self._pb2,
+                skill_id=skill_id,
+                profile=profile,
+                idempotency_key=idempotency_key,
+                task=task,
+                constraints=constraints,
+            )
+        )
+
+    async def skill_execute_batch(self, items: list[dict[str, Any]]) -> Any:
+        """Submit many jobs in one round trip; each item takes the skill_execute kwargs."""
+        return await self._stub.SkillExecuteBatch(skill_execute_batch_request(self._pb2, items))
+
+    async def get_job_status(self, job_id: str) -> Any:
+        return await self._stub.GetJobStatus(self._pb2.GetJobStatusRequest(job_id=job_id))
+
+    async def get_job_status_batch(self, job_ids: list[str]) -> Any:
+        return await self._stub.GetJobStatusBatch(self._pb2.GetJobStatusBatchRequest(job_ids=list(job_ids)))
+
+    async def list_jobs(
+        self,
+        *,
+        states: list[int] | None = None,
+        skill_id: str = "",
+        profile: str = "",
+        updated_after: float = 0.0,
+        updated_before: float = 0.0,
+        page_size: int = 0,
+        page_token: str = "",
+    ) -> Any:
+        return await self._stub.ListJobs(
+            list_jobs_request(
+                self._pb2,
+                states=states,
+                skill_id=skill_id,
+                profile=profile,
+                updated_after=updated_after,
+                updated_before=updated_before,
+                page_size=page_size,
+                page_token=page_token,
+            )
+        )
+
+    async def get_metrics(self, *, include_prometheus_text: bool = False) -> Any:
+        return await self._stub.GetMetrics(
+            self._pb2.GetMetricsRequest(include_prometheus_text=include_prometheus_text)
+        )
+
+    async def cancel_job(self, *, job_id: str, idempotency_key: str) -> Any:
+        return await self._stub.CancelJob(
+            self._pb2.CancelJobRequest(job_id=job_id, idempotency_key=idempotency_key)
+        )
+
+    def stream_job_events(self, *, job_id: str, since_seq: int = 0, follow: bool = False) -> AsyncIterator[Any]:
+        req = self._pb2.StreamJobEventsRequest(job_id=job_id, since_seq=since_seq, follow=follow)
+        return self._stub.StreamJobEvents(req)
+
+    async def execute_and_wait(
+        self,
+        *,
+        skill_id: str,
+        profile: str,
+        idempotency_key: str,
+        task: dict[str, Any],
+        constraints: dict[str, Any] | None = None,
+        on_event: Callable[[Any], None] | None = None,
+    ) -> JobOutcome:
+        """Submit one job, follow its events to the end and return its terminal state."""
+        submit = await self.skill_execute(
+            skill_id=skill_id,
+            profile=profile,
+            idempotency_key=idempotency_key,
+            task=task,
+            constraints=constraints,
+        )
+        if not submit.status.ok:
+            return JobOutcome(
+                job_id=submit.job_id,
+                run_id=submit.run_id,
+                state=int(submit.state),
+                ok=False,
+                status_message=submit.status.message,
+            )
+        seen = 0
+        async for evt in self.stream_job_events(job_id=submit.job_id, follow=True):
+            seen += 1
+            if on_event is not None:
+                on_event(evt)
+        status = await self.get_job_status(submit.job_id)
+        return JobOutcome(
+            job_id=submit.job_id,
+            run_id=submit.run_id,
+            state=int(status.state),
+            ok=bool(status.status.ok),
+            status_message=status.status.message,
+            events=seen,
+        )
+
+    async def execute_many(self, items: list[dict[str, Any]], *, concurrency: int = 64) -> list[JobOutcome]:
+        """``execute_and_wait`` for every item (same kwargs), at most ``concurrency`` at a time."""
+        return await gather_limited(
+            [lambda item=item: self.execute_and_wait(**item) for item in items],
+            concurrency,
+        )
@@ -1,53 +1,304 @@
 from __future__ import annotations
 
+import atexit
 import json
 from dataclasses import dataclass
 from pathlib import Path
 import sys
-from typing import Any
+from threading import Lock
+from typing import Any, Iterable, Iterator
 
+from tools.codex.domed_descriptor_cache import DescriptorCache
 from tools.domed.endpoints import default_client_endpoint
+from tools.domed.log_payload import LogLine, payload_lines
+
+_KEEPALIVE_OPTIONS = (
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.keepalive_permit_without_calls", 0),
+)
+_MAX_GRPC_RETRY_ATTEMPTS = 5
+_channels_lock = Lock()
+_channels: dict[tuple[str, int, float], Any] = {}
+_EVENT_TYPE_LOG: int | None = None
 
 
 @dataclass(slots=True)
 class DomedClientConfig:
     endpoint: str | None = None
+    # Propagate the caller's OpenTelemetry context to domed (no-op without opentelemetry).
+    tracing: bool = True
+    # Attempts per call (gRPC caps this at 5); only UNAVAILABLE is retried, with
+    # exponential backoff starting at initial_backoff_seconds.
+    max_attempts: int = 3
+    initial_backoff_seconds: float = 0.05
+    # Reuse one process-wide channel per endpoint instead of dialing per client.
+    shared_channel: bool = True
+    # Cache ListTools/GetTool responses on disk (see DescriptorCache); None disables it.
+    descriptor_cache_dir: Path | None = None
+    descriptor_cache_ttl_seconds: float = 0.0
 
 
-class DomedClient:
-    """Thin client wrapper around generated domed gRPC stubs."""
+def retry_service_config(max_attempts: int, initial_backoff_seconds: float) -> str:
+    """gRPC service config retrying UNAVAILABLE for every DomedService method."""
+    method_config: dict[str, Any] = {"name": [{"service": "domed.v1.DomedService"}]}
+    if max_attempts > 1:
+        backoff = max(initial_backoff_seconds, 0.001)
+        method_config["retryPolicy"] = {
+            "maxAttempts": max_attempts,
+            "initialBackoff": f"{backoff:.3f}s",
+            "maxBackoff": f"{max(backoff * 16, 1.0):.3f}s",
+            "backoffMultiplier": 2,
+            "retryableStatusCodes": ["UNAVAILABLE"],
+        }
+    return json.dumps({"methodConfig": [method_config]})
+
+
+def import_stubs() -> tuple[Any, Any, Any]:
+    """Return ``(grpc, domed_pb2, domed_pb2_grpc)``, with a clear error if either is missing."""
+    try:
+        import grpc  # type: ignore
+    except Exception as exc:  # pragma: no cover - dependency guard
+        raise RuntimeError("grpc dependency missing; install grpcio/protobuf to use DomedClient") from exc
+
+    generated_root = Path(__file__).resolve().parents[2] / "generated" / "python"
+    if str(generated_root) not in sys.path:
+        sys.path.insert(0, str(generated_root))
+
+    try:
+        from domed.v1 import domed_pb2, domed_pb2_grpc
+    except Exception as exc:  # pragma: no cover - dependency guard
+        raise RuntimeError("generated domed stubs unavailable; run tools/domed/gen.sh") from exc
+    return grpc, domed_pb2, domed_pb2_grpc
+
+
+def retry_settings(cfg: DomedClientConfig) -> tuple[int, float]:
+    return min(max(int(cfg.max_attempts), 1), _MAX_GRPC_RETRY_ATTEMPTS), float(cfg.initial_backoff_seconds)
+
+
+def channel_options(max_attempts: int, initial_backoff_seconds: float) -> list[tuple[str, Any]]:
+    return [
+        *_KEEPALIVE_OPTIONS,
+        ("grpc.enable_retries", 1),
+        ("grpc.service_config", retry_service_config(max_attempts, initial_backoff_seconds)),
+    ]
+
+
+def skill_execute_request(
+    pb2: Any,
+    *,
+    skill_id: str,
+    profile: str,
+    idempotency_key: str,
+    task: dict[str, Any],
+    constraints: dict[str, Any] | None = None,
+) -> Any:
+    return pb2.SkillExecuteRequest(
+        skill_id=skill_id,
+        profile=profile,
+        idempotency_key=idempotency_key,
+        task_json=json.dumps(task, sort_keys=True),
+        constraints_json=json.dumps(constraints or {}, sort_keys=True),
+    )
+
+
+def skill_execute_batch_request(pb2: Any, items: list[dict[str, Any]]) -> Any:
+    return pb2.SkillExecuteBatchRequest(
+        requests=[
+            skill_execute_request(
+                pb2,
+                skill_id=item["skill_id"],
+                profile=item["profile"],
+                idempotency_key=item["idempotency_key"],
+                task=item.get("task", {}),
+                constraints=item.get("constraints"),
+            )
+            for item in items
+        ]
+    )
+
+
+def _log_event_type() -> int:
+    # Resolved once: import_stubs() costs more than decoding a whole chunk.
+    global _EVENT_TYPE_LOG
+    if _EVENT_TYPE_LOG is None:
+        _EVENT_TYPE_LOG = int(import_stubs()[1].EVENT_TYPE_LOG)
+    return _EVENT_TYPE_LOG
+
+
+def event_log_lines(evt: Any, *, after: dict[str, int] | None = None) -> list[LogLine]:
+    """Log lines carried by one ``StreamJobEventsResponse``, chunked or single-line.
+
+    ``after`` maps stream -> last line number already consumed; a reader resuming from the
+    ``seq`` of a partly read chunk passes it to skip lines it has seen.
+    """
+    if evt.event_type != _log_event_type():
+        return []
+    try:
+        payload = json.loads(evt.payload_json)
+    except ValueError:
+        return []
+    if not isinstance(payload, dict):
+        return []
+    lines = payload_lines(payload, int(evt.seq))
+    if after:
+        lines = [
+            line for line in lines if line.line_no is None or line.line_no > after.get(line.stream, -1)
+        ]
+    return lines
+
+
+def iter_log_lines(events: Iterable[Any], *, after: dict[str, int] | None = None) -> Iterator[LogLine]:
+    """Flatten a ``stream_job_events`` iterator into individual log lines."""
+    for evt in events:
+        yield from event_log_lines(evt, after=after)
+
+
+def list_jobs_request(
+    pb2: Any,
+    *,
+    states: list[int] | None = None,
+    skill_id: str = "",
+    profile: str = "",
+    updated_after: float = 0.0,
+    updated_before: float = 0.0,
+    page_size: int = 0,
+    page_token: str = "",
+) -> Any:
+    return pb2.ListJobsRequest(
+        states=list(states or []),
+        skill_id=skill_id,
+        profile=profile,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        page_size=page_size,
+        page_token=page_token,
+    )
+
+
+def _message_dict(message: Any) -> dict[str, Any]:
+    from google.protobuf import json_format
+
+    return json_format.MessageToDict(message, preserving_proto_field_name=True)
 
-    def __init__(self, cfg: DomedClientConfig) -> None:
-        try:
-            import grpc  # type: ignore
-        except Exception as exc:  # pragma: no cover - dependency guard
-            raise RuntimeError("grpc dependency missing; install grpcio/protobuf to use DomedClient") from exc
 
-        generated_root = Path(__file__).resolve().parents[2] / "generated" / "python"
-        if str(generated_root) not in sys.path:
-            sys.path.insert(0, str(generated_root))
+def _shared_channel(grpc: Any, endpoint: str, max_attempts: int, initial_backoff_seconds: float) -> Any:
+    key = (endpoint, max_attempts, initial_backoff_seconds)
+    with _channels_lock:
+        channel = _channels.get(key)
+        if channel is None:
+            channel = grpc.insecure_channel(endpoint, options=channel_options(max_attempts, initial_backoff_seconds))
+            _channels[key] = channel
+        return channel
 
-        try:
-            from domed.v1 import domed_pb2, domed_pb2_grpc
-        except Exception as exc:  # pragma: no cover - dependency guard
-            raise RuntimeError("generated domed stubs unavailable; run tools/domed/gen.sh") from exc
 
+def close_shared_channels() -> None:
+    """Close every cached channel; later clients dial fresh ones."""
+    with _channels_lock:
+        channels = list(_channels.values())
+        _channels.clear()
+    for channel in channels:
+        channel.close()
+
+
+atexit.register(close_shared_channels)
+
+
+class DomedClient:
+    """Thin client wrapper around generated domed gRPC stubs.
+
+    Clients for the same endpoint share one cached channel by default, so constructing a
+    client per call is cheap; ``close()`` (or leaving a ``with`` block) only closes channels
+    the client owns, i.e. when ``shared_channel`` is False.
+    """
+
+    _descriptors: DescriptorCache | None = None
+
+    def __init__(self, cfg: DomedClientConfig) -> None:
+        grpc, domed_pb2, domed_pb2_grpc = import_stubs()
         self._pb2 = domed_pb2
         endpoint = cfg.endpoint or default_client_endpoint()
-        self._channel = grpc.insecure_channel(endpoint)
-        self._stub = domed_pb2_grpc.DomedServiceStub(self._channel)
+        max_attempts, backoff = retry_settings(cfg)
+        self._owns_channel = not cfg.shared_channel
+        if self._owns_channel:
+            self._channel = grpc.insecure_channel(endpoint, options=channel_options(max_attempts, backoff))
+        else:
+            self._channel = _shared_channel(grpc, endpoint, max_attempts, backoff)
+        channel = self._channel
+        if cfg.tracing:
+            from tools.domed.tracing import TracingClientInterceptor, tracing_available
+
+            if tracing_available():
+                channel = grpc.intercept_channel(channel, TracingClientInterceptor())
+        self._stub = domed_pb2_grpc.DomedServiceStub(channel)
+        if cfg.descriptor_cache_dir is not None:
+            self._descriptors = DescriptorCache(
+                Path(cfg.descriptor_cache_dir),
+                endpoint,
+                ttl_seconds=cfg.descriptor_cache_ttl_seconds,
+            )
+
+    def close(self) -> None:
+        if getattr(self, "_owns_channel", False):
+            self._channel.close()
+
+    def __enter__(self) -> "DomedClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     def health(self) -> Any:
         return self._stub.Health(self._pb2.HealthRequest())
 
-    def list_capabilities(self, profile: str) -> Any:
-        return self._stub.ListCapabilities(self._pb2.ListCapabilitiesRequest(profile=profile))
+    def list_capabilities(self, profile: str, *, if_none_match: str = "") -> Any:
+        return self._stub.ListCapabilities(
+            self._pb2.ListCapabilitiesRequest(profile=profile, if_none_match=if_none_match)
+        )
 
     def list_tools(self) -> Any:
-        return self._stub.ListTools(self._pb2.ListToolsRequest())
+        cache = self._descriptors
+        if cache is None:
+            return self._stub.ListTools(self._pb2.ListToolsRequest())
+        data = cache.load()
+        cached = data["tools"]
+        if cached is not None and cache.fresh(data):
+            return self._cached(self._pb2.ListToolsResponse, cached)
+        etag = data["registry_version"] if cached is not None else ""
+        resp = self._stub.ListTools(self._pb2.ListToolsRequest(if_none_match=etag))
+        if resp.not_modified and cached is not None:
+            cache.validated(data)
+            return self._cached(self._pb2.ListToolsResponse, cached)
+        if resp.status.ok:
+            cache.store(data, resp.registry_version, tools=_message_dict(resp))
+        return resp
 
     def get_tool(self, tool_id: str) -> Any:
-        return self._stub.GetTool(self._pb2.GetToolRequest(tool_id=tool_id))
+        cache = self._descriptors
+        if cache is None:
+            return self._stub.GetTool(self._pb2.GetToolRequest(tool_id=tool_id))
+        data = cache.load()
+        cached = data["descriptors"].get(tool_id)
+        if cached is not None:
+            if cache.fresh(data):
+                return self._cached(self._pb2.GetToolResponse, cached)
+            probe = self._stub.ListTools(self._pb2.ListToolsRequest(if_none_match=data["registry_version"]))
+            if probe.not_modified:
+                cache.validated(data)
+                return self._cached(self._pb2.GetToolResponse, cached)
+            if probe.status.ok:
+                cache.store(data, probe.registry_version, tools=_message_dict(probe))
+        resp = self._stub.GetTool(self._pb2.GetToolRequest(tool_id=tool_id))
+        if resp.status.ok:
+            cache.store(data, resp.registry_version, tool=(tool_id, _message_dict(resp)))
+        return resp
+
+    @staticmethod
+    def _cached(message_type: Any, payload: dict[str, Any]) -> Any:
+        from google.protobuf import json_format
+
+        return json_format.ParseDict(payload, message_type())
 
     def skill_execute(
         self,
@@ -59,18 +310,53 @@ class DomedClient:
         constraints: dict[str, Any] | None = None,
     ) -> Any:
         return self._stub.SkillExecute(
-            self._pb2.SkillExecuteRequest(
+            skill_execute_request(
+                self._pb2,
                 skill_id=skill_id,
                 profile=profile,
                 idempotency_key=idempotency_key,
-                task_json=json.dumps(task, sort_keys=True),
-                constraints_json=json.dumps(constraints or {}, sort_keys=True),
+                task=task,
+                constraints=constraints,
             )
         )
 
+    def skill_execute_batch(self, items: list[dict[str, Any]]) -> Any:
+        """Submit many jobs in one round trip; each item takes the skill_execute kwargs."""
+        return self._stub.SkillExecuteBatch(skill_execute_batch_request(self._pb2, items))
+
     def get_job_status(self, job_id: str) -> Any:
         return self._stub.GetJobStatus(self._pb2.GetJobStatusRequest(job_id=job_id))
 
+    def get_job_status_batch(self, job_ids: list[str]) -> Any:
+        return self._stub.GetJobStatusBatch(self._pb2.GetJobStatusBatchRequest(job_ids=list(job_ids)))
+
+    def list_jobs(
+        self,
+        *,
+        states: list[int] | None = None,
+        skill_id: str = "",
+        profile: str = "",
+        updated_after: float = 0.0,
+        updated_before: float = 0.0,
+        page_size: int = 0,
+        page_token: str = "",
+    ) -> Any:
+        return self._stub.ListJobs(
+            list_jobs_request(
+                self._pb2,
+                states=states,
+                skill_id=skill_id,
+                profile=profile,
+                updated_after=updated_after,
+                updated_before=updated_before,
+                page_size=page_size,
+                page_token=page_token,
+            )
+        )
+
+    def get_metrics(self, *, include_prometheus_text: bool = False) -> Any:
+        return self._stub.GetMetrics(self._pb2.GetMetricsRequest(include_prometheus_text=include_prometheus_text))
+
     def cancel_job(self, *, job_id: str, idempotency_key: str) -> Any:
         return self._stub.CancelJob(
             self._pb2.CancelJobRequest(job_id=job_id, idempotency_key=idempotency_key)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from time import time
+from typing import Any
+
+_CACHE_FORMAT = 1
+
+
+class DescriptorCache:
+    """On-disk cache of ListTools/GetTool responses for one domed endpoint.
+
+    Entries are tagged with the daemon's ``registry_version``. Within ``ttl_seconds`` of the
+    last validation they are served without any RPC; after that, one ``ListTools`` call with
+    ``if_none_match`` revalidates them. A version change drops every cached descriptor.
+    Writes replace the file atomically, so concurrent CLI processes never read a torn file.
+    """
+
+    def __init__(self, root: Path, endpoint: str, *, ttl_seconds: float = 0.0) -> None:
+        digest = hashlib.sha256(endpoint.encode("utf-8")).hexdigest()[:16]
+        self.path = root / f"{digest}.json"
+        self.endpoint = endpoint
+        self.ttl_seconds = max(float(ttl_seconds), 0.0)
+
+    def load(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self._empty("")
+        if data.get("format") != _CACHE_FORMAT or data.get("endpoint") != self.endpoint:
+            return self._empty("")
+        return data
+
+    def fresh(self, data: dict[str, Any]) -> bool:
+        return bool(data["registry_version"]) and time() - float(data.get("validated_at", 0.0)) < self.ttl_seconds
+
+    def validated(self, data: dict[str, Any]) -> None:
+        data["validated_at"] = time()
+        self._save(data)
+
+    def store(self, data: dict[str, Any], version: str, *, tools: Any = None, tool: tuple[str, Any] | None = None) -> None:
+        """Record a response; ``data`` is reset first if ``version`` differs from its own."""
+        if not version:
+            return
+        if data["registry_version"] != version:
+            data.clear()
+            data.update(self._empty(version))
+        if tools is not None:
+            data["tools"] = tools
+        if tool is not None:
+            data["descriptors"][tool[0]] = tool[1]
+        self.validated(data)
+
+    def _empty(self, version: str) -> dict[str, Any]:
+        return {
+            "format": _CACHE_FORMAT,
+            "endpoint": self.endpoint,
+            "registry_version": version,
+            "validated_at": 0.0,
+            "tools": None,
+            "descriptors": {},
+        }
+
+    def _save(self, data: dict[str, Any]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
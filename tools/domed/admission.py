@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+from tools.domed.scheduler import QueuedJob
+
+
+@dataclass(slots=True)
+class ToolLimits:
+    max_concurrency: int = 0
+    max_queue_depth: int = 0
+    profile_quota: int = 0
+
+    @property
+    def unlimited(self) -> bool:
+        return not (self.max_concurrency or self.max_queue_depth or self.profile_quota)
+
+
+def tool_limits(tool: dict[str, Any]) -> ToolLimits:
+    return ToolLimits(
+        max_concurrency=int(tool.get("max_concurrency", 0) or 0),
+        max_queue_depth=int(tool.get("max_queue_depth", 0) or 0),
+        profile_quota=int(tool.get("profile_quota", 0) or 0),
+    )
+
+
+@dataclass(slots=True)
+class _ToolSlots:
+    running: int = 0
+    waiting: int = 0
+    parked: deque[QueuedJob] = field(default_factory=deque)
+    by_profile: Counter[str] = field(default_factory=Counter)
+
+
+class AdmissionController:
+    """Per-tool concurrency, queue-depth and per-profile limits taken from tool manifests.
+
+    ``admit`` reserves a waiting slot at submit time and returns a rejection reason when the
+    tool's queue or the caller's profile quota is full. Jobs are counted as waiting until a
+    worker calls ``start``; when ``max_concurrency`` jobs are already running the job is
+    parked instead, and ``finish`` hands the next parked job back for re-enqueueing so no
+    worker thread ever blocks on a busy tool. Tools without limits bypass all bookkeeping.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._slots: dict[str, _ToolSlots] = {}
+
+    def admit(self, tool: dict[str, Any], profile: str, *, force: bool = False) -> str | None:
+        limits = tool_limits(tool)
+        if limits.unlimited:
+            return None
+        with self._lock:
+            slots = self._slots.setdefault(tool["tool_id"], _ToolSlots())
+            if force:
+                slots.waiting += 1
+                slots.by_profile[profile] += 1
+                return None
+            if limits.profile_quota and slots.by_profile[profile] >= limits.profile_quota:
+                return f"profile quota exhausted for {tool['tool_id']}: {profile} ({limits.profile_quota} active)"
+            queue_full = limits.max_queue_depth and slots.waiting >= limits.max_queue_depth
+            # With no queue depth configured, only admit what can start right away.
+            no_capacity = (
+                not limits.max_queue_depth
+                and limits.max_concurrency
+                and slots.running + slots.waiting >= limits.max_concurrency
+            )
+            if queue_full or no_capacity:
+                return f"tool saturated: {tool['tool_id']} running={slots.running} waiting={slots.waiting}"
+            slots.waiting += 1
+            slots.by_profile[profile] += 1
+            return None
+
+    def release(self, tool: dict[str, Any], profile: str) -> None:
+        """Give back a reservation from ``admit`` for a job that was never enqueued."""
+        if tool_limits(tool).unlimited:
+            return
+        with self._lock:
+            slots = self._slots[tool["tool_id"]]
+            slots.waiting -= 1
+            self._drop_profile(slots, profile)
+
+    def start(self, item: QueuedJob) -> bool:
+        limits = tool_limits(item.tool)
+        if limits.unlimited:
+            return True
+        with self._lock:
+            slots = self._slots[item.tool["tool_id"]]
+            if limits.max_concurrency and slots.running >= limits.max_concurrency:
+                slots.parked.append(item)
+                return False
+            slots.waiting -= 1
+            slots.running += 1
+            return True
+
+    def finish(self, item: QueuedJob, *, started: bool) -> QueuedJob | None:
+        """Release ``item``'s slot; returns a parked job that may now be re-enqueued."""
+        if tool_limits(item.tool).unlimited:
+            return None
+        with self._lock:
+            slots = self._slots[item.tool["tool_id"]]
+            if started:
+                slots.running -= 1
+            else:
+                slots.waiting -= 1
+            self._drop_profile(slots, item.profile)
+            return slots.parked.popleft() if slots.parked else None
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                tool_id: {"running": slots.running, "waiting": slots.waiting, "parked": len(slots.parked)}
+                for tool_id, slots in self._slots.items()
+            }
+
+    @staticmethod
+    def _drop_profile(slots: _ToolSlots, profile: str) -> None:
+        slots.by_profile[profile] -= 1
+        if slots.by_profile[profile] <= 0:
+            del slots.by_profile[profile]
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import random
+import signal
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from time import monotonic, perf_counter, sleep, time
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.codex.domed_async_client import AsyncDomedClient, gather_limited
+from tools.codex.domed_client import DomedClientConfig, event_log_lines, import_stubs
+
+_TERMINAL_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELED"}
+_DEFAULT_MIX = "job.noop=4,job.log=4,domed.exec-probe=1"
+
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Load-test a domed daemon over a unix socket")
+    p.add_argument("--store", nargs="+", choices=["sqlite", "memory"], default=["memory", "sqlite"])
+    p.add_argument("--server-mode", choices=["thread", "aio"], default="thread")
+    p.add_argument("--jobs", type=int, default=400, help="jobs submitted per store")
+    p.add_argument("--clients", type=int, default=8, help="concurrent clients, one channel each")
+    p.add_argument("--concurrency", type=int, default=8, help="jobs in flight per client")
+    p.add_argument("--mix", default=_DEFAULT_MIX, help="weighted tool mix, e.g. job.noop=4,job.log=1")
+    p.add_argument("--log-lines", type=int, default=50, help="lines per job.log job (the daemon keeps 100)")
+    p.add_argument("--poll-fraction", type=float, default=0.25, help="share of jobs awaited via GetJobStatus")
+    p.add_argument("--poll-interval-ms", type=float, default=5.0)
+    p.add_argument("--extra-followers", type=int, default=0, help="additional StreamJobEvents followers per job")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--daemon-arg", action="append", default=[], help="extra daemon flag, repeatable")
+    return p.parse_args()
+
+
+def parse_mix(spec: str) -> list[tuple[str, int]]:
+    mix: list[tuple[str, int]] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        tool_id, _, weight = part.partition("=")
+        mix.append((tool_id.strip(), int(weight or 1)))
+    if not mix or any(weight < 0 for _, weight in mix) or sum(w for _, w in mix) == 0:
+        raise ValueError(f"invalid tool mix: {spec!r}")
+    return mix
+
+
+def percentiles(values: list[float]) -> dict[str, float | None]:
+    """Nearest-rank p50/p95/p99 (and max) in milliseconds of ``values`` given in seconds."""
+    out: dict[str, float | None] = {}
+    ordered = sorted(values)
+    for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99), ("max", 1.0)):
+        if not ordered:
+            out[name] = None
+            continue
+        idx = min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.999999) - 1))
+        out[name] = round(ordered[idx] * 1000.0, 3)
+    return out
+
+
+def daemon_memory(pid: int) -> dict[str, int | None]:
+    """Current and peak resident set size of ``pid`` in KiB (Linux ``/proc`` only)."""
+    fields = {"VmRSS": None, "VmHWM": None}
+    try:
+        text = Path(f"/proc/{pid}/status").read_text(encoding="utf-8")
+    except OSError:
+        return {"rss_kib": None, "peak_rss_kib": None}
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        if key in fields:
+            fields[key] = int(value.split()[0])
+    return {"rss_kib": fields["VmRSS"], "peak_rss_kib": fields["VmHWM"]}
+
+
+@dataclass(slots=True)
+class _Samples:
+    submit: list[float] = field(default_factory=list)
+    end_to_end: list[float] = field(default_factory=list)
+    poll: list[float] = field(default_factory=list)
+    event_lag: list[float] = field(default_factory=list)
+    events: int = 0
+    log_lines: int = 0
+    states: dict[str, int] = field(default_factory=dict)
+    rejected: int = 0
+
+
+def _task_for(tool_id: str, n: int, log_lines: int) -> dict[str, Any]:
+    if tool_id == "job.log":
+        return {"lines": [f"bench line {i}" for i in range(log_lines)]}
+    if tool_id in {"domed.exec-probe", "domed.pool-probe"}:
+        return {"stdout": [f"bench {n}"], "progress": [50, 100]}
+    return {"n": n}
+
+
+async def _follow(client: AsyncDomedClient, job_id: str, samples: _Samples) -> None:
+    async for evt in client.stream_job_events(job_id=job_id, follow=True):
+        samples.events += 1
+        samples.log_lines += len(event_log_lines(evt))
+        try:
+            samples.event_lag.append(max(time() - float(evt.ts), 0.0))
+        except ValueError:
+            pass
+
+
+async def _poll(client: AsyncDomedClient, job_id: str, interval: float, samples: _Samples) -> str:
+    state_name = import_stubs()[1].JobState.Name
+    while True:
+        started = perf_counter()
+        status = await client.get_job_status(job_id)
+        samples.poll.append(perf_counter() - started)
+        name = state_name(status.state)
+        if name in _TERMINAL_STATES or not status.status.ok:
+            return name
+        await asyncio.sleep(interval)
+
+
+async def _one_job(
+    client: AsyncDomedClient,
+    *,
+    tool_id: str,
+    n: int,
+    poll: bool,
+    args: argparse.Namespace,
+    samples: _Samples,
+) -> None:
+    started = perf_counter()
+    submit = await client.skill_execute(
+        skill_id=tool_id,
+        profile="bench",
+        idempotency_key=f"bench-{os.getpid()}-{n}-{time()}",
+        task=_task_for(tool_id, n, args.log_lines),
+    )
+    samples.submit.append(perf_counter() - started)
+    if not submit.status.ok:
+        samples.rejected += 1
+        return
+    followers = [_follow(client, submit.job_id, samples) for _ in range(args.extra_followers)]
+    if poll:
+        waiter = _poll(client, submit.job_id, args.poll_interval_ms / 1000.0, samples)
+    else:
+        waiter = _follow(client, submit.job_id, samples)
+    done = await asyncio.gather(waiter, *followers)
+    samples.end_to_end.append(perf_counter() - started)
+    if poll:
+        state = done[0]
+    else:
+        status = await client.get_job_status(submit.job_id)
+        state = import_stubs()[1].JobState.Name(status.state)
+    samples.states[state] = samples.states.get(state, 0) + 1
+
+
+async def _drive(endpoint: str, args: argparse.Namespace, mix: list[tuple[str, int]]) -> tuple[_Samples, float, Any]:
+    rng = random.Random(args.seed)
+    tools = [tool_id for tool_id, _ in mix]
+    weights = [weight for _, weight in mix]
+    plan = [(rng.choices(tools, weights)[0], rng.random() < args.poll_fraction) for _ in range(args.jobs)]
+    cfg = DomedClientConfig(endpoint=endpoint, tracing=False)
+    clients = [AsyncDomedClient(cfg) for _ in range(max(args.clients, 1))]
+    samples = _Samples()
+    try:
+        await asyncio.gather(*(client.health() for client in clients))
+
+        async def _client_share(idx: int, client: AsyncDomedClient) -> None:
+            share = plan[idx :: len(clients)]
+            await gather_limited(
+                [
+                    lambda tool_id=tool_id, poll=poll, n=idx + k * len(clients): _one_job(
+                        client, tool_id=tool_id, n=n, poll=poll, args=args, samples=samples
+                    )
+                    for k, (tool_id, poll) in enumerate(share)
+                ],
+                max(args.concurrency, 1),
+            )
+
+        started = perf_counter()
+        await asyncio.gather(*(_client_share(idx, client) for idx, client in enumerate(clients)))
+        elapsed = perf_counter() - started
+        metrics = await clients[0].get_metrics()
+    finally:
+        await asyncio.gather(*(client.close() for client in clients))
+    return samples, elapsed, metrics
+
+
+def _start_daemon(store: str, td: str, args: argparse.Namespace) -> tuple[subprocess.Popen[bytes], str]:
+    bind = f"unix://{td}/domed.sock"
+    log_path = Path(td) / "domed.log"
+    with log_path.open("wb") as log:
+        proc = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "tools.domed.daemon",
+                "--store",
+                store,
+                "--bind",
+                bind,
+                "--db-path",
+                f"{td}/state.db",
+                "--server-mode",
+                args.server_mode,
+                *args.daemon_arg,
+            ],
+            cwd=ROOT,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    deadline = monotonic() + 30.0
+    while monotonic() < deadline and proc.poll() is None:
+        if b"domed listening" in log_path.read_bytes():
+            return proc, bind
+        sleep(0.02)
+    _stop_daemon(proc)
+    tail = log_path.read_text(encoding="utf-8", errors="replace")[-2000:]
+    raise RuntimeError(f"domed did not start for store={store}:\n{tail}")
+
+
+def _stop_daemon(proc: subprocess.Popen[bytes]) -> None:
+    if proc.poll() is None:
+        proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(timeout=10.0)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+def _counter_total(metrics: Any, name: str) -> float:
+    return sum(sample.value for sample in metrics.counters if sample.name == name)
+
+
+def run_store(store: str, args: argparse.Namespace) -> dict[str, Any]:
+    mix = parse_mix(args.mix)
+    with TemporaryDirectory(prefix="domed-bench-") as td:
+        proc, endpoint = _start_daemon(store, td, args)
+        try:
+            idle = daemon_memory(proc.pid)
+            samples, elapsed, metrics = asyncio.run(_drive(endpoint, args, mix))
+            loaded = daemon_memory(proc.pid)
+        finally:
+            _stop_daemon(proc)
+    finished = len(samples.end_to_end)
+    return {
+        "store": store,
+        "jobs": args.jobs,
+        "finished": finished,
+        "rejected": samples.rejected,
+        "states": dict(sorted(samples.states.items())),
+        "seconds": round(elapsed, 4),
+        "jobs_per_second": round(finished / elapsed, 1) if elapsed > 0 else None,
+        "events_received": samples.events,
+        "events_per_second": round(samples.events / elapsed, 1) if elapsed > 0 else None,
+        "log_lines_received": samples.log_lines,
+        "latency_ms": {
+            "submit": percentiles(samples.submit),
+            "end_to_end": percentiles(samples.end_to_end),
+            "poll": percentiles(samples.poll),
+            "event_lag": percentiles(samples.event_lag),
+        },
+        "daemon": {
+            "idle_rss_kib": idle["rss_kib"],
+            "rss_kib": loaded["rss_kib"],
+            "peak_rss_kib": loaded["peak_rss_kib"],
+            "rpc_total": int(_counter_total(metrics, "domed_rpc_total")),
+            "events_appended": int(_counter_total(metrics, "domed_store_events_appended_total")),
+        },
+    }
+
+
+def main() -> int:
+    args = _parse_args()
+    results = [run_store(store, args) for store in args.store]
+    json.dump(
+        {
+            "server_mode": args.server_mode,
+            "clients": args.clients,
+            "concurrency_per_client": args.concurrency,
+            "mix": args.mix,
+            "log_lines": args.log_lines,
+            "poll_fraction": args.poll_fraction,
+            "extra_followers": args.extra_followers,
+            "results": results,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.domed.runtime_state import JobRecord
+from tools.domed.sqlite_state import SQLiteRuntimeStateStore
+
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Measure SQLite state store event append throughput")
+    p.add_argument("--jobs", type=int, default=8)
+    p.add_argument("--lines", type=int, default=2000, help="log events appended per job")
+    p.add_argument("--window-ms", type=float, default=2.0, help="group-commit window")
+    p.add_argument("--batch", type=int, default=64, help="events per append_events call")
+    return p.parse_args()
+
+
+def _run(mode: str, *, jobs: int, lines: int, window_seconds: float, batch: int) -> dict[str, Any]:
+    with TemporaryDirectory(prefix="domed-bench-store-") as td:
+        store = SQLiteRuntimeStateStore(
+            f"{td}/state.db",
+            group_commit_window_seconds=0.0 if mode == "inline" else window_seconds,
+        )
+        for idx in range(jobs):
+            store.submit(
+                job=JobRecord(
+                    job_id=f"j{idx}",
+                    run_id=f"run-j{idx}",
+                    state="running",
+                    skill_id="job.log",
+                    profile="bench",
+                    idempotency_key=f"k{idx}",
+                    request_hash=f"h{idx}",
+                )
+            )
+
+        def produce(job_id: str) -> None:
+            if mode == "append_events":
+                for start in range(0, lines, batch):
+                    chunk = range(start, min(start + batch, lines))
+                    store.append_events(
+                        job_id=job_id,
+                        events=[("log", {"line": f"line {n}"}) for n in chunk],
+                    )
+                return
+            for n in range(lines):
+                store.append_event(job_id=job_id, event_type="log", payload={"line": f"line {n}"})
+
+        threads = [Thread(target=produce, args=(f"j{idx}",)) for idx in range(jobs)]
+        started = perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        store.flush()
+        elapsed = perf_counter() - started
+        total = sum(len(store.events_since(job_id=f"j{idx}", since_seq=0)) for idx in range(jobs))
+        store.close()
+    return {
+        "mode": mode,
+        "events": total,
+        "seconds": round(elapsed, 4),
+        "events_per_second": round(total / elapsed, 1) if elapsed > 0 else None,
+    }
+
+
+def main() -> int:
+    args = _parse_args()
+    results = [
+        _run(
+            mode,
+            jobs=args.jobs,
+            lines=args.lines,
+            window_seconds=args.window_ms / 1000.0,
+            batch=max(args.batch, 1),
+        )
+        for mode in ("inline", "group_commit", "append_events")
+    ]
+    json.dump({"jobs": args.jobs, "lines_per_job": args.lines, "results": results}, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,37 +1,239 @@
 from __future__ import annotations
 
 import argparse
+from contextlib import contextmanager
+import os
 from pathlib import Path
+import signal
+import sys
 from threading import Event, Thread
 import time
+from typing import TYPE_CHECKING, Iterator
 
 from tools.domed.endpoints import default_server_bind, default_sqlite_path
-from tools.domed.service import InMemoryDomedService, start_insecure_server
-from tools.domed.sqlite_state import SQLiteRuntimeStateStore
+from tools.domed.tool_registry import default_snapshot_path
+
+if TYPE_CHECKING:
+    from tools.domed.metrics import MetricsRegistry
+    from tools.domed.service import AsyncDomedService, InMemoryDomedService
+    from tools.domed.sqlite_state import SQLiteRuntimeStateStore
+
+# grpc, the generated stubs, the service and the chosen store are imported inside main() so
+# --help stays instant and --startup-profile can attribute their cost.
+_MODULE_LOADED_AT = time.perf_counter()
+
+
+class StartupProfile:
+    """Wall-clock breakdown of daemon startup, printed as ``domed startup`` lines."""
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.phases: list[tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def report(self, label: str = "ready") -> None:
+        if not self.enabled:
+            return
+        for name, seconds in self.phases:
+            print(f"domed startup phase={name} ms={seconds * 1000.0:.1f}", flush=True)
+        since_import = (time.perf_counter() - _MODULE_LOADED_AT) * 1000.0
+        boot = _process_age_ms()
+        interpreter = "" if boot is None else f" since_exec_ms={boot:.0f}"
+        print(
+            f"domed startup {label} since_daemon_import_ms={since_import:.1f}{interpreter} "
+            f"modules={len(sys.modules)}",
+            flush=True,
+        )
+        self.phases.clear()
+
+
+def _process_age_ms() -> float | None:
+    """Time since this process was exec'd, from /proc (clock-tick resolution, Linux only)."""
+    try:
+        start_ticks = int(Path("/proc/self/stat").read_text().rsplit(")", 1)[1].split()[19])
+        uptime = float(Path("/proc/uptime").read_text().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return (uptime - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000.0
 
 
 def _parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="domed runtime daemon")
     p.add_argument("--bind", default=default_server_bind())
     p.add_argument("--db-path", default=str(default_sqlite_path()))
+    p.add_argument("--store", choices=["sqlite", "memory"], default="sqlite", help="runtime state backend")
+    p.add_argument("--max-events-per-job", type=int, default=10_000, help="memory store per-job event ring size")
+    p.add_argument("--max-total-events", type=int, default=1_000_000, help="memory store global event budget")
     p.add_argument("--ttl-seconds", type=int, default=86400)
     p.add_argument("--gc-interval-seconds", type=int, default=300)
+    p.add_argument("--gc-chunk-size", type=int, default=500, help="jobs deleted per GC transaction")
+    p.add_argument("--executor-workers", type=int, default=4)
+    p.add_argument("--result-cache-entries", type=int, default=1024, help="LRU size of the cacheable-tool result cache")
+    p.add_argument("--result-cache-ttl-seconds", type=float, default=3600.0)
+    p.add_argument("--result-cache-max-bytes", type=int, default=64 << 20, help="event bytes the result cache may hold")
+    p.add_argument("--result-cache-max-entry-bytes", type=int, default=1 << 20, help="larger results are not cached")
+    p.add_argument("--pool-warm-workers", type=int, default=1, help="python-pool workers pre-started per tool")
+    p.add_argument("--read-pool-size", type=int, default=4, help="read-only SQLite connections")
+    p.add_argument("--server-mode", choices=["thread", "aio"], default="thread")
+    p.add_argument("--rpc-workers", type=int, default=8, help="RPC thread pool size in thread mode")
+    p.add_argument("--store-workers", type=int, default=4, help="store offload threads in aio mode")
+    p.add_argument("--stream-buffer-size", type=int, default=256, help="max events buffered per stream in aio mode")
+    p.add_argument("--metrics-file", default="", help="periodically write Prometheus text-format metrics here")
+    p.add_argument("--metrics-interval-seconds", type=float, default=15.0)
+    p.add_argument(
+        "--trace-exporter",
+        choices=["none", "console", "file"],
+        default="none",
+        help="export OpenTelemetry spans for RPCs and job execution",
+    )
+    p.add_argument("--trace-file", default="", help="JSON-lines span output for --trace-exporter=file")
+    p.add_argument(
+        "--registry-snapshot",
+        default=str(default_snapshot_path()),
+        help="precompiled tool registry from tools/domed/registry_snapshot.py; ignored if missing or stale",
+    )
+    p.add_argument("--startup-profile", action="store_true", help="print an import/startup time breakdown")
     return p.parse_args()
 
 
-def _gc_loop(stop_evt: Event, store: SQLiteRuntimeStateStore, ttl_seconds: int, interval_seconds: int) -> None:
+def _gc_loop(
+    stop_evt: Event,
+    store: SQLiteRuntimeStateStore,
+    ttl_seconds: int,
+    interval_seconds: int,
+    chunk_size: int,
+) -> None:
     while not stop_evt.is_set():
         try:
-            deleted = store.gc(ttl_seconds=ttl_seconds)
-            if deleted:
-                print(f"domed gc deleted_jobs={deleted}", flush=True)
+            report = store.gc_report(ttl_seconds=ttl_seconds, chunk_size=chunk_size)
+            if report.jobs or report.pages_reclaimed:
+                print(
+                    f"domed gc deleted_jobs={report.jobs} deleted_events={report.events} "
+                    f"deleted_idempotency={report.idempotency} chunks={report.chunks} "
+                    f"pages_reclaimed={report.pages_reclaimed} seconds={report.seconds:.3f}",
+                    flush=True,
+                )
         except Exception as exc:  # noqa: BLE001
             print(f"domed gc error: {exc}", flush=True)
         stop_evt.wait(timeout=interval_seconds)
 
 
+def write_metrics_file(path: Path, metrics: MetricsRegistry) -> None:
+    """Atomically replace ``path`` with a Prometheus text dump (textfile-collector style)."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(metrics.render_prometheus(), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _metrics_loop(stop_evt: Event, path: Path, metrics: MetricsRegistry, interval_seconds: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        try:
+            write_metrics_file(path, metrics)
+        except OSError as exc:
+            print(f"domed metrics write error: {exc}", flush=True)
+        if stop_evt.wait(timeout=max(interval_seconds, 0.1)):
+            return
+
+
+def _install_reload_handler(service: InMemoryDomedService) -> None:
+    if not hasattr(signal, "SIGHUP"):
+        return
+
+    def _on_sighup(_signum: int, _frame: object) -> None:
+        snap = service.registry.reload()
+        print(f"domed registry reloaded tool_count={len(snap.tools)}", flush=True)
+
+    signal.signal(signal.SIGHUP, _on_sighup)
+
+
+def _warm_up(service: InMemoryDomedService, pool_warm_workers: int, profile: StartupProfile) -> None:
+    """Work only the first job needs, run alongside the listener instead of ahead of it."""
+    from tools.domed.tracing import tracing_available
+
+    with profile.phase("warm_executors"):
+        service.warm_executors(pool_warm_workers)
+    with profile.phase("import_opentelemetry"):
+        tracing_available()
+    profile.report("warm")
+
+
+def _serve_threaded(
+    bind: str,
+    service: InMemoryDomedService,
+    rpc_workers: int,
+    banner: str,
+    tracing: bool,
+    profile: StartupProfile,
+) -> None:
+    from tools.domed.service import start_insecure_server
+    from tools.domed.tracing import TracingServerInterceptor
+
+    with profile.phase("start_server"):
+        server, port, _ = start_insecure_server(
+            bind=bind,
+            service=service,
+            max_workers=rpc_workers,
+            interceptors=[TracingServerInterceptor()] if tracing else None,
+        )
+    print(f"domed listening bind={bind} port={port} {banner}", flush=True)
+    profile.report()
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop(grace=2).wait()
+
+
+async def _serve_async(
+    bind: str,
+    service: AsyncDomedService,
+    banner: str,
+    tracing: bool,
+    profile: StartupProfile,
+) -> None:
+    from tools.domed.service import start_async_server
+    from tools.domed.tracing import AsyncTracingServerInterceptor
+
+    with profile.phase("start_server"):
+        server, port, _ = await start_async_server(
+            bind=bind,
+            service=service,
+            interceptors=[AsyncTracingServerInterceptor()] if tracing else None,
+        )
+    print(f"domed listening bind={bind} port={port} {banner}", flush=True)
+    profile.report()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=2)
+
+
 def main() -> int:
     args = _parse_args()
+    profile = StartupProfile(args.startup_profile)
+    with profile.phase("import_grpc"):
+        import grpc  # noqa: F401
+    with profile.phase("import_service"):
+        from tools.domed import service as domed_service
+        from tools.domed.result_cache import ResultCache
+        from tools.domed.tracing import configure_tracing
+    with profile.phase(f"import_store_{args.store}"):
+        if args.store == "memory":
+            from tools.domed.runtime_state import RuntimeStateStore as store_cls
+        else:
+            from tools.domed.sqlite_state import SQLiteRuntimeStateStore as store_cls
+    with profile.phase("configure_tracing"):
+        tracing = configure_tracing(args.trace_exporter, path=args.trace_file)
     db_path = Path(args.db_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
     bind = str(args.bind)
@@ -41,29 +243,81 @@ def main() -> int:
         if sock_path.exists():
             sock_path.unlink()
 
-    store = SQLiteRuntimeStateStore(str(db_path))
-    service = InMemoryDomedService(store=store)
-    server, port, _ = start_insecure_server(bind=bind, service=service)
+    with profile.phase("open_store"):
+        if args.store == "memory":
+            store = store_cls(
+                max_events_per_job=args.max_events_per_job,
+                max_total_events=args.max_total_events,
+            )
+        else:
+            store = store_cls(str(db_path), read_pool_size=args.read_pool_size)
+    with profile.phase("init_service"):
+        service = domed_service.InMemoryDomedService(
+            store=store,
+            executor_workers=args.executor_workers,
+            registry=domed_service.default_tool_registry(
+                snapshot_path=Path(args.registry_snapshot) if args.registry_snapshot else None
+            ),
+            result_cache=ResultCache(
+                max_entries=args.result_cache_entries,
+                ttl_seconds=args.result_cache_ttl_seconds,
+                max_bytes=args.result_cache_max_bytes,
+                max_entry_bytes=args.result_cache_max_entry_bytes,
+            ),
+        )
+    with profile.phase("load_registry"):
+        service.registry.snapshot()
+    _install_reload_handler(service)
 
     stop_evt = Event()
-    gc_thread = Thread(
-        target=_gc_loop,
-        args=(stop_evt, store, args.ttl_seconds, args.gc_interval_seconds),
+    if args.store == "sqlite":
+        Thread(
+            target=_gc_loop,
+            args=(stop_evt, store, args.ttl_seconds, args.gc_interval_seconds, args.gc_chunk_size),
+            daemon=True,
+            name="domed-gc",
+        ).start()
+
+    if args.metrics_file:
+        Thread(
+            target=_metrics_loop,
+            args=(stop_evt, Path(args.metrics_file), service.metrics, args.metrics_interval_seconds),
+            daemon=True,
+            name="domed-metrics",
+        ).start()
+
+    warm_profile = StartupProfile(args.startup_profile)
+    Thread(
+        target=_warm_up,
+        args=(service, args.pool_warm_workers, warm_profile),
         daemon=True,
-        name="domed-gc",
-    )
-    gc_thread.start()
+        name="domed-warmup",
+    ).start()
 
-    print(f"domed listening bind={bind} port={port} db={db_path}", flush=True)
+    location = f"db={db_path}" if args.store == "sqlite" else "store=memory"
+    banner = f"{location} mode={args.server_mode} executor_workers={args.executor_workers} tracing={tracing}"
     try:
-        while True:
-            time.sleep(1.0)
-    except KeyboardInterrupt:
-        pass
+        if args.server_mode == "aio":
+            import asyncio
+
+            async_service = domed_service.AsyncDomedService(
+                service,
+                store_workers=args.store_workers,
+                stream_buffer_size=args.stream_buffer_size,
+            )
+            try:
+                asyncio.run(_serve_async(bind, async_service, banner, tracing, profile))
+            except KeyboardInterrupt:
+                pass
+            finally:
+                async_service.close()
+        else:
+            _serve_threaded(bind, service, args.rpc_workers, banner, tracing, profile)
     finally:
         stop_evt.set()
-        server.stop(grace=2).wait()
-        store.close()
+        service.close()
+        if args.store == "sqlite":
+            store.close()
     return 0
 
 
@@ -26,6 +26,10 @@ def default_sqlite_path() -> Path:
     return default_state_home() / "dome" / "domed.sqlite"
 
 
+def default_descriptor_cache_dir() -> Path:
+    return default_state_home() / "dome" / "descriptor-cache"
+
+
 def default_client_endpoint() -> str:
     env = os.environ.get("DOMED_ENDPOINT")
     if env:
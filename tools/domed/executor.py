@@ -2,9 +2,44 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from threading import Lock
 from typing import Any, Callable, Protocol
 
 
+class CancelToken:
+    """Cancellation handle shared by the service and one running execution.
+
+    Executors register how to stop their work with ``on_cancel``; ``cancel`` runs those
+    callbacks once. A callback registered after cancellation runs immediately.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cancelled = False
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def cancel(self) -> bool:
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+        return True
+
+
 @dataclass(slots=True)
 class ExecutionRequest:
     run_id: str
@@ -17,6 +52,7 @@ class ExecutionRequest:
     cwd: Path
     timeout_seconds: int = 120
     env_allowlist: list[str] | None = None
+    cancel_token: CancelToken | None = None
 
 
 @dataclass(slots=True)
@@ -3,71 +3,303 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
+from queue import Empty, Full, Queue
+import signal
 import subprocess
+from threading import Event, Lock, Thread, Timer
+from time import monotonic, sleep
+from typing import IO
 
 from tools.domed.executor import ExecutionEvent, ExecutionRequest, ExecutionResult
+from tools.domed.log_chunks import LogChunker
+
+_DRAIN_AFTER_KILL_SECONDS = 1.0
+
+
+def signal_process_group(proc: subprocess.Popen, sig: int) -> None:
+    """Send ``sig`` to the process group led by ``proc`` (started with a new session)."""
+    try:
+        os.killpg(proc.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+class CancelGuard:
+    """Terminate a process group on cancel until the process is reaped or ``release``d.
+
+    Signalling and reaping both happen under one lock, so a cancel racing with ``wait`` (or
+    with a pool worker going back to idle) either signals a still-owned process or does
+    nothing; a reaped pid, which may already belong to someone else, is never signalled.
+    """
+
+    def __init__(self, proc: subprocess.Popen, grace_seconds: float) -> None:
+        self._proc = proc
+        self._grace_seconds = grace_seconds
+        self._lock = Lock()
+        self._released = False
+        self._timer: Timer | None = None
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._released or self._timer is not None:
+                return
+            signal_process_group(self._proc, signal.SIGTERM)
+            self._timer = Timer(self._grace_seconds, self._kill)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _kill(self) -> None:
+        with self._lock:
+            if not self._released:
+                signal_process_group(self._proc, signal.SIGKILL)
+
+    def wait(self, timeout: float | None = None) -> int:
+        """``Popen.wait`` that reaps and releases under the guard lock.
+
+        Polls with the same backoff as ``Popen.wait`` with a timeout, and raises
+        ``subprocess.TimeoutExpired`` the same way.
+        """
+        end = None if timeout is None else monotonic() + timeout
+        delay = 0.0005
+        while True:
+            with self._lock:
+                returncode = self._proc.poll()
+                if returncode is not None:
+                    self._release_locked()
+                    return returncode
+            if end is not None:
+                remaining = end - monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(self._proc.args, timeout)
+                delay = min(delay, remaining)
+            sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+    def release(self) -> bool:
+        """Ignore later cancels and drop a pending SIGKILL; True if the group was signalled."""
+        with self._lock:
+            return self._release_locked()
+
+    def _release_locked(self) -> bool:
+        self._released = True
+        if self._timer is None:
+            return False
+        self._timer.cancel()
+        return True
+
+
+def _pump(pipe: IO[bytes], stream: str, out: Queue, max_line_bytes: int, stop: Event) -> None:
+    def _put(item: tuple[str, str | None]) -> None:
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    try:
+        for raw in iter(lambda: pipe.readline(max_line_bytes), b""):
+            _put((stream, raw.decode("utf-8", errors="replace").rstrip("\r\n")))
+    except (OSError, ValueError):
+        pass
+    finally:
+        _put((stream, None))
+        try:
+            pipe.close()
+        except OSError:
+            pass
 
 
 class LocalProcessExecutor:
+    """Run a tool entrypoint as a child process and stream its output as it arrives.
+
+    stdout and stderr are read concurrently by two pump threads into a bounded line queue and
+    reach the sink while the child runs, coalesced into chunked ``log`` events of up to
+    ``log_chunk_lines`` lines / ``log_chunk_bytes`` bytes, each held at most
+    ``log_flush_seconds``. Lines longer than ``max_line_bytes`` are split, and once a stream has
+    produced ``max_stream_bytes`` the rest of it is drained and dropped after a single
+    truncation marker.
+
+    Each child leads its own process group. On timeout the group is SIGKILLed; on
+    cancellation through ``request.cancel_token`` it gets SIGTERM and, after
+    ``cancel_grace_seconds``, SIGKILL.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_line_bytes: int = 64 * 1024,
+        max_stream_bytes: int = 16 * 1024 * 1024,
+        queue_lines: int = 1024,
+        cancel_grace_seconds: float = 0.5,
+        log_chunk_lines: int = 256,
+        log_chunk_bytes: int = 64 * 1024,
+        log_flush_seconds: float = 0.05,
+    ) -> None:
+        self.max_line_bytes = max(int(max_line_bytes), 1)
+        self.max_stream_bytes = max(int(max_stream_bytes), 0)
+        self.queue_lines = max(int(queue_lines), 1)
+        self.cancel_grace_seconds = max(float(cancel_grace_seconds), 0.0)
+        self.log_chunk_lines = log_chunk_lines
+        self.log_chunk_bytes = log_chunk_bytes
+        self.log_flush_seconds = log_flush_seconds
+
     def execute(self, request: ExecutionRequest, sink) -> ExecutionResult:  # type: ignore[no-untyped-def]
         if not request.entrypoint:
             return ExecutionResult(terminal_state="failed", exit_code=127, message="empty entrypoint")
 
-        env = os.environ.copy()
-        if request.env_allowlist:
-            env = {k: v for k, v in env.items() if k in set(request.env_allowlist)}
-        env["DOMED_RUN_ID"] = request.run_id
-        env["DOMED_JOB_ID"] = request.job_id
-        env["DOMED_TOOL_ID"] = request.tool_id
-        env["DOMED_PROFILE"] = request.profile
-        env["DOMED_TASK_JSON"] = json.dumps(request.task, sort_keys=True)
-        env["DOMED_CONSTRAINTS_JSON"] = json.dumps(request.constraints, sort_keys=True)
+        env = self._job_env(request)
 
         try:
             proc = subprocess.Popen(
                 request.entrypoint,
                 cwd=str(request.cwd),
                 env=env,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
+                start_new_session=True,
             )
-            stdout, stderr = proc.communicate(timeout=request.timeout_seconds)
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            stdout, stderr = proc.communicate()
-            if stdout:
-                for line in stdout.splitlines():
-                    sink(ExecutionEvent(kind="log", payload={"stream": "stdout", "line": line}))
-            if stderr:
-                for line in stderr.splitlines():
-                    sink(ExecutionEvent(kind="log", payload={"stream": "stderr", "line": line}))
+        except OSError as exc:
+            sink(ExecutionEvent(kind="error", payload={"reason": f"executor spawn failed: {exc}"}))
+            return ExecutionResult(terminal_state="failed", exit_code=127, message="spawn failed")
+
+        guard = CancelGuard(proc, self.cancel_grace_seconds)
+        if request.cancel_token is not None:
+            request.cancel_token.on_cancel(guard.cancel)
+
+        lines: Queue = Queue(maxsize=self.queue_lines)
+        stop = Event()
+        for pipe, stream in ((proc.stdout, "stdout"), (proc.stderr, "stderr")):
+            Thread(
+                target=_pump,
+                args=(pipe, stream, lines, self.max_line_bytes, stop),
+                daemon=True,
+                name=f"domed-pump-{request.job_id}-{stream}",
+            ).start()
+
+        chunker = self._chunker(sink)
+        emitted = {"stdout": 0, "stderr": 0}
+        truncated: set[str] = set()
+        open_streams = 2
+        timed_out = False
+        deadline = monotonic() + request.timeout_seconds
+        drain_deadline = 0.0
+        try:
+            while open_streams:
+                if not timed_out:
+                    wait = deadline - monotonic()
+                    if wait <= 0:
+                        timed_out = True
+                        signal_process_group(proc, signal.SIGKILL)
+                        drain_deadline = monotonic() + _DRAIN_AFTER_KILL_SECONDS
+                        continue
+                else:
+                    wait = drain_deadline - monotonic()
+                    if wait <= 0:
+                        break
+                try:
+                    stream, line = lines.get(timeout=max(chunker.deadline(monotonic() + wait) - monotonic(), 0.0))
+                except Empty:
+                    chunker.flush_due()
+                    continue
+                if line is None:
+                    open_streams -= 1
+                    continue
+                self._emit(stream, line, chunker, emitted, truncated)
+        finally:
+            stop.set()
+            chunker.flush()
+        try:
+            return self._finish(proc, guard, request, sink, timed_out, deadline)
+        finally:
+            guard.release()
+
+    def _finish(  # type: ignore[no-untyped-def]
+        self,
+        proc: subprocess.Popen,
+        guard: CancelGuard,
+        request: ExecutionRequest,
+        sink,
+        timed_out: bool,
+        deadline: float,
+    ) -> ExecutionResult:
+        if request.cancel_token is not None and request.cancel_token.cancelled:
+            returncode = guard.wait()
+            return ExecutionResult(terminal_state="canceled", exit_code=int(returncode or 1), message="canceled")
+
+        if timed_out:
+            guard.wait()
             sink(ExecutionEvent(kind="error", payload={"reason": "executor timeout"}))
             return ExecutionResult(terminal_state="failed", exit_code=124, message="executor timeout")
 
-        if stdout:
-            for line in stdout.splitlines():
-                sink(ExecutionEvent(kind="log", payload={"stream": "stdout", "line": line}))
-                if line.startswith("PROGRESS:"):
-                    raw = line.removeprefix("PROGRESS:").strip()
-                    try:
-                        value = float(raw)
-                    except ValueError:
-                        continue
-                    sink(ExecutionEvent(kind="progress", payload={"value": value}))
-        if stderr:
-            for line in stderr.splitlines():
-                sink(ExecutionEvent(kind="log", payload={"stream": "stderr", "line": line}))
+        try:
+            returncode = guard.wait(timeout=max(deadline - monotonic(), 0.0))
+        except subprocess.TimeoutExpired:
+            signal_process_group(proc, signal.SIGKILL)
+            guard.wait()
+            sink(ExecutionEvent(kind="error", payload={"reason": "executor timeout"}))
+            return ExecutionResult(terminal_state="failed", exit_code=124, message="executor timeout")
 
-        if proc.returncode == 0:
+        if returncode == 0:
             return ExecutionResult(terminal_state="succeeded", exit_code=0, message="ok")
         return ExecutionResult(
             terminal_state="failed",
-            exit_code=int(proc.returncode or 1),
+            exit_code=int(returncode or 1),
             message="non-zero exit",
         )
 
+    @staticmethod
+    def _job_env(request: ExecutionRequest) -> dict[str, str]:
+        env = os.environ.copy()
+        if request.env_allowlist:
+            env = {k: v for k, v in env.items() if k in set(request.env_allowlist)}
+        env["DOMED_RUN_ID"] = request.run_id
+        env["DOMED_JOB_ID"] = request.job_id
+        env["DOMED_TOOL_ID"] = request.tool_id
+        env["DOMED_PROFILE"] = request.profile
+        env["DOMED_TASK_JSON"] = json.dumps(request.task, sort_keys=True)
+        env["DOMED_CONSTRAINTS_JSON"] = json.dumps(request.constraints, sort_keys=True)
+        return env
+
+    def _chunker(self, sink) -> LogChunker:  # type: ignore[no-untyped-def]
+        return LogChunker(
+            sink,
+            max_lines=self.log_chunk_lines,
+            max_bytes=self.log_chunk_bytes,
+            max_delay_seconds=self.log_flush_seconds,
+        )
+
+    def _emit(
+        self,
+        stream: str,
+        line: str,
+        chunker: LogChunker,
+        emitted: dict[str, int],
+        truncated: set[str],
+    ) -> None:
+        if stream in truncated:
+            return
+        size = len(line.encode("utf-8"))
+        if emitted[stream] + size > self.max_stream_bytes:
+            truncated.add(stream)
+            chunker.event(
+                ExecutionEvent(
+                    kind="log",
+                    payload={"stream": stream, "truncated": True, "limit_bytes": self.max_stream_bytes},
+                )
+            )
+            return
+        emitted[stream] += size
+        chunker.line(stream, line)
+        if stream == "stdout" and line.startswith("PROGRESS:"):
+            raw = line.removeprefix("PROGRESS:").strip()
+            try:
+                value = float(raw)
+            except ValueError:
+                return
+            chunker.event(ExecutionEvent(kind="progress", payload={"value": value}))
+
 
 def repo_root_from_file(path: Path) -> Path:
     return path.resolve().parents[3]
-
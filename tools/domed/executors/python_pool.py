@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import json
+from queue import Empty, Queue
+import signal
+import subprocess
+import sys
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any
+
+from tools.domed.executor import ExecutionEvent, ExecutionRequest, ExecutionResult
+from tools.domed.executors.local_process import (
+    CancelGuard,
+    LocalProcessExecutor,
+    signal_process_group,
+)
+
+_WORKER_MODULE = "tools.domed.executors.python_worker"
+_WORKER_START_TIMEOUT_SECONDS = 30.0
+_WORKER_STOP_TIMEOUT_SECONDS = 2.0
+
+
+def python_module_from_entrypoint(entrypoint: list[str]) -> str | None:
+    """Return ``mod`` for an entrypoint of the form ``[python, "-m", mod]``."""
+    if len(entrypoint) == 3 and entrypoint[1] == "-m" and "python" in entrypoint[0]:
+        return entrypoint[2]
+    return None
+
+
+class _Worker:
+    def __init__(self, module: str, cwd: str) -> None:
+        self.key = (module, cwd)
+        self.jobs = 0
+        self.baseline_kb = 0
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", _WORKER_MODULE, module],
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.frames: Queue[dict[str, Any] | None] = Queue()
+        Thread(target=self._read, daemon=True, name=f"domed-pyworker-{self.proc.pid}").start()
+
+    def _read(self) -> None:
+        assert self.proc.stdout is not None
+        try:
+            for raw in self.proc.stdout:
+                try:
+                    self.frames.put(json.loads(raw))
+                except ValueError:
+                    continue
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.frames.put(None)
+
+    def next_frame(self, deadline: float) -> dict[str, Any] | None:
+        """Next frame, ``None`` once the worker exits; raises ``Empty`` past ``deadline``."""
+        return self.frames.get(timeout=max(deadline - monotonic(), 0.0))
+
+    def send(self, request: dict[str, Any]) -> bool:
+        assert self.proc.stdin is not None
+        try:
+            self.proc.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+            self.proc.stdin.flush()
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def kill(self) -> None:
+        signal_process_group(self.proc, signal.SIGKILL)
+        self.proc.wait()
+
+    def close(self) -> None:
+        try:
+            if self.proc.stdin is not None:
+                self.proc.stdin.close()
+            self.proc.wait(timeout=_WORKER_STOP_TIMEOUT_SECONDS)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+
+class PythonPoolExecutor(LocalProcessExecutor):
+    """Run Python tool modules in warm, reusable worker processes.
+
+    Each worker imports the tool module once and then serves one job at a time over its
+    stdin/stdout pipes, so a job pays a JSON round trip instead of interpreter start-up and
+    imports. Workers are spawned rather than forked because the daemon is multi-threaded.
+    A worker is retired after ``max_jobs_per_worker`` jobs, when its peak RSS has grown by more
+    than ``max_rss_growth_bytes`` since start-up, or when a job times out. Up to
+    ``max_idle_per_module`` idle workers are kept per module. Output limits and event shapes
+    match ``LocalProcessExecutor``; cancelling a job terminates its worker's process group.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_module: int = 2,
+        max_jobs_per_worker: int = 100,
+        max_rss_growth_bytes: int = 256 * 1024 * 1024,
+        max_line_bytes: int = 64 * 1024,
+        max_stream_bytes: int = 16 * 1024 * 1024,
+        log_chunk_lines: int = 256,
+        log_chunk_bytes: int = 64 * 1024,
+        log_flush_seconds: float = 0.05,
+    ) -> None:
+        super().__init__(
+            max_line_bytes=max_line_bytes,
+            max_stream_bytes=max_stream_bytes,
+            log_chunk_lines=log_chunk_lines,
+            log_chunk_bytes=log_chunk_bytes,
+            log_flush_seconds=log_flush_seconds,
+        )
+        self.max_idle_per_module = max(int(max_idle_per_module), 0)
+        self.max_jobs_per_worker = max(int(max_jobs_per_worker), 1)
+        self.max_rss_growth_kb = max(int(max_rss_growth_bytes), 0) // 1024
+        self._lock = Lock()
+        self._idle: dict[tuple[str, str], list[_Worker]] = {}
+        self._closed = False
+
+    def warm(self, module: str, cwd: str, count: int = 1) -> None:
+        """Start idle workers for ``module`` ahead of the first job."""
+        for _ in range(max(count, 0)):
+            worker = self._spawn(module, cwd)
+            if worker is not None:
+                self._release(worker)
+
+    def idle_count(self, module: str, cwd: str) -> int:
+        with self._lock:
+            return len(self._idle.get((module, cwd), ()))
+
+    def execute(self, request: ExecutionRequest, sink) -> ExecutionResult:  # type: ignore[no-untyped-def]
+        module = python_module_from_entrypoint(request.entrypoint)
+        if module is None:
+            return ExecutionResult(
+                terminal_state="failed",
+                exit_code=127,
+                message="python-pool entrypoint must be [python, -m, module]",
+            )
+        cwd = str(request.cwd)
+        deadline = monotonic() + request.timeout_seconds
+        worker = self._acquire(module, cwd)
+        if worker is None or not worker.send({"env": self._job_env(request)}):
+            if worker is not None:
+                worker.kill()
+            sink(ExecutionEvent(kind="error", payload={"reason": f"python worker unavailable: {module}"}))
+            return ExecutionResult(terminal_state="failed", exit_code=127, message="spawn failed")
+
+        guard = CancelGuard(worker.proc, self.cancel_grace_seconds)
+        if request.cancel_token is not None:
+            request.cancel_token.on_cancel(guard.cancel)
+        try:
+            return self._run(worker, request, sink, deadline, guard)
+        finally:
+            guard.release()
+
+    def _run(  # type: ignore[no-untyped-def]
+        self,
+        worker: _Worker,
+        request: ExecutionRequest,
+        sink,
+        deadline: float,
+        guard: CancelGuard,
+    ) -> ExecutionResult:
+        chunker = self._chunker(sink)
+        emitted = {"stdout": 0, "stderr": 0}
+        truncated: set[str] = set()
+        while True:
+            try:
+                frame = worker.next_frame(chunker.deadline(deadline))
+            except Empty:
+                if monotonic() < deadline:
+                    chunker.flush_due()
+                    continue
+                chunker.flush()
+                worker.kill()
+                sink(ExecutionEvent(kind="error", payload={"reason": "executor timeout"}))
+                return ExecutionResult(terminal_state="failed", exit_code=124, message="executor timeout")
+            if frame is None:
+                chunker.flush()
+                worker.kill()
+                if request.cancel_token is not None and request.cancel_token.cancelled:
+                    return ExecutionResult(
+                        terminal_state="canceled",
+                        exit_code=int(worker.proc.returncode or 1),
+                        message="canceled",
+                    )
+                sink(ExecutionEvent(kind="error", payload={"reason": "python worker exited mid-job"}))
+                return ExecutionResult(terminal_state="failed", exit_code=1, message="worker died")
+            if "exit" in frame:
+                break
+            line = str(frame.get("line", ""))
+            stream = "stderr" if frame.get("stream") == "stderr" else "stdout"
+            for start in range(0, max(len(line), 1), self.max_line_bytes):
+                self._emit(stream, line[start : start + self.max_line_bytes], chunker, emitted, truncated)
+        chunker.flush()
+
+        # Past this point a late cancel must not touch the worker, which may be reused. A cancel
+        # that got in first has already signalled it, so it cannot go back to the idle pool.
+        if guard.release():
+            worker.kill()
+            return ExecutionResult(
+                terminal_state="canceled",
+                exit_code=int(worker.proc.returncode or 1),
+                message="canceled",
+            )
+        worker.jobs += 1
+        grown_kb = int(frame.get("maxrss_kb", 0)) - worker.baseline_kb
+        if worker.jobs >= self.max_jobs_per_worker or (self.max_rss_growth_kb and grown_kb > self.max_rss_growth_kb):
+            worker.close()
+        else:
+            self._release(worker)
+
+        returncode = int(frame["exit"])
+        if returncode == 0:
+            return ExecutionResult(terminal_state="succeeded", exit_code=0, message="ok")
+        return ExecutionResult(terminal_state="failed", exit_code=returncode, message="non-zero exit")
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = [w for idle in self._idle.values() for w in idle]
+            self._idle.clear()
+        for worker in workers:
+            worker.close()
+
+    def _acquire(self, module: str, cwd: str) -> _Worker | None:
+        with self._lock:
+            idle = self._idle.get((module, cwd))
+            while idle:
+                worker = idle.pop()
+                if worker.proc.poll() is None:
+                    return worker
+        return self._spawn(module, cwd)
+
+    def _release(self, worker: _Worker) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(worker.key, [])
+            if not self._closed and len(idle) < self.max_idle_per_module:
+                idle.append(worker)
+                return
+        worker.close()
+
+    def _spawn(self, module: str, cwd: str) -> _Worker | None:
+        try:
+            worker = _Worker(module, cwd)
+        except OSError:
+            return None
+        try:
+            ready = worker.next_frame(monotonic() + _WORKER_START_TIMEOUT_SECONDS)
+        except Empty:
+            ready = None
+        if not ready or not ready.get("ready"):
+            worker.kill()
+            return None
+        worker.baseline_kb = int(ready.get("maxrss_kb", 0))
+        return worker
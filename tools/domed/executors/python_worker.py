@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import importlib
+import io
+import json
+import os
+import resource
+import sys
+from threading import Lock
+import traceback
+from typing import IO, Any
+
+# Worker side of PythonPoolExecutor: import one tool module once, then run its entry function
+# for each job request read from a private copy of the original stdin. Output is framed as JSON
+# lines on a private copy of the original stdout; fds 0 and 1 themselves are pointed at
+# /dev/null so a tool can neither read request frames nor corrupt the output framing.
+
+
+class _FrameChannel:
+    def __init__(self, out: IO[str]) -> None:
+        self._out = out
+        self._lock = Lock()
+
+    def send(self, frame: dict[str, Any]) -> None:
+        with self._lock:
+            self._out.write(json.dumps(frame) + "\n")
+            self._out.flush()
+
+
+class _FrameWriter(io.TextIOBase):
+    def __init__(self, channel: _FrameChannel, stream: str) -> None:
+        self._channel = channel
+        self._stream = stream
+        self._partial = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        data = self._partial + text
+        *lines, self._partial = data.split("\n")
+        for line in lines:
+            self._channel.send({"stream": self._stream, "line": line.rstrip("\r")})
+        return len(text)
+
+    def close(self) -> None:
+        if self._partial:
+            self._channel.send({"stream": self._stream, "line": self._partial})
+            self._partial = ""
+        super().close()
+
+
+def _maxrss_kb() -> int:
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def _exit_code(code: object) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def main(argv: list[str]) -> int:
+    module_name = argv[1]
+    func_name = argv[2] if len(argv) > 2 else "main"
+    channel = _FrameChannel(os.fdopen(os.dup(1), "w", encoding="utf-8"))
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+
+    module = importlib.import_module(module_name)
+    target = getattr(module, func_name)
+    # What ``python -m module`` would leave in sys.argv, so argparse-based tools see no stray
+    # arguments (the worker's own argv names the module) and agree with LocalProcessExecutor.
+    tool_argv = [str(getattr(module, "__file__", None) or module_name)]
+    channel.send({"ready": True, "pid": os.getpid(), "maxrss_kb": _maxrss_kb()})
+
+    base_stdin, base_stdout, base_stderr = sys.stdin, sys.stdout, sys.stderr
+    for raw in requests:
+        try:
+            request = json.loads(raw)
+        except ValueError:
+            continue
+        os.environ.clear()
+        os.environ.update(request.get("env", {}))
+        out = _FrameWriter(channel, "stdout")
+        err = _FrameWriter(channel, "stderr")
+        # Tools see an empty stdin, as under LocalProcessExecutor (stdin=DEVNULL).
+        sys.stdin, sys.stdout, sys.stderr = io.StringIO(), out, err
+        sys.argv = list(tool_argv)
+        try:
+            code = _exit_code(target())
+        except SystemExit as exc:
+            code = _exit_code(exc.code)
+        except BaseException:  # noqa: BLE001
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = base_stdin, base_stdout, base_stderr
+            out.close()
+            err.close()
+        channel.send({"exit": code, "maxrss_kb": _maxrss_kb()})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -75,4 +75,7 @@ cat > "${MANIFEST_FILE}" <<EOF
 }
 EOF
 
+# Machine-local (keyed on manifest mtimes) and gitignored; lets the daemon skip manifest parsing.
+"${VENV_DIR}/bin/python" "${SCRIPT_DIR}/registry_snapshot.py" >/dev/null
+
 echo "generated domed proto artifacts"
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from time import monotonic
+
+from tools.domed.executor import ExecutionEvent, ExecutionEventSink
+from tools.domed.log_payload import chunk_payload
+
+
+class LogChunker:
+    """Coalesce per-line executor output into chunked ``log`` events.
+
+    Lines are buffered per stream and flushed as one event once a buffer holds ``max_lines``
+    lines or ``max_bytes`` bytes, or its oldest line is ``max_delay_seconds`` old. Line
+    numbers are counted per stream, so chunks stay addressable after a resume. The executor
+    loop must call ``flush_due`` when it wakes (``deadline`` says when) and route every other
+    event through ``event`` so nothing overtakes buffered lines.
+    """
+
+    def __init__(
+        self,
+        sink: ExecutionEventSink,
+        *,
+        max_lines: int = 256,
+        max_bytes: int = 64 * 1024,
+        max_delay_seconds: float = 0.05,
+    ) -> None:
+        self._sink = sink
+        self.max_lines = max(int(max_lines), 1)
+        self.max_bytes = max(int(max_bytes), 1)
+        self.max_delay_seconds = max(float(max_delay_seconds), 0.0)
+        self._buffers: dict[str, list[str]] = {}
+        self._sizes: dict[str, int] = {}
+        self._since: dict[str, float] = {}
+        self._next_line: dict[str, int] = {}
+
+    def line(self, stream: str, text: str) -> None:
+        buf = self._buffers.setdefault(stream, [])
+        if not buf:
+            self._since[stream] = monotonic()
+            self._sizes[stream] = 0
+        buf.append(text)
+        self._sizes[stream] += len(text.encode("utf-8"))
+        if (
+            len(buf) >= self.max_lines
+            or self._sizes[stream] >= self.max_bytes
+            or monotonic() - self._since[stream] >= self.max_delay_seconds
+        ):
+            self._flush_stream(stream)
+
+    def event(self, evt: ExecutionEvent) -> None:
+        self.flush()
+        self._sink(evt)
+
+    def deadline(self, limit: float) -> float:
+        """The earlier of ``limit`` and the next time-based flush (monotonic clock)."""
+        for stream, buf in self._buffers.items():
+            if buf:
+                limit = min(limit, self._since[stream] + self.max_delay_seconds)
+        return limit
+
+    def flush_due(self) -> None:
+        now = monotonic()
+        for stream in self._pending():
+            if now - self._since[stream] >= self.max_delay_seconds:
+                self._flush_stream(stream)
+
+    def flush(self) -> None:
+        for stream in self._pending():
+            self._flush_stream(stream)
+
+    def _pending(self) -> list[str]:
+        # Oldest buffer first, so interleaved streams come out roughly in arrival order.
+        return sorted((s for s, buf in self._buffers.items() if buf), key=self._since.__getitem__)
+
+    def _flush_stream(self, stream: str) -> None:
+        buf = self._buffers.get(stream)
+        if not buf:
+            return
+        first = self._next_line.get(stream, 0)
+        self._buffers[stream] = []
+        self._next_line[stream] = first + len(buf)
+        self._sink(ExecutionEvent(kind="log", payload=chunk_payload(stream, buf, first)))
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+# Wire shape of ``log`` event payloads, shared by the daemon (which writes them) and the thin
+# client (which reads them); keep this module free of daemon imports.
+
+
+@dataclass(slots=True, frozen=True)
+class LogLine:
+    stream: str
+    line_no: int | None
+    text: str
+    seq: int = 0
+
+
+def chunk_payload(stream: str, lines: list[str], first_line: int) -> dict[str, Any]:
+    """``log`` event payload for ``lines``, the ``first_line``-th onward (zero-based) of ``stream``."""
+    return {
+        "stream": stream,
+        "lines": lines,
+        "first_line": first_line,
+        "last_line": first_line + len(lines) - 1,
+    }
+
+
+def chunk_lines(stream: str, lines: Iterable[str], *, max_lines: int = 256) -> list[dict[str, Any]]:
+    """Split an already complete list of lines into chunk payloads."""
+    out: list[dict[str, Any]] = []
+    block: list[str] = []
+    first = 0
+    for line in lines:
+        block.append(line)
+        if len(block) >= max_lines:
+            out.append(chunk_payload(stream, block, first))
+            first += len(block)
+            block = []
+    if block:
+        out.append(chunk_payload(stream, block, first))
+    return out
+
+
+def payload_lines(payload: dict[str, Any], seq: int = 0) -> list[LogLine]:
+    """Lines carried by one ``log`` payload: a chunk, a legacy single ``line``, or none."""
+    stream = str(payload.get("stream", "stdout"))
+    lines = payload.get("lines")
+    if isinstance(lines, list):
+        first = int(payload.get("first_line", 0))
+        return [LogLine(stream, first + idx, str(text), seq) for idx, text in enumerate(lines)]
+    if "line" in payload:
+        return [LogLine(stream, None, str(payload["line"]), seq)]
+    return []
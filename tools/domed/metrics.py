@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Iterator
+
+LabelSet = tuple[tuple[str, str], ...]
+GaugeFn = Callable[[], "dict[LabelSet, float] | float"]
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+LOCK_WAIT_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+
+def labels(**values: str) -> LabelSet:
+    return tuple(sorted((k, str(v)) for k, v in values.items()))
+
+
+@dataclass(slots=True)
+class HistogramValue:
+    bounds: tuple[float, ...]
+    counts: list[int]
+    count: int = 0
+    total: float = 0.0
+
+
+@dataclass(slots=True)
+class MetricsSnapshot:
+    counters: dict[tuple[str, LabelSet], float] = field(default_factory=dict)
+    gauges: dict[tuple[str, LabelSet], float] = field(default_factory=dict)
+    histograms: dict[tuple[str, LabelSet], HistogramValue] = field(default_factory=dict)
+
+
+class MetricsRegistry:
+    """Minimal in-process counters, gauges and fixed-bucket histograms.
+
+    Counters and histograms are updated inline under one short lock; gauges (and counters a
+    component already keeps itself) are callbacks sampled only when a snapshot is taken, so
+    they cost nothing on the hot path. Series that are too hot for the shared lock keep their
+    own ``HistogramValue`` and ``attach_histogram`` it, to be read at snapshot time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counters: dict[tuple[str, LabelSet], float] = {}
+        self._histograms: dict[tuple[str, LabelSet], HistogramValue] = {}
+        self._attached: list[tuple[tuple[str, LabelSet], HistogramValue]] = []
+        self._counter_fns: dict[str, GaugeFn] = {}
+        self._gauges: dict[str, GaugeFn] = {}
+        self._help: dict[str, str] = {}
+
+    def describe(self, name: str, text: str) -> None:
+        self._help[name] = text
+
+    def inc(self, name: str, value: float = 1.0, label_set: LabelSet = ()) -> None:
+        key = (name, label_set)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        label_set: LabelSet = (),
+        *,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        key = (name, label_set)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = HistogramValue(bounds=buckets, counts=[0] * (len(buckets) + 1))
+            hist.counts[bisect_left(hist.bounds, value)] += 1
+            hist.count += 1
+            hist.total += value
+
+    def gauge(self, name: str, fn: GaugeFn) -> None:
+        self._gauges[name] = fn
+
+    def counter(self, name: str, fn: GaugeFn) -> None:
+        """Export a monotonically increasing value the caller already tracks as a counter."""
+        self._counter_fns[name] = fn
+
+    def attach_histogram(self, name: str, label_set: LabelSet, hist: HistogramValue) -> None:
+        """Include ``hist``, updated by its owner without this registry's lock, in snapshots."""
+        with self._lock:
+            self._attached.append(((name, label_set), hist))
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {
+                key: HistogramValue(bounds=h.bounds, counts=list(h.counts), count=h.count, total=h.total)
+                for key, h in self._histograms.items()
+            }
+            attached = list(self._attached)
+        for key, h in attached:
+            # Read without the owner's lock: derive count from the copied buckets so the
+            # sample is self-consistent even if an update lands mid-copy.
+            counts = list(h.counts)
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = HistogramValue(bounds=h.bounds, counts=counts, count=sum(counts), total=h.total)
+                continue
+            merged.counts = [a + b for a, b in zip(merged.counts, counts)]
+            merged.count += sum(counts)
+            merged.total += h.total
+        _sample_callbacks(counters, self._counter_fns)
+        gauges: dict[tuple[str, LabelSet], float] = {}
+        _sample_callbacks(gauges, self._gauges)
+        return MetricsSnapshot(counters=counters, gauges=gauges, histograms=histograms)
+
+    def render_prometheus(self) -> str:
+        snap = self.snapshot()
+        out: list[str] = []
+        for kind, samples in (("counter", snap.counters), ("gauge", snap.gauges)):
+            for name in sorted({name for name, _ in samples}):
+                out.extend(self._header(name, kind))
+                for (sample_name, label_set), value in sorted(samples.items()):
+                    if sample_name == name:
+                        out.append(f"{name}{_fmt_labels(label_set)} {_fmt_value(value)}")
+        for name in sorted({name for name, _ in snap.histograms}):
+            out.extend(self._header(name, "histogram"))
+            for (sample_name, label_set), hist in sorted(snap.histograms.items(), key=lambda item: item[0]):
+                if sample_name != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip((*hist.bounds, float("inf")), hist.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _fmt_value(bound)
+                    out.append(f"{name}_bucket{_fmt_labels(label_set + (('le', le),))} {cumulative}")
+                out.append(f"{name}_sum{_fmt_labels(label_set)} {_fmt_value(hist.total)}")
+                out.append(f"{name}_count{_fmt_labels(label_set)} {hist.count}")
+        return "\n".join(out) + "\n"
+
+    def _header(self, name: str, kind: str) -> Iterator[str]:
+        if name in self._help:
+            yield f"# HELP {name} {self._help[name]}"
+        yield f"# TYPE {name} {kind}"
+
+
+class TimedLock:
+    """``threading.Lock`` drop-in that records how long each ``with`` waited to acquire.
+
+    The wait histogram is private to this lock and updated while holding it, so measuring
+    adds no shared lock to the path being measured; the registry reads it at snapshot time.
+    """
+
+    def __init__(self, metrics: MetricsRegistry, name: str, label_set: LabelSet = ()) -> None:
+        self._lock = Lock()
+        self._hist = HistogramValue(bounds=LOCK_WAIT_BUCKETS, counts=[0] * (len(LOCK_WAIT_BUCKETS) + 1))
+        metrics.attach_histogram(name, label_set, self._hist)
+
+    def __enter__(self) -> "TimedLock":
+        if self._lock.acquire(blocking=False):
+            waited = 0.0
+        else:
+            started = perf_counter()
+            self._lock.acquire()
+            waited = perf_counter() - started
+        hist = self._hist
+        hist.counts[bisect_left(hist.bounds, waited)] += 1
+        hist.count += 1
+        hist.total += waited
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._lock.release()
+
+
+def _sample_callbacks(out: dict[tuple[str, LabelSet], float], fns: dict[str, GaugeFn]) -> None:
+    for name, fn in list(fns.items()):
+        value = fn()
+        if isinstance(value, dict):
+            out.update({(name, label_set): float(v) for label_set, v in value.items()})
+        else:
+            out[(name, ())] = float(value)
+
+
+def _fmt_labels(label_set: LabelSet) -> str:
+    if not label_set:
+        return ""
+    body = ",".join(
+        f'{k}="{v.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34)).replace(chr(10), chr(92) + "n")}"'
+        for k, v in label_set
+    )
+    return "{" + body + "}"
+
+
+def _fmt_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
@@ -5,9 +5,14 @@ from pathlib import Path
 import platform
 import subprocess
 import sys
+from threading import Lock
 from typing import Any
 
 
+_GIT_SNAPSHOT_LOCK = Lock()
+_GIT_SNAPSHOT_CACHE: dict[str, tuple[tuple[str, int], tuple[str, bool]]] = {}
+
+
 def _git_output(args: list[str], cwd: Path) -> str:
     out = subprocess.run(
         ["git", *args],
@@ -20,9 +25,72 @@ def _git_output(args: list[str], cwd: Path) -> str:
     return value
 
 
-def collect_runtime_provenance(repo_root: Path, *, executor_backend: str, manifest_hash: str) -> dict[str, Any]:
+def _git_dir(repo_root: Path) -> Path | None:
+    dot_git = repo_root / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        text = dot_git.read_text(encoding="utf-8").strip()
+        if text.startswith("gitdir:"):
+            path = Path(text.removeprefix("gitdir:").strip())
+            return path if path.is_absolute() else (repo_root / path).resolve()
+    return None
+
+
+def _git_state_key(repo_root: Path) -> tuple[str, int] | None:
+    git_dir = _git_dir(repo_root)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if head.startswith("ref:"):
+            ref = head.removeprefix("ref:").strip()
+            ref_path = git_dir / ref
+            if ref_path.exists():
+                head = f"{ref}@{ref_path.read_text(encoding='utf-8').strip()}"
+            else:
+                head = f"{ref}@packed:{(git_dir / 'packed-refs').stat().st_mtime_ns}"
+        index_path = git_dir / "index"
+        index_mtime = index_path.stat().st_mtime_ns if index_path.exists() else -1
+    except OSError:
+        return None
+    return head, index_mtime
+
+
+def git_snapshot(repo_root: Path) -> tuple[str, bool]:
+    """Return (commit_sha, dirty_flag), cached per HEAD ref and index mtime.
+
+    Edits to tracked files that have not touched the index since the last snapshot are not
+    noticed until the next commit, checkout or index refresh.
+    """
+    key = _git_state_key(repo_root)
+    cache_key = str(repo_root.resolve())
+    if key is not None:
+        with _GIT_SNAPSHOT_LOCK:
+            cached = _GIT_SNAPSHOT_CACHE.get(cache_key)
+        if cached is not None and cached[0] == key:
+            return cached[1]
     commit_sha = _git_output(["rev-parse", "HEAD"], repo_root) or "unknown"
     dirty_flag = bool(_git_output(["status", "--porcelain"], repo_root))
+    if key is not None:
+        # `git status` may refresh the index, so re-key after the subprocesses ran.
+        key = _git_state_key(repo_root) or key
+        with _GIT_SNAPSHOT_LOCK:
+            _GIT_SNAPSHOT_CACHE[cache_key] = (key, (commit_sha, dirty_flag))
+    return commit_sha, dirty_flag
+
+
+def worktree_dirty(repo_root: Path) -> bool:
+    """Whether any tracked file differs from HEAD right now, staged or not.
+
+    Unlike ``git_snapshot`` this is never cached, so it sees edits that have not touched the
+    index. Untracked files are ignored.
+    """
+    return bool(_git_output(["status", "--porcelain", "-uno"], repo_root))
+
+
+def collect_runtime_provenance(repo_root: Path, *, executor_backend: str, manifest_hash: str) -> dict[str, Any]:
+    commit_sha, dirty_flag = git_snapshot(repo_root)
     env = {
         "python": sys.version.split()[0],
         "platform": platform.platform(),
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.domed.service import default_tool_registry
+from tools.domed.tool_registry import default_snapshot_path, write_registry_snapshot
+
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Precompile the domed tool registry for fast daemon startup")
+    p.add_argument("--out", type=Path, default=default_snapshot_path())
+    return p.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    snap = default_tool_registry().reload()
+    write_registry_snapshot(args.out, snap)
+    print(f"wrote {args.out} tool_count={len(snap.tools)} version={snap.version[:12]}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import json
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+
+ResultCacheKey = tuple[str, str, str]
+
+
+@dataclass(slots=True, frozen=True)
+class CachedResult:
+    terminal_state: str
+    events: tuple[tuple[str, dict[str, Any]], ...]
+    source_job_id: str
+    stored_at: float = field(default_factory=monotonic)
+
+
+def result_size(result: CachedResult) -> int:
+    """Approximate memory cost of ``result``: the JSON size of its event payloads."""
+    return sum(len(event_type) + len(json.dumps(payload)) for event_type, payload in result.events)
+
+
+class ResultCache:
+    """LRU + TTL cache of finished job outcomes for tools whose manifest sets ``cacheable``.
+
+    Keys are ``(tool manifest sha256, commit sha, request hash)``, so editing a manifest,
+    moving to another commit or changing any request input misses. Callers must not cache
+    results produced from a dirty tree, whose source the commit sha does not pin down.
+
+    Entries expire ``ttl_seconds`` after they were stored. The least recently used entries
+    are evicted once there are more than ``max_entries`` or their events (sized by
+    ``result_size``) exceed ``max_bytes``; a result larger than ``max_entry_bytes`` is not
+    cached at all.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+    ) -> None:
+        self.max_entries = max(int(max_entries), 0)
+        self.ttl_seconds = max(float(ttl_seconds), 0.0)
+        self.max_bytes = max(int(max_bytes), 0)
+        self.max_entry_bytes = min(max(int(max_entry_bytes), 0), self.max_bytes)
+        self._lock = Lock()
+        self._entries: OrderedDict[ResultCacheKey, CachedResult] = OrderedDict()
+        self._sizes: dict[ResultCacheKey, int] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: ResultCacheKey) -> CachedResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and monotonic() - entry.stored_at > self.ttl_seconds:
+                self._remove_locked(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: ResultCacheKey, result: CachedResult) -> None:
+        if self.max_entries == 0:
+            return
+        size = result_size(result)
+        if size > self.max_entry_bytes:
+            return
+        with self._lock:
+            self._remove_locked(key)
+            self._entries[key] = result
+            self._sizes[key] = size
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove_locked(next(iter(self._entries)))
+
+    def _remove_locked(self, key: ResultCacheKey) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.bytes -= self._sizes.pop(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
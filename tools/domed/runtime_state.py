@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from threading import Lock
+import json
+from threading import Event, Lock
 from time import time
-from typing import Any
+from typing import Any, Protocol
+
+from tools.domed.metrics import MetricsRegistry, TimedLock, labels
 
 
 TERMINAL_STATES = {"succeeded", "failed", "canceled"}
@@ -17,6 +20,20 @@ class EventRecord:
     ts_epoch: float = field(default_factory=time)
 
 
+@dataclass(slots=True)
+class RawEventRecord:
+    """Event row with its payload kept as the canonical JSON text it was stored as."""
+
+    seq: int
+    event_type: str
+    payload_json: str
+    ts_epoch: float
+
+
+def encode_payload(payload: dict[str, Any]) -> str:
+    return json.dumps(payload, sort_keys=True)
+
+
 @dataclass(slots=True)
 class JobRecord:
     job_id: str
@@ -28,57 +45,255 @@ class JobRecord:
     request_hash: str
     artifacts: list[dict[str, str]] = field(default_factory=list)
     events: list[EventRecord] = field(default_factory=list)
+    provenance: dict[str, Any] = field(default_factory=dict)
+    created_at: float = field(default_factory=time)
+    updated_at: float = field(default_factory=time)
 
 
-class RuntimeStateStore:
+class JobWaiter(Protocol):
+    def set(self) -> None:
+        ...
+
+
+class JobEventNotifier:
+    """Per-job waiter lists signalled whenever a job gains events or changes state."""
+
     def __init__(self) -> None:
         self._lock = Lock()
+        self._waiters: dict[str, list[JobWaiter]] = {}
+
+    def subscribe(self, job_id: str, waiter: JobWaiter | None = None) -> JobWaiter:
+        waiter = waiter if waiter is not None else Event()
+        with self._lock:
+            self._waiters.setdefault(job_id, []).append(waiter)
+        return waiter
+
+    def unsubscribe(self, job_id: str, waiter: JobWaiter) -> None:
+        with self._lock:
+            waiters = self._waiters.get(job_id)
+            if not waiters:
+                return
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                return
+            if not waiters:
+                del self._waiters[job_id]
+
+    def notify(self, job_id: str) -> None:
+        with self._lock:
+            waiters = list(self._waiters.get(job_id, ()))
+        for waiter in waiters:
+            waiter.set()
+
+    def subscriber_count(self, job_id: str) -> int:
+        with self._lock:
+            return len(self._waiters.get(job_id, ()))
+
+
+class RuntimeStateStore:
+    """Process-local job store.
+
+    Each job keeps at most ``max_events_per_job`` recent events, and the store as a whole at
+    most ``max_total_events``; over budget, events of terminal jobs are dropped first (oldest
+    terminal job first), then the oldest events of live jobs. Readers whose cursor falls
+    before the retained window get one synthetic ``truncated`` log marker instead. Because
+    retained events are contiguous, cursor reads are a slice: O(new events) per poll.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_events_per_job: int | None = 10_000,
+        max_total_events: int | None = 1_000_000,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self._lock = TimedLock(self.metrics, "domed_store_lock_wait_seconds", labels(store="memory"))
         self._jobs: dict[str, JobRecord] = {}
         self._idempotency: dict[tuple[str, str], tuple[str, str]] = {}
+        self._notifier = JobEventNotifier()
+        self._max_events_per_job = max(int(max_events_per_job), 1) if max_events_per_job else None
+        self._max_total_events = max(int(max_total_events), 1) if max_total_events else None
+        self._dropped: dict[str, int] = {}
+        self._terminal: dict[str, None] = {}
+        # Jobs that may still hold events, oldest first; entries whose events are all gone are
+        # removed lazily, so each budget eviction step is O(1) instead of a scan of every job.
+        self._holding: dict[str, None] = {}
+        self._total_events = 0
 
-    def submit(self, *, job: JobRecord, client_id: str = "default") -> tuple[JobRecord, bool]:
+    def subscribe(self, job_id: str, waiter: JobWaiter | None = None) -> Any:
+        return self._notifier.subscribe(job_id, waiter)
+
+    def unsubscribe(self, job_id: str, waiter: JobWaiter) -> None:
+        self._notifier.unsubscribe(job_id, waiter)
+
+    def _submit_locked(self, job: JobRecord, client_id: str) -> tuple[JobRecord, bool]:
         key = (client_id, job.idempotency_key)
+        prior = self._idempotency.get(key)
+        if prior is not None:
+            prior_request_hash, job_id = prior
+            if prior_request_hash != job.request_hash:
+                raise ValueError("idempotency key reused with different request hash")
+            return self._jobs[job_id], True
+
+        self._jobs[job.job_id] = job
+        self._idempotency[key] = (job.request_hash, job.job_id)
+        return job, False
+
+    def submit(self, *, job: JobRecord, client_id: str = "default") -> tuple[JobRecord, bool]:
         with self._lock:
-            prior = self._idempotency.get(key)
-            if prior is not None:
-                prior_request_hash, job_id = prior
-                if prior_request_hash != job.request_hash:
-                    raise ValueError("idempotency key reused with different request hash")
-                return self._jobs[job_id], True
+            return self._submit_locked(job, client_id)
 
-            self._jobs[job.job_id] = job
-            self._idempotency[key] = (job.request_hash, job.job_id)
-            return job, False
+    def submit_many(
+        self, *, jobs: list[JobRecord], client_id: str = "default"
+    ) -> list[tuple[JobRecord, bool] | ValueError]:
+        out: list[tuple[JobRecord, bool] | ValueError] = []
+        with self._lock:
+            for job in jobs:
+                try:
+                    out.append(self._submit_locked(job, client_id))
+                except ValueError as exc:
+                    out.append(exc)
+        return out
 
     def get(self, job_id: str) -> JobRecord | None:
         with self._lock:
             return self._jobs.get(job_id)
 
+    def find_idempotent(self, idempotency_key: str, client_id: str = "default") -> JobRecord | None:
+        with self._lock:
+            prior = self._idempotency.get((client_id, idempotency_key))
+            return self._jobs.get(prior[1]) if prior is not None else None
+
+    def get_many(self, job_ids: list[str]) -> dict[str, JobRecord]:
+        with self._lock:
+            return {job_id: self._jobs[job_id] for job_id in job_ids if job_id in self._jobs}
+
+    def list_jobs(
+        self,
+        *,
+        states: list[str] | None = None,
+        skill_id: str = "",
+        profile: str = "",
+        updated_after: float | None = None,
+        updated_before: float | None = None,
+        after: tuple[float, str] | None = None,
+        limit: int = 100,
+    ) -> list[JobRecord]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        out = [
+            job
+            for job in jobs
+            if (not states or job.state in states)
+            and (not skill_id or job.skill_id == skill_id)
+            and (not profile or job.profile == profile)
+            and (updated_after is None or job.updated_at >= updated_after)
+            and (updated_before is None or job.updated_at < updated_before)
+            and (after is None or (job.updated_at, job.job_id) < after)
+        ]
+        out.sort(key=lambda job: (job.updated_at, job.job_id), reverse=True)
+        return out[:limit]
+
     def transition(self, *, job_id: str, to_state: str) -> JobRecord:
         with self._lock:
             job = self._jobs[job_id]
             if job.state in TERMINAL_STATES:
                 raise ValueError(f"terminal job cannot transition: {job.state} -> {to_state}")
             job.state = to_state
-            return job
+            job.updated_at = time()
+            if to_state in TERMINAL_STATES:
+                self._terminal[job_id] = None
+        self._notifier.notify(job_id)
+        return job
 
     def cancel(self, job_id: str) -> JobRecord:
         with self._lock:
             job = self._jobs[job_id]
             if job.state not in TERMINAL_STATES:
                 job.state = "canceled"
-            return job
+            job.updated_at = time()
+            self._terminal[job_id] = None
+        self._notifier.notify(job_id)
+        return job
 
     def append_event(self, *, job_id: str, event_type: str, payload: dict[str, Any]) -> EventRecord:
+        return self.append_events(job_id=job_id, events=[(event_type, payload)])[0]
+
+    def append_events(self, *, job_id: str, events: list[tuple[str, dict[str, Any]]]) -> list[EventRecord]:
         with self._lock:
             job = self._jobs[job_id]
-            seq = len(job.events) + 1
-            evt = EventRecord(seq=seq, event_type=event_type, payload=payload)
-            job.events.append(evt)
-            return evt
+            first = self._dropped.get(job_id, 0) + len(job.events) + 1
+            records = [
+                EventRecord(seq=first + idx, event_type=event_type, payload=payload)
+                for idx, (event_type, payload) in enumerate(events)
+            ]
+            job.events.extend(records)
+            self._total_events += len(records)
+            if records:
+                self._holding.setdefault(job_id, None)
+                job.updated_at = records[-1].ts_epoch
+                if job.state in TERMINAL_STATES:
+                    self._terminal[job_id] = None
+                if self._max_events_per_job is not None and len(job.events) > self._max_events_per_job:
+                    self._drop_locked(job, len(job.events) - self._max_events_per_job)
+                self._enforce_budget_locked()
+        if records:
+            self.metrics.inc("domed_store_events_appended_total", len(records), labels(store="memory"))
+            self._notifier.notify(job_id)
+        return records
+
+    def _drop_locked(self, job: JobRecord, count: int) -> None:
+        count = min(count, len(job.events))
+        if count <= 0:
+            return
+        del job.events[:count]
+        self._dropped[job.job_id] = self._dropped.get(job.job_id, 0) + count
+        self._total_events -= count
 
-    def events_since(self, *, job_id: str, since_seq: int) -> list[EventRecord]:
+    def _enforce_budget_locked(self) -> None:
+        if self._max_total_events is None:
+            return
+        while self._total_events > self._max_total_events and self._terminal:
+            job_id = next(iter(self._terminal))
+            del self._terminal[job_id]
+            self._drop_locked(self._jobs[job_id], len(self._jobs[job_id].events))
+        while self._total_events > self._max_total_events and self._holding:
+            job_id = next(iter(self._holding))
+            job = self._jobs[job_id]
+            self._drop_locked(job, self._total_events - self._max_total_events)
+            if not job.events:
+                del self._holding[job_id]
+
+    def events_since(self, *, job_id: str, since_seq: int, limit: int | None = None) -> list[EventRecord]:
         with self._lock:
             events = self._jobs[job_id].events
-            return [evt for evt in events if evt.seq > since_seq]
+            dropped = self._dropped.get(job_id, 0)
+            out: list[EventRecord] = []
+            if since_seq < dropped:
+                out.append(
+                    EventRecord(
+                        seq=dropped,
+                        event_type="log",
+                        payload={"truncated": True, "truncated_before_seq": dropped + 1},
+                        ts_epoch=events[0].ts_epoch if events else time(),
+                    )
+                )
+                since_seq = dropped
+            start = since_seq - dropped
+            stop = None if limit is None else start + max(limit - len(out), 0)
+            out.extend(events[start:stop])
+            return out
+
+    def events_since_raw(self, *, job_id: str, since_seq: int, limit: int | None = None) -> list[RawEventRecord]:
+        return [
+            RawEventRecord(
+                seq=evt.seq,
+                event_type=evt.event_type,
+                payload_json=encode_payload(evt.payload),
+                ts_epoch=evt.ts_epoch,
+            )
+            for evt in self.events_since(job_id=job_id, since_seq=since_seq, limit=limit)
+        ]
 
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from queue import Queue
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Callable
+
+
+@dataclass(slots=True)
+class QueuedJob:
+    job_id: str
+    tool: dict[str, Any]
+    task_json: str
+    constraints_json: str
+    profile: str = ""
+    queued_at: float = field(default_factory=monotonic)
+    trace_context: dict[str, str] = field(default_factory=dict)
+
+
+QueuedJobHandler = Callable[[QueuedJob], None]
+
+
+class JobScheduler:
+    """In-daemon job queue drained by a fixed pool of executor worker threads."""
+
+    def __init__(self, handler: QueuedJobHandler, *, max_workers: int = 4) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._handler = handler
+        self._queue: Queue[QueuedJob | None] = Queue()
+        self._lock = Lock()
+        self._closed = False
+        self._workers = [
+            Thread(target=self._worker_loop, daemon=True, name=f"domed-worker-{idx}")
+            for idx in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def max_workers(self) -> int:
+        return len(self._workers)
+
+    def submit(self, item: QueuedJob) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("job scheduler is closed")
+            self._queue.put(item)
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def close(self, *, wait: bool = True, timeout: float | None = None) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in self._workers:
+                self._queue.put(None)
+        if wait:
+            for worker in self._workers:
+                worker.join(timeout=timeout)
+
+    def _worker_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._handler(item)
+            except Exception as exc:  # noqa: BLE001
+                print(f"domed worker error job_id={getattr(item, 'job_id', '')}: {exc}", flush=True)
+            finally:
+                self._queue.task_done()
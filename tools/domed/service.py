@@ -1,25 +1,50 @@
 from __future__ import annotations
 
+import asyncio
+import base64
 from concurrent import futures
+import contextvars
+from functools import partial
 import hashlib
 import json
 from pathlib import Path
 import sys
-from time import sleep, time
+from collections import Counter
+from threading import Lock
+from time import monotonic, perf_counter, time
 from typing import Any
 from uuid import uuid4
 
 import grpc  # type: ignore
 
-from tools.domed.runtime_state import JobRecord, RuntimeStateStore, TERMINAL_STATES
-from tools.domed.executor import ExecutionEvent, ExecutionRequest
+from tools.domed.admission import AdmissionController
+from tools.domed.runtime_state import JobRecord, RawEventRecord, RuntimeStateStore, TERMINAL_STATES
+from tools.domed.executor import CancelToken, ExecutionEvent, ExecutionRequest
 from tools.domed.executors.local_process import LocalProcessExecutor
-from tools.domed.provenance import collect_runtime_provenance
+from tools.domed.executors.python_pool import PythonPoolExecutor, python_module_from_entrypoint
+from tools.domed.log_payload import chunk_lines
+from tools.domed.metrics import LabelSet, MetricsRegistry, MetricsSnapshot, labels
+from tools.domed.provenance import collect_runtime_provenance, git_snapshot, worktree_dirty
+from tools.domed.result_cache import CachedResult, ResultCache, ResultCacheKey
+from tools.domed.scheduler import JobScheduler, QueuedJob
+from tools.domed.tool_registry import ToolRegistry, loader_code_version, tool_manifest_hash
+from tools.domed.tracing import inject_context, job_span
 
 _GENERATED_ROOT = Path(__file__).resolve().parents[2] / "generated" / "python"
 _ROOT = Path(__file__).resolve().parents[2]
 _TOOL_REGISTRY = _ROOT / "ssot" / "domed" / "tool_registry.v1.json"
 _TOOLS_ROOT = _ROOT / "ssot" / "tools"
+_STREAM_IDLE_RECHECK_SECONDS = 1.0
+_STREAM_TERMINAL_GRACE_SECONDS = 0.1
+_MAX_BATCH_ITEMS = 1000
+_LIST_JOBS_DEFAULT_PAGE_SIZE = 100
+_LIST_JOBS_MAX_PAGE_SIZE = 1000
+# Let DomedClient's 30s keepalive pings through on idle follow streams instead of answering
+# them with GOAWAY(too_many_pings).
+_SERVER_OPTIONS = (
+    ("grpc.http2.min_ping_interval_without_data_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+)
 if str(_GENERATED_ROOT) not in sys.path:
     sys.path.insert(0, str(_GENERATED_ROOT))
 
@@ -54,6 +79,34 @@ def _job_state_to_proto(state: str) -> int:
     return mapping.get(state, domed_pb2.JOB_STATE_UNSPECIFIED)
 
 
+def _job_state_from_proto(state: int) -> str:
+    mapping = {
+        domed_pb2.JOB_STATE_QUEUED: "queued",
+        domed_pb2.JOB_STATE_RUNNING: "running",
+        domed_pb2.JOB_STATE_SUCCEEDED: "succeeded",
+        domed_pb2.JOB_STATE_FAILED: "failed",
+        domed_pb2.JOB_STATE_CANCELED: "canceled",
+    }
+    return mapping.get(state, "")
+
+
+def _encode_page_token(job: JobRecord) -> str:
+    raw = json.dumps([job.updated_at, job.job_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_page_token(token: str) -> tuple[float, str]:
+    """Inverse of ``_encode_page_token``; raises ValueError on anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        updated_at, job_id = json.loads(raw)
+    except (TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("invalid page_token") from exc
+    if not isinstance(updated_at, (int, float)) or not isinstance(job_id, str):
+        raise ValueError("invalid page_token")
+    return float(updated_at), job_id
+
+
 def _event_type_to_proto(event_type: str) -> int:
     mapping = {
         "state_change": domed_pb2.EVENT_TYPE_STATE_CHANGE,
@@ -64,6 +117,52 @@ def _event_type_to_proto(event_type: str) -> int:
     return mapping.get(event_type, domed_pb2.EVENT_TYPE_UNSPECIFIED)
 
 
+def _event_to_proto(job_id: str, run_id: str, evt: RawEventRecord) -> Any:
+    return domed_pb2.StreamJobEventsResponse(
+        seq=evt.seq,
+        event_id=f"{job_id}-{evt.seq}",
+        ts=f"{evt.ts_epoch:.6f}",
+        run_id=run_id or "",
+        job_id=job_id,
+        event_type=_event_type_to_proto(evt.event_type),
+        payload_json=evt.payload_json,
+    )
+
+
+class _FollowCursor:
+    """Stream position plus the rule for when a terminal job has been fully drained.
+
+    Executors flip the job state before appending the closing state_change event, so a
+    follower that sees a terminal job with no new events keeps waiting until it has read
+    that event (or one short grace period elapses, e.g. when resuming past the end).
+    """
+
+    def __init__(self, since_seq: int) -> None:
+        self.seq = since_seq
+        self.terminal_seen = False
+        self.grace_pending = False
+
+    def advance(self, evt: RawEventRecord) -> None:
+        self.seq = evt.seq
+        # Only the rare state_change payloads are decoded; log payloads pass through untouched.
+        if evt.event_type == "state_change" and json.loads(evt.payload_json).get("to") in TERMINAL_STATES:
+            self.terminal_seen = True
+
+    def drained(self, job: JobRecord, events: list[RawEventRecord]) -> bool:
+        if job.state not in TERMINAL_STATES or events:
+            return False
+        if self.terminal_seen or self.grace_pending:
+            return True
+        self.grace_pending = True
+        return False
+
+    def wait_timeout(self) -> float:
+        if self.terminal_seen:
+            # The closing event has been read; re-poll at once to confirm nothing follows it.
+            return 0.0
+        return _STREAM_TERMINAL_GRACE_SECONDS if self.grace_pending else _STREAM_IDLE_RECHECK_SECONDS
+
+
 def _request_hash(req: Any) -> str:
     payload = {
         "skill_id": req.skill_id,
@@ -74,10 +173,6 @@ def _request_hash(req: Any) -> str:
     return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
 
 
-def _hash_json_payload(payload: dict[str, Any]) -> str:
-    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
-
-
 def _normalize_tool_item(item: dict[str, Any]) -> dict[str, Any]:
     description = str(item.get("description", ""))
     permissions = item.get("permissions", [])
@@ -97,6 +192,12 @@ def _normalize_tool_item(item: dict[str, Any]) -> dict[str, Any]:
     env_allowlist = item.get("env_allowlist", [])
     if not isinstance(env_allowlist, list):
         env_allowlist = []
+    limits: dict[str, int] = {}
+    for key in ("max_concurrency", "max_queue_depth", "profile_quota"):
+        try:
+            limits[key] = max(int(item.get(key, 0)), 0)
+        except Exception:
+            limits[key] = 0
     return {
         "tool_id": str(item.get("tool_id", "")),
         "version": str(item.get("version", "v1")),
@@ -112,6 +213,8 @@ def _normalize_tool_item(item: dict[str, Any]) -> dict[str, Any]:
         "entrypoint": [str(x) for x in entrypoint if str(x).strip()],
         "timeout_seconds": max(timeout_seconds, 1),
         "env_allowlist": [str(x) for x in env_allowlist],
+        "cacheable": item.get("cacheable") is True,
+        **limits,
     }
 
 
@@ -143,30 +246,24 @@ def _load_tool_registry() -> list[dict[str, Any]]:
     return out
 
 
-def _find_tool(tool_id: str) -> dict[str, Any] | None:
-    target = tool_id.strip()
-    for item in _load_tool_registry():
-        if item["tool_id"] == target:
-            return item
-    return None
+def default_tool_registry(*, snapshot_path: Path | None = None) -> ToolRegistry:
+    # Late-bound so tests that monkeypatch the loaders still drive the cache.
+    return ToolRegistry(
+        lambda: _load_tool_registry(),
+        tools_root=_TOOLS_ROOT,
+        fallback_registry=_TOOL_REGISTRY,
+        snapshot_path=snapshot_path,
+        loader_version=loader_code_version(_normalize_tool_item, _load_tool_manifests, _load_tool_registry),
+    )
 
 
-def _build_provenance(job: JobRecord) -> dict[str, Any]:
-    tool = _find_tool(job.skill_id) or {
-        "executor_backend": "unknown",
-        "tool_id": job.skill_id,
-        "version": "unknown",
-    }
-    manifest_hash = _hash_json_payload(
-        {
-            "tool_id": tool.get("tool_id"),
-            "version": tool.get("version"),
-            "executor_backend": tool.get("executor_backend"),
-            "entrypoint": tool.get("entrypoint", []),
-            "input_schema_ref": tool.get("input_schema_ref", ""),
-            "output_schema_ref": tool.get("output_schema_ref", ""),
-        }
-    )
+def _build_provenance(job: JobRecord, registry: ToolRegistry) -> dict[str, Any]:
+    tool = registry.get(job.skill_id)
+    if tool is None:
+        tool = {"executor_backend": "unknown", "tool_id": job.skill_id, "version": "unknown"}
+        manifest_hash = tool_manifest_hash(tool)
+    else:
+        manifest_hash = registry.manifest_hash(job.skill_id) or tool_manifest_hash(tool)
     return collect_runtime_provenance(
         _ROOT,
         executor_backend=str(tool.get("executor_backend", "unknown")),
@@ -174,10 +271,191 @@ def _build_provenance(job: JobRecord) -> dict[str, Any]:
     )
 
 
+def _result_cache_key(tool: dict[str, Any], job: JobRecord) -> ResultCacheKey | None:
+    """Cache key for ``job``, or ``None`` when its outcome must not be shared.
+
+    The commit sha pins the tool's source as well as its manifest, but only for a clean tree:
+    the job's provenance must name a known commit that is still HEAD, and no tracked file may
+    differ from it now. The provenance ``dirty_flag`` alone is not enough because
+    ``git_snapshot`` caches it and misses unstaged edits, so the tree is re-checked uncached.
+    """
+    if not tool.get("cacheable"):
+        return None
+    commit_sha = str(job.provenance.get("commit_sha", "unknown"))
+    if job.provenance.get("dirty_flag", True) or commit_sha == "unknown":
+        return None
+    if git_snapshot(_ROOT)[0] != commit_sha or worktree_dirty(_ROOT):
+        return None
+    return (tool_manifest_hash(tool), commit_sha, job.request_hash)
+
+
+def _metric_labels(label_set: LabelSet) -> list[Any]:
+    return [domed_pb2.MetricLabel(name=name, value=value) for name, value in label_set]
+
+
+def _metrics_to_proto(snap: MetricsSnapshot, uptime_seconds: float) -> Any:
+    return domed_pb2.GetMetricsResponse(
+        status=_status_ok(),
+        counters=[
+            domed_pb2.MetricSample(name=name, labels=_metric_labels(label_set), value=value)
+            for (name, label_set), value in sorted(snap.counters.items())
+        ],
+        gauges=[
+            domed_pb2.MetricSample(name=name, labels=_metric_labels(label_set), value=value)
+            for (name, label_set), value in sorted(snap.gauges.items())
+        ],
+        histograms=[
+            domed_pb2.HistogramSample(
+                name=name,
+                labels=_metric_labels(label_set),
+                upper_bounds=list(hist.bounds),
+                bucket_counts=hist.counts,
+                count=hist.count,
+                sum=hist.total,
+            )
+            for (name, label_set), hist in sorted(snap.histograms.items(), key=lambda item: item[0])
+        ],
+        uptime_seconds=uptime_seconds,
+    )
+
+
+def _rpc_method_name(full_method: str) -> str:
+    return full_method.rsplit("/", 1)[-1]
+
+
+def _rpc_outcome(response: Any) -> str:
+    status = getattr(response, "status", None)
+    if status is None or status.ok:
+        return "ok"
+    return domed_pb2.ErrorCode.Name(status.code)
+
+
+class MetricsServerInterceptor(grpc.ServerInterceptor):
+    """Record per-method latency and outcome of unary RPCs, and count streams opened."""
+
+    def __init__(self, metrics: MetricsRegistry) -> None:
+        self.metrics = metrics
+
+    def intercept_service(self, continuation: Any, handler_call_details: Any) -> Any:
+        handler = continuation(handler_call_details)
+        method = _rpc_method_name(handler_call_details.method)
+        if handler is None:
+            return handler
+        if handler.unary_unary is None:
+            self.metrics.inc("domed_rpc_streams_total", 1, labels(method=method))
+            return handler
+        inner = handler.unary_unary
+        metrics = self.metrics
+
+        def _timed(request: Any, context: Any) -> Any:
+            started = perf_counter()
+            outcome = "exception"
+            try:
+                response = inner(request, context)
+                outcome = _rpc_outcome(response)
+                return response
+            finally:
+                metrics.observe("domed_rpc_latency_seconds", perf_counter() - started, labels(method=method))
+                metrics.inc("domed_rpc_total", 1, labels(method=method, outcome=outcome))
+
+        return grpc.unary_unary_rpc_method_handler(
+            _timed,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+class AsyncMetricsServerInterceptor(grpc.aio.ServerInterceptor):
+    """grpc.aio counterpart of ``MetricsServerInterceptor``."""
+
+    def __init__(self, metrics: MetricsRegistry) -> None:
+        self.metrics = metrics
+
+    async def intercept_service(self, continuation: Any, handler_call_details: Any) -> Any:
+        handler = await continuation(handler_call_details)
+        method = _rpc_method_name(handler_call_details.method)
+        if handler is None:
+            return handler
+        if handler.unary_unary is None:
+            self.metrics.inc("domed_rpc_streams_total", 1, labels(method=method))
+            return handler
+        inner = handler.unary_unary
+        metrics = self.metrics
+
+        async def _timed(request: Any, context: Any) -> Any:
+            started = perf_counter()
+            outcome = "exception"
+            try:
+                response = await inner(request, context)
+                outcome = _rpc_outcome(response)
+                return response
+            finally:
+                metrics.observe("domed_rpc_latency_seconds", perf_counter() - started, labels(method=method))
+                metrics.inc("domed_rpc_total", 1, labels(method=method, outcome=outcome))
+
+        return grpc.unary_unary_rpc_method_handler(
+            _timed,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
 class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
-    def __init__(self, store: RuntimeStateStore | None = None) -> None:
+    def __init__(
+        self,
+        store: RuntimeStateStore | None = None,
+        *,
+        executor_workers: int = 4,
+        registry: ToolRegistry | None = None,
+        result_cache: ResultCache | None = None,
+    ) -> None:
         self.store = store or RuntimeStateStore()
+        self.registry = registry or default_tool_registry()
+        self.result_cache = result_cache if result_cache is not None else ResultCache()
         self.local_executor = LocalProcessExecutor()
+        self.python_pool = PythonPoolExecutor()
+        self.executors = {"local-process": self.local_executor, "python-pool": self.python_pool}
+        self.admission = AdmissionController()
+        self._running_lock = Lock()
+        self._running: dict[str, CancelToken] = {}
+        self._in_flight: Counter[str] = Counter()
+        self.scheduler = JobScheduler(self._run_queued_job, max_workers=executor_workers)
+        self.started_at = monotonic()
+        self.metrics: MetricsRegistry = self.store.metrics
+        self._register_gauges()
+
+    def _register_gauges(self) -> None:
+        m = self.metrics
+        m.describe("domed_rpc_latency_seconds", "Unary RPC handler latency.")
+        m.describe("domed_store_lock_wait_seconds", "Time spent waiting for the state store lock.")
+        m.describe("domed_store_events_appended_total", "Job events appended to the state store.")
+        m.describe("domed_store_write_errors_total", "Event batch commits that failed and were requeued for retry.")
+        m.gauge("domed_scheduler_queue_depth", self.scheduler.depth)
+        m.gauge("domed_jobs_in_flight", self._in_flight_by_tool)
+        m.gauge("domed_admission_waiting", partial(self._admission_gauge, "waiting"))
+        m.gauge("domed_admission_parked", partial(self._admission_gauge, "parked"))
+        m.gauge("domed_result_cache_entries", lambda: len(self.result_cache))
+        m.gauge("domed_result_cache_bytes", lambda: self.result_cache.bytes)
+        m.counter("domed_result_cache_hits_total", lambda: self.result_cache.hits)
+        m.counter("domed_result_cache_misses_total", lambda: self.result_cache.misses)
+
+    def _in_flight_by_tool(self) -> dict[LabelSet, float]:
+        with self._running_lock:
+            return {labels(tool=tool_id): count for tool_id, count in self._in_flight.items()}
+
+    def _admission_gauge(self, key: str) -> dict[LabelSet, float]:
+        return {labels(tool=tool_id): slot[key] for tool_id, slot in self.admission.snapshot().items()}
+
+    def close(self) -> None:
+        self.scheduler.close(wait=True, timeout=5.0)
+        self.python_pool.close()
+
+    def warm_executors(self, workers_per_tool: int = 1) -> None:
+        """Pre-start pooled workers for every ``python-pool`` tool in the registry."""
+        for tool in self.registry.tools():
+            module = python_module_from_entrypoint(list(tool.get("entrypoint", [])))
+            if tool.get("executor_backend") == "python-pool" and module:
+                self.python_pool.warm(module, str(_ROOT), workers_per_tool)
 
     def Health(self, request: Any, context: Any) -> Any:  # noqa: N802
         return domed_pb2.HealthResponse(
@@ -187,21 +465,35 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
         )
 
     def ListCapabilities(self, request: Any, context: Any) -> Any:  # noqa: N802
-        tools = _load_tool_registry()
+        snap = self.registry.snapshot()
+        if request.if_none_match and request.if_none_match == snap.version:
+            return domed_pb2.ListCapabilitiesResponse(
+                status=_status_ok("not modified"),
+                registry_version=snap.version,
+                not_modified=True,
+            )
         cap = domed_pb2.Capability(
             name="skill-execute",
             version="v1",
             schema_version="v1",
-            feature_flags=[f"tool_count:{len(tools)}", "inmemory", "stream-events"],
+            feature_flags=[f"tool_count:{len(snap.tools)}", "inmemory", "stream-events"],
         )
         return domed_pb2.ListCapabilitiesResponse(
             status=_status_ok(),
             server_version="v1",
             api_versions=["domed.v1"],
             capabilities=[cap],
+            registry_version=snap.version,
         )
 
     def ListTools(self, request: Any, context: Any) -> Any:  # noqa: N802
+        snap = self.registry.snapshot()
+        if request.if_none_match and request.if_none_match == snap.version:
+            return domed_pb2.ListToolsResponse(
+                status=_status_ok("not modified"),
+                registry_version=snap.version,
+                not_modified=True,
+            )
         tools = [
             domed_pb2.ToolSummary(
                 tool_id=item["tool_id"],
@@ -210,42 +502,45 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
                 short_description=item["short_description"],
                 kind=item["kind"],
             )
-            for item in _load_tool_registry()
+            for item in snap.tools
         ]
-        return domed_pb2.ListToolsResponse(status=_status_ok(), tools=tools)
+        return domed_pb2.ListToolsResponse(status=_status_ok(), tools=tools, registry_version=snap.version)
 
     def GetTool(self, request: Any, context: Any) -> Any:  # noqa: N802
         target = request.tool_id.strip()
-        for item in _load_tool_registry():
-            if item["tool_id"] == target:
-                return domed_pb2.GetToolResponse(
-                    status=_status_ok(),
-                    tool=domed_pb2.ToolDescriptor(
-                        tool_id=item["tool_id"],
-                        version=item["version"],
-                        title=item["title"],
-                        description=item["description"],
-                        short_description=item["short_description"],
-                        kind=item["kind"],
-                        input_schema_ref=item["input_schema_ref"],
-                        output_schema_ref=item["output_schema_ref"],
-                        executor_backend=item["executor_backend"],
-                        permissions=item["permissions"],
-                        side_effects=item["side_effects"],
-                    ),
-                )
+        snap = self.registry.snapshot()
+        item = snap.by_id.get(target)
+        if item is not None:
+            return domed_pb2.GetToolResponse(
+                status=_status_ok(),
+                registry_version=snap.version,
+                tool=domed_pb2.ToolDescriptor(
+                    tool_id=item["tool_id"],
+                    version=item["version"],
+                    title=item["title"],
+                    description=item["description"],
+                    short_description=item["short_description"],
+                    kind=item["kind"],
+                    input_schema_ref=item["input_schema_ref"],
+                    output_schema_ref=item["output_schema_ref"],
+                    executor_backend=item["executor_backend"],
+                    permissions=item["permissions"],
+                    side_effects=item["side_effects"],
+                ),
+            )
         return domed_pb2.GetToolResponse(
             status=_status_err(domed_pb2.E_NOT_FOUND, f"tool not found: {target}"),
             tool=domed_pb2.ToolDescriptor(),
+            registry_version=snap.version,
         )
 
-    def SkillExecute(self, request: Any, context: Any) -> Any:  # noqa: N802
+    def _prepare_job(self, request: Any) -> tuple[JobRecord, dict[str, Any], CachedResult | None] | Any:
         if not request.skill_id or not request.profile or not request.idempotency_key:
             return domed_pb2.SkillExecuteResponse(
                 status=_status_err(domed_pb2.E_INVALID_REQUEST, "missing required request fields"),
                 state=domed_pb2.JOB_STATE_UNSPECIFIED,
             )
-        tool = _find_tool(request.skill_id)
+        tool = self.registry.get(request.skill_id)
         if tool is None:
             return domed_pb2.SkillExecuteResponse(
                 status=_status_err(domed_pb2.E_NOT_FOUND, f"tool not found: {request.skill_id}"),
@@ -263,30 +558,220 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
             idempotency_key=request.idempotency_key,
             request_hash=_request_hash(request),
         )
-        try:
-            stored, replay = self.store.submit(job=job)
-        except ValueError as exc:
-            return domed_pb2.SkillExecuteResponse(
-                status=_status_err(domed_pb2.E_IDEMPOTENCY_KEY_REUSED, str(exc)),
-                state=domed_pb2.JOB_STATE_UNSPECIFIED,
-            )
+        job.provenance = _build_provenance(job, self.registry)
+        return job, tool, self._cached_result(tool, job)
+
+    def _cached_result(self, tool: dict[str, Any], job: JobRecord) -> CachedResult | None:
+        key = _result_cache_key(tool, job)
+        # Resolve idempotent replays first: they return the original job and must not
+        # count as cache hits or misses.
+        if key is None or self.store.find_idempotent(job.idempotency_key) is not None:
+            return None
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            job.provenance["cache_hit"] = True
+            job.provenance["cache_source_job_id"] = cached.source_job_id
+        return cached
+
+    def _admit(self, tool: dict[str, Any], job: JobRecord, cached: CachedResult | None) -> Any:
+        # Cache hits and replays never start new work; they hold a slot only until
+        # _accept_job releases it.
+        reason = self.admission.admit(tool, job.profile, force=cached is not None)
+        if reason is None:
+            return None
+        if self.store.find_idempotent(job.idempotency_key) is not None:
+            self.admission.admit(tool, job.profile, force=True)
+            return None
+        return domed_pb2.SkillExecuteResponse(
+            status=_status_err(domed_pb2.E_LOCK_CONFLICT, reason, retryable=True),
+            state=domed_pb2.JOB_STATE_UNSPECIFIED,
+        )
 
-        if not replay:
+    def _accept_job(
+        self,
+        stored: JobRecord,
+        replay: bool,
+        tool: dict[str, Any],
+        request: Any,
+        cached: CachedResult | None = None,
+    ) -> Any:
+        state = stored.state
+        if replay:
+            self.admission.release(tool, request.profile)
+        else:
             self.store.append_event(
                 job_id=stored.job_id,
                 event_type="state_change",
                 payload={"from": "unspecified", "to": "queued"},
             )
-            self._execute_job(stored.job_id, tool, request.task_json, request.constraints_json)
+        if not replay and cached is not None:
+            self.admission.release(tool, request.profile)
+            state = self._complete_from_cache(stored.job_id, tool, cached)
+        elif not replay:
+            self.metrics.inc("domed_jobs_submitted_total", 1, labels(tool=tool["tool_id"]))
+            self.scheduler.submit(
+                QueuedJob(
+                    job_id=stored.job_id,
+                    tool=tool,
+                    task_json=request.task_json,
+                    constraints_json=request.constraints_json,
+                    profile=stored.profile,
+                    trace_context=inject_context(),
+                )
+            )
 
         return domed_pb2.SkillExecuteResponse(
-            status=_status_ok("replayed" if replay else "submitted"),
+            status=_status_ok("replayed" if replay else "cached" if cached is not None else "submitted"),
             run_id=stored.run_id,
             job_id=stored.job_id,
-            state=_job_state_to_proto(stored.state),
+            state=_job_state_to_proto(state),
             artifacts=[],
         )
 
+    def _complete_from_cache(self, job_id: str, tool: dict[str, Any], cached: CachedResult) -> str:
+        if cached.events:
+            self.store.append_events(job_id=job_id, events=list(cached.events))
+        self.store.transition(job_id=job_id, to_state=cached.terminal_state)
+        self.store.append_event(
+            job_id=job_id,
+            event_type="state_change",
+            payload={
+                "from": "queued",
+                "to": cached.terminal_state,
+                "tool_id": tool["tool_id"],
+                "cache_hit": True,
+                "cache_source_job_id": cached.source_job_id,
+            },
+        )
+        return cached.terminal_state
+
+    def _remember_result(self, job_id: str, tool: dict[str, Any]) -> None:
+        job = self.store.get(job_id)
+        # Only clean successes are reusable; failures may be transient (timeouts, spawn errors).
+        if job is None or job.state != "succeeded":
+            return
+        key = _result_cache_key(tool, job)
+        if key is None:
+            return
+        events = tuple(
+            (evt.event_type, evt.payload)
+            for evt in self.store.events_since(job_id=job_id, since_seq=0)
+            if evt.event_type != "state_change"
+        )
+        self.result_cache.put(
+            key,
+            CachedResult(terminal_state=job.state, events=events, source_job_id=job_id),
+        )
+
+    def SkillExecute(self, request: Any, context: Any) -> Any:  # noqa: N802
+        prepared = self._prepare_job(request)
+        if not isinstance(prepared, tuple):
+            return prepared
+        job, tool, cached = prepared
+        rejected = self._admit(tool, job, cached)
+        if rejected is not None:
+            return rejected
+        try:
+            stored, replay = self.store.submit(job=job)
+        except ValueError as exc:
+            self.admission.release(tool, job.profile)
+            return domed_pb2.SkillExecuteResponse(
+                status=_status_err(domed_pb2.E_IDEMPOTENCY_KEY_REUSED, str(exc)),
+                state=domed_pb2.JOB_STATE_UNSPECIFIED,
+            )
+        return self._accept_job(stored, replay, tool, request, cached)
+
+    def SkillExecuteBatch(self, request: Any, context: Any) -> Any:  # noqa: N802
+        if len(request.requests) > _MAX_BATCH_ITEMS:
+            return domed_pb2.SkillExecuteBatchResponse(
+                status=_status_err(
+                    domed_pb2.E_INVALID_REQUEST,
+                    f"batch too large: {len(request.requests)} > {_MAX_BATCH_ITEMS}",
+                ),
+            )
+        responses: list[Any] = [None] * len(request.requests)
+        pending: list[tuple[int, JobRecord, dict[str, Any], CachedResult | None]] = []
+        for idx, item in enumerate(request.requests):
+            prepared = self._prepare_job(item)
+            if not isinstance(prepared, tuple):
+                responses[idx] = prepared
+                continue
+            rejected = self._admit(prepared[1], prepared[0], prepared[2])
+            if rejected is not None:
+                responses[idx] = rejected
+                continue
+            pending.append((idx, *prepared))
+
+        outcomes = self.store.submit_many(jobs=[job for _, job, _, _ in pending])
+        for (idx, job, tool, cached), outcome in zip(pending, outcomes):
+            if isinstance(outcome, ValueError):
+                self.admission.release(tool, job.profile)
+                responses[idx] = domed_pb2.SkillExecuteResponse(
+                    status=_status_err(domed_pb2.E_IDEMPOTENCY_KEY_REUSED, str(outcome)),
+                    state=domed_pb2.JOB_STATE_UNSPECIFIED,
+                )
+                continue
+            stored, replay = outcome
+            responses[idx] = self._accept_job(stored, replay, tool, request.requests[idx], cached)
+
+        return domed_pb2.SkillExecuteBatchResponse(status=_status_ok(), responses=responses)
+
+    def _run_queued_job(self, item: QueuedJob) -> None:
+        job = self.store.get(item.job_id)
+        if job is None or job.state in TERMINAL_STATES:
+            self._release_slot(item, started=False)
+            return
+        if not self.admission.start(item):
+            return
+        tool_id = str(item.tool["tool_id"])
+        started = monotonic()
+        self.metrics.observe("domed_job_queue_wait_seconds", started - item.queued_at, labels(tool=tool_id))
+        with self._running_lock:
+            self._in_flight[tool_id] += 1
+        try:
+            span_attrs = {"domed.job_id": item.job_id, "domed.tool_id": tool_id, "domed.profile": item.profile}
+            with job_span("domed.job.execute", item.trace_context, span_attrs) as span:
+                self._run_started_job(item)
+                if span is not None:
+                    finished = self.store.get(item.job_id)
+                    span.set_attribute("domed.job_state", finished.state if finished is not None else "unknown")
+        finally:
+            with self._running_lock:
+                self._in_flight[tool_id] -= 1
+                if not self._in_flight[tool_id]:
+                    del self._in_flight[tool_id]
+            self._release_slot(item, started=True)
+            self.metrics.observe("domed_job_run_seconds", monotonic() - started, labels(tool=tool_id))
+            finished = self.store.get(item.job_id)
+            state = finished.state if finished is not None else "unknown"
+            self.metrics.inc("domed_jobs_finished_total", 1, labels(tool=tool_id, state=state))
+        if item.tool.get("cacheable"):
+            self._remember_result(item.job_id, item.tool)
+
+    def _release_slot(self, item: QueuedJob, *, started: bool) -> None:
+        parked = self.admission.finish(item, started=started)
+        if parked is not None:
+            self.scheduler.submit(parked)
+
+    def _run_started_job(self, item: QueuedJob) -> None:
+        try:
+            self._execute_job(item.job_id, item.tool, item.task_json, item.constraints_json)
+        except Exception as exc:  # noqa: BLE001
+            current = self.store.get(item.job_id)
+            if current is None or current.state in TERMINAL_STATES:
+                return
+            self.store.append_event(
+                job_id=item.job_id,
+                event_type="error",
+                payload={"reason": f"executor error: {exc}", "tool_id": item.tool["tool_id"]},
+            )
+            self.store.transition(job_id=item.job_id, to_state="failed")
+            self.store.append_event(
+                job_id=item.job_id,
+                event_type="state_change",
+                payload={"from": current.state, "to": "failed", "tool_id": item.tool["tool_id"]},
+            )
+
     def _execute_job(
         self,
         job_id: str,
@@ -325,7 +810,8 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
             },
         )
 
-        if tool["executor_backend"] == "local-process":
+        executor = self.executors.get(tool["executor_backend"])
+        if executor is not None:
             req = ExecutionRequest(
                 run_id=run_id,
                 job_id=job_id,
@@ -337,6 +823,7 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
                 cwd=_ROOT,
                 timeout_seconds=int(tool.get("timeout_seconds", 120)),
                 env_allowlist=list(tool.get("env_allowlist", [])),
+                cancel_token=CancelToken(),
             )
 
             def _sink(evt: ExecutionEvent) -> None:
@@ -345,7 +832,21 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
                     return
                 self.store.append_event(job_id=job_id, event_type="log", payload=evt.payload)
 
-            result = self.local_executor.execute(req, _sink)
+            with self._running_lock:
+                self._running[job_id] = req.cancel_token
+            # CancelJob may have landed between the running transition and registration.
+            current = self.store.get(job_id)
+            if current is not None and current.state in TERMINAL_STATES:
+                req.cancel_token.cancel()
+            try:
+                result = executor.execute(req, _sink)
+            finally:
+                with self._running_lock:
+                    self._running.pop(job_id, None)
+            current = self.store.get(job_id)
+            if result.terminal_state == "canceled" or current is None or current.state in TERMINAL_STATES:
+                # CancelJob already recorded the transition and its state_change event.
+                return
             self.store.transition(job_id=job_id, to_state=result.terminal_state)
             self.store.append_event(
                 job_id=job_id,
@@ -379,12 +880,10 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
             lines = task.get("lines", [])
             if not isinstance(lines, list):
                 lines = [str(lines)]
-            for line in lines[:100]:
-                self.store.append_event(
-                    job_id=job_id,
-                    event_type="log",
-                    payload={"line": str(line)},
-                )
+            self.store.append_events(
+                job_id=job_id,
+                events=[("log", chunk) for chunk in chunk_lines("stdout", [str(line) for line in lines[:100]])],
+            )
             self.store.transition(job_id=job_id, to_state="succeeded")
             self.store.append_event(
                 job_id=job_id,
@@ -442,14 +941,14 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
             },
         )
 
-    def GetJobStatus(self, request: Any, context: Any) -> Any:  # noqa: N802
-        job = self.store.get(request.job_id)
+    def _job_status_response(self, job_id: str, job: JobRecord | None) -> Any:
         if job is None:
             return domed_pb2.GetJobStatusResponse(
-                status=_status_err(domed_pb2.E_NOT_FOUND, f"job not found: {request.job_id}"),
+                status=_status_err(domed_pb2.E_NOT_FOUND, f"job not found: {job_id}"),
+                job_id=job_id,
                 state=domed_pb2.JOB_STATE_UNSPECIFIED,
             )
-        prov = _build_provenance(job)
+        prov = job.provenance or _build_provenance(job, self.registry)
         return domed_pb2.GetJobStatusResponse(
             status=_status_ok(),
             run_id=job.run_id,
@@ -464,9 +963,68 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
                 tool_versions_json=prov["tool_versions_json"],
                 input_hash=job.request_hash,
                 env_fingerprint=prov["env_fingerprint"],
+                cache_hit=bool(prov.get("cache_hit", False)),
+                cache_source_job_id=str(prov.get("cache_source_job_id", "")),
             ),
         )
 
+    def GetJobStatus(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return self._job_status_response(request.job_id, self.store.get(request.job_id))
+
+    def GetJobStatusBatch(self, request: Any, context: Any) -> Any:  # noqa: N802
+        job_ids = list(request.job_ids)
+        if len(job_ids) > _MAX_BATCH_ITEMS:
+            return domed_pb2.GetJobStatusBatchResponse(
+                status=_status_err(
+                    domed_pb2.E_INVALID_REQUEST,
+                    f"batch too large: {len(job_ids)} > {_MAX_BATCH_ITEMS}",
+                ),
+            )
+        jobs = self.store.get_many(job_ids)
+        return domed_pb2.GetJobStatusBatchResponse(
+            status=_status_ok(),
+            responses=[self._job_status_response(job_id, jobs.get(job_id)) for job_id in job_ids],
+        )
+
+    def ListJobs(self, request: Any, context: Any) -> Any:  # noqa: N802
+        after = None
+        if request.page_token:
+            try:
+                after = _decode_page_token(request.page_token)
+            except ValueError as exc:
+                return domed_pb2.ListJobsResponse(
+                    status=_status_err(domed_pb2.E_INVALID_REQUEST, str(exc)),
+                )
+        page_size = int(request.page_size) or _LIST_JOBS_DEFAULT_PAGE_SIZE
+        page_size = min(page_size, _LIST_JOBS_MAX_PAGE_SIZE)
+        states = [state for state in map(_job_state_from_proto, request.states) if state]
+        jobs = self.store.list_jobs(
+            states=states or None,
+            skill_id=request.skill_id.strip(),
+            profile=request.profile.strip(),
+            updated_after=request.updated_after or None,
+            updated_before=request.updated_before or None,
+            after=after,
+            limit=page_size + 1,
+        )
+        next_page_token = _encode_page_token(jobs[page_size - 1]) if len(jobs) > page_size else ""
+        return domed_pb2.ListJobsResponse(
+            status=_status_ok(),
+            jobs=[
+                domed_pb2.JobSummary(
+                    job_id=job.job_id,
+                    run_id=job.run_id,
+                    state=_job_state_to_proto(job.state),
+                    skill_id=job.skill_id,
+                    profile=job.profile,
+                    created_at=job.created_at,
+                    updated_at=job.updated_at,
+                )
+                for job in jobs[:page_size]
+            ],
+            next_page_token=next_page_token,
+        )
+
     def CancelJob(self, request: Any, context: Any) -> Any:  # noqa: N802
         job = self.store.get(request.job_id)
         if job is None:
@@ -476,6 +1034,10 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
                 state=domed_pb2.JOB_STATE_UNSPECIFIED,
             )
         canceled = self.store.cancel(request.job_id)
+        with self._running_lock:
+            token = self._running.get(request.job_id)
+        if token is not None:
+            token.cancel()
         self.store.append_event(
             job_id=canceled.job_id,
             event_type="state_change",
@@ -487,34 +1049,38 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
             state=_job_state_to_proto(canceled.state),
         )
 
+    def GetMetrics(self, request: Any, context: Any) -> Any:  # noqa: N802
+        response = _metrics_to_proto(self.metrics.snapshot(), monotonic() - self.started_at)
+        if request.include_prometheus_text:
+            response.prometheus_text = self.metrics.render_prometheus()
+        return response
+
     def StreamJobEvents(self, request: Any, context: Any) -> Any:  # noqa: N802
         if self.store.get(request.job_id) is None:
             return
-        cursor = int(request.since_seq)
-        poll_interval = 0.05
-        while True:
-            job = self.store.get(request.job_id)
-            if job is None:
-                return
-            events = self.store.events_since(job_id=request.job_id, since_seq=cursor)
-            for evt in events:
-                cursor = evt.seq
-                yield domed_pb2.StreamJobEventsResponse(
-                    seq=evt.seq,
-                    event_id=f"{request.job_id}-{evt.seq}",
-                    ts=f"{evt.ts_epoch:.6f}",
-                    run_id=job.run_id or "",
-                    job_id=request.job_id,
-                    event_type=_event_type_to_proto(evt.event_type),
-                    payload_json=json.dumps(evt.payload, sort_keys=True),
-                )
-            if not request.follow:
-                return
-            if job.state in TERMINAL_STATES and not events:
-                return
-            if hasattr(context, "is_active") and not context.is_active():
-                return
-            sleep(poll_interval)
+        cursor = _FollowCursor(int(request.since_seq))
+        waiter = self.store.subscribe(request.job_id)
+        if request.follow and hasattr(context, "add_callback"):
+            context.add_callback(waiter.set)
+        try:
+            while True:
+                waiter.clear()
+                job = self.store.get(request.job_id)
+                if job is None:
+                    return
+                events = self.store.events_since_raw(job_id=request.job_id, since_seq=cursor.seq)
+                for evt in events:
+                    cursor.advance(evt)
+                    yield _event_to_proto(request.job_id, job.run_id, evt)
+                if not request.follow:
+                    return
+                if cursor.drained(job, events):
+                    return
+                if hasattr(context, "is_active") and not context.is_active():
+                    return
+                waiter.wait(timeout=cursor.wait_timeout())
+        finally:
+            self.store.unsubscribe(request.job_id, waiter)
 
     def GetGateDecision(self, request: Any, context: Any) -> Any:  # noqa: N802
         return domed_pb2.GetGateDecisionResponse(
@@ -531,12 +1097,164 @@ class InMemoryDomedService(domed_pb2_grpc.DomedServiceServicer):
         )
 
 
+class _LoopWaiter:
+    """Store waiter that wakes an asyncio follower from whichever thread appends events."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._event = asyncio.Event()
+
+    def set(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            pass
+
+    def clear(self) -> None:
+        self._event.clear()
+
+    async def wait(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class AsyncDomedService(domed_pb2_grpc.DomedServiceServicer):
+    """grpc.aio front end over InMemoryDomedService.
+
+    Unary RPCs and store reads run on a small store thread pool so the event loop never
+    blocks on SQLite. Followers hold no thread while idle, and each stream reads at most
+    ``stream_buffer_size`` events per store call, so a slow consumer applies flow-control
+    backpressure instead of accumulating its backlog in daemon memory.
+    """
+
+    def __init__(
+        self,
+        service: InMemoryDomedService | None = None,
+        *,
+        store_workers: int = 4,
+        stream_buffer_size: int = 256,
+    ) -> None:
+        self.service = service or InMemoryDomedService()
+        self.store = self.service.store
+        self.stream_buffer_size = max(int(stream_buffer_size), 1)
+        self._store_executor = futures.ThreadPoolExecutor(
+            max_workers=max(int(store_workers), 1),
+            thread_name_prefix="domed-store",
+        )
+
+    def close(self) -> None:
+        self._store_executor.shutdown(wait=False)
+        self.service.close()
+
+    async def _offload(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        # Run in a copy of the caller's context so the RPC's trace span stays current.
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(self._store_executor, partial(ctx.run, fn, *args, **kwargs))
+
+    async def Health(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return self.service.Health(request, context)
+
+    async def ListCapabilities(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.ListCapabilities, request, context)
+
+    async def ListTools(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.ListTools, request, context)
+
+    async def GetTool(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.GetTool, request, context)
+
+    async def SkillExecute(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.SkillExecute, request, context)
+
+    async def SkillExecuteBatch(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.SkillExecuteBatch, request, context)
+
+    async def GetJobStatus(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.GetJobStatus, request, context)
+
+    async def GetJobStatusBatch(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.GetJobStatusBatch, request, context)
+
+    async def ListJobs(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.ListJobs, request, context)
+
+    async def CancelJob(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.CancelJob, request, context)
+
+    async def GetMetrics(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return await self._offload(self.service.GetMetrics, request, context)
+
+    async def StreamJobEvents(self, request: Any, context: Any) -> Any:  # noqa: N802
+        if await self._offload(self.store.get, request.job_id) is None:
+            return
+        cursor = _FollowCursor(int(request.since_seq))
+        waiter = _LoopWaiter(asyncio.get_running_loop())
+        self.store.subscribe(request.job_id, waiter)
+        try:
+            while True:
+                waiter.clear()
+                job = await self._offload(self.store.get, request.job_id)
+                if job is None:
+                    return
+                events = await self._offload(
+                    self.store.events_since_raw,
+                    job_id=request.job_id,
+                    since_seq=cursor.seq,
+                    limit=self.stream_buffer_size,
+                )
+                for evt in events:
+                    cursor.advance(evt)
+                    yield _event_to_proto(request.job_id, job.run_id, evt)
+                if len(events) >= self.stream_buffer_size:
+                    continue
+                if not request.follow:
+                    return
+                if cursor.drained(job, events):
+                    return
+                await waiter.wait(cursor.wait_timeout())
+        finally:
+            self.store.unsubscribe(request.job_id, waiter)
+
+    async def GetGateDecision(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return self.service.GetGateDecision(request, context)
+
+    async def GetPromotionDecision(self, request: Any, context: Any) -> Any:  # noqa: N802
+        return self.service.GetPromotionDecision(request, context)
+
+
+async def start_async_server(
+    bind: str = "127.0.0.1:0",
+    service: AsyncDomedService | None = None,
+    *,
+    interceptors: list[Any] | None = None,
+) -> tuple[Any, int, AsyncDomedService]:
+    service = service or AsyncDomedService()
+    server = grpc.aio.server(
+        interceptors=[AsyncMetricsServerInterceptor(service.service.metrics), *(interceptors or [])],
+        options=_SERVER_OPTIONS,
+    )
+    domed_pb2_grpc.add_DomedServiceServicer_to_server(service, server)
+    port = server.add_insecure_port(bind)
+    await server.start()
+    return server, port, service
+
+
 def start_insecure_server(
     bind: str = "127.0.0.1:0",
     service: InMemoryDomedService | None = None,
+    *,
+    max_workers: int = 8,
+    interceptors: list[Any] | None = None,
 ) -> tuple[grpc.Server, int, InMemoryDomedService]:
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
     service = service or InMemoryDomedService()
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=max_workers),
+        interceptors=[MetricsServerInterceptor(service.metrics), *(interceptors or [])],
+        options=_SERVER_OPTIONS,
+    )
     domed_pb2_grpc.add_DomedServiceServicer_to_server(service, server)
     port = server.add_insecure_port(bind)
     server.start()
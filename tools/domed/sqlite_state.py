@@ -1,25 +1,95 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 import json
+from queue import Queue
 import sqlite3
-from threading import Lock
-from time import time
-from typing import Any
+from threading import Condition, Thread
+from time import monotonic, sleep, time
+from typing import Any, Iterator
 
-from tools.domed.runtime_state import EventRecord, JobRecord, TERMINAL_STATES
+from tools.domed.metrics import MetricsRegistry, TimedLock, labels
+
+from tools.domed.runtime_state import (
+    EventRecord,
+    JobEventNotifier,
+    JobRecord,
+    JobWaiter,
+    RawEventRecord,
+    TERMINAL_STATES,
+    encode_payload,
+)
+
+_SQL_PARAM_CHUNK = 500
+_AUTO_VACUUM_INCREMENTAL = 2
+_COMMIT_BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+_WRITER_MAX_BACKOFF_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class GcReport:
+    jobs: int = 0
+    events: int = 0
+    idempotency: int = 0
+    chunks: int = 0
+    pages_reclaimed: int = 0
+    seconds: float = 0.0
 
 
 class SQLiteRuntimeStateStore:
-    def __init__(self, db_path: str) -> None:
-        self._lock = Lock()
+    """SQLite-backed runtime state with a group-commit event append path.
+
+    Event sequence numbers are allocated in memory per job, and appended events are queued
+    for a writer thread that commits everything pending from all jobs in one transaction
+    after ``group_commit_window_seconds``. Reads of the event log flush the queue first, so
+    callers always observe their own appends. A window of 0 commits every append inline.
+    A failed commit keeps its batch queued: the writer retries with backoff, and any
+    ``flush`` (including the one behind each read) raises until the batch lands.
+
+    All writes go through one writer connection; ``get`` and ``events_since`` use a pool of
+    read-only connections so they run concurrently with the writer under WAL.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        group_commit_window_seconds: float = 0.002,
+        group_commit_max_batch: int = 1024,
+        read_pool_size: int = 4,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self._lock = TimedLock(self.metrics, "domed_store_lock_wait_seconds", labels(store="sqlite"))
         self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
+        self._notifier = JobEventNotifier()
         self._init_schema()
+        self._readers: Queue[sqlite3.Connection] = Queue()
+        self._reader_conns: list[sqlite3.Connection] = []
+        if db_path != ":memory:" and not db_path.startswith("file::memory:"):
+            for _ in range(max(int(read_pool_size), 0)):
+                conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                self._reader_conns.append(conn)
+                self._readers.put(conn)
+        self._append_cv = Condition()
+        self._next_seq: dict[str, int] = {}
+        self._pending: list[tuple[str, EventRecord, str]] = []
+        self._inflight = 0
+        self._closed = False
+        self._commit_window = max(float(group_commit_window_seconds), 0.0)
+        self._max_batch = max(int(group_commit_max_batch), 1)
+        self._writer: Thread | None = None
+        if self._commit_window > 0:
+            self._writer = Thread(target=self._writer_loop, daemon=True, name="domed-sqlite-writer")
+            self._writer.start()
 
     def _init_schema(self) -> None:
         self._conn.executescript(
             """
+            PRAGMA auto_vacuum=INCREMENTAL;
             PRAGMA journal_mode=WAL;
             CREATE TABLE IF NOT EXISTS jobs (
               job_id TEXT PRIMARY KEY,
@@ -31,7 +101,8 @@ class SQLiteRuntimeStateStore:
               request_hash TEXT NOT NULL,
               artifacts_json TEXT NOT NULL,
               created_at REAL NOT NULL,
-              updated_at REAL NOT NULL
+              updated_at REAL NOT NULL,
+              provenance_json TEXT NOT NULL DEFAULT '{}'
             );
             CREATE TABLE IF NOT EXISTS idempotency (
               client_id TEXT NOT NULL,
@@ -50,10 +121,30 @@ class SQLiteRuntimeStateStore:
               PRIMARY KEY (job_id, seq)
             );
             CREATE INDEX IF NOT EXISTS idx_jobs_state_updated ON jobs(state, updated_at);
+            CREATE INDEX IF NOT EXISTS idx_jobs_updated ON jobs(updated_at, job_id);
             CREATE INDEX IF NOT EXISTS idx_events_job_seq ON events(job_id, seq);
             """
         )
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)").fetchall()}
+        if "provenance_json" not in columns:
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN provenance_json TEXT NOT NULL DEFAULT '{}'")
         self._conn.commit()
+        # auto_vacuum only takes effect on a fresh file; older databases need one VACUUM to switch.
+        if self._conn.execute("PRAGMA auto_vacuum").fetchone()[0] != _AUTO_VACUUM_INCREMENTAL:
+            self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            self._conn.execute("VACUUM")
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        if not self._reader_conns:
+            with self._lock:
+                yield self._conn
+            return
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
 
     def _decode_job(self, row: sqlite3.Row) -> JobRecord:
         return JobRecord(
@@ -66,62 +157,162 @@ class SQLiteRuntimeStateStore:
             request_hash=row["request_hash"],
             artifacts=json.loads(row["artifacts_json"]),
             events=[],
+            provenance=json.loads(row["provenance_json"] or "{}"),
+            created_at=float(row["created_at"]),
+            updated_at=float(row["updated_at"]),
+        )
+
+    def subscribe(self, job_id: str, waiter: JobWaiter | None = None) -> Any:
+        return self._notifier.subscribe(job_id, waiter)
+
+    def unsubscribe(self, job_id: str, waiter: JobWaiter) -> None:
+        self._notifier.unsubscribe(job_id, waiter)
+
+    def _submit_locked(self, cur: sqlite3.Cursor, job: JobRecord, client_id: str, now: float) -> tuple[JobRecord, bool]:
+        cur.execute(
+            "SELECT request_hash, job_id FROM idempotency WHERE client_id = ? AND idempotency_key = ?",
+            (client_id, job.idempotency_key),
+        )
+        prior = cur.fetchone()
+        if prior is not None:
+            if prior["request_hash"] != job.request_hash:
+                raise ValueError("idempotency key reused with different request hash")
+            cur.execute("SELECT * FROM jobs WHERE job_id = ?", (prior["job_id"],))
+            row = cur.fetchone()
+            if row is None:
+                raise ValueError("idempotency ledger references missing job")
+            return self._decode_job(row), True
+
+        cur.execute(
+            """
+            INSERT INTO jobs(job_id, run_id, state, skill_id, profile, idempotency_key, request_hash, artifacts_json, created_at, updated_at, provenance_json)
+            VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                job.job_id,
+                job.run_id,
+                job.state,
+                job.skill_id,
+                job.profile,
+                job.idempotency_key,
+                job.request_hash,
+                json.dumps(job.artifacts, sort_keys=True),
+                now,
+                now,
+                json.dumps(job.provenance, sort_keys=True),
+            ),
         )
+        cur.execute(
+            """
+            INSERT INTO idempotency(client_id, idempotency_key, request_hash, job_id, created_at)
+            VALUES(?, ?, ?, ?, ?)
+            """,
+            (client_id, job.idempotency_key, job.request_hash, job.job_id, now),
+        )
+        return job, False
 
     def submit(self, *, job: JobRecord, client_id: str = "default") -> tuple[JobRecord, bool]:
+        out = self.submit_many(jobs=[job], client_id=client_id)[0]
+        if isinstance(out, ValueError):
+            raise out
+        return out
+
+    def submit_many(
+        self, *, jobs: list[JobRecord], client_id: str = "default"
+    ) -> list[tuple[JobRecord, bool] | ValueError]:
+        """Submit several jobs in one transaction; idempotency conflicts are returned per item."""
         now = time()
+        out: list[tuple[JobRecord, bool] | ValueError] = []
         with self._lock:
             cur = self._conn.cursor()
-            cur.execute(
-                "SELECT request_hash, job_id FROM idempotency WHERE client_id = ? AND idempotency_key = ?",
-                (client_id, job.idempotency_key),
-            )
-            prior = cur.fetchone()
-            if prior is not None:
-                if prior["request_hash"] != job.request_hash:
-                    raise ValueError("idempotency key reused with different request hash")
-                cur.execute("SELECT * FROM jobs WHERE job_id = ?", (prior["job_id"],))
-                row = cur.fetchone()
-                if row is None:
-                    raise ValueError("idempotency ledger references missing job")
-                return self._decode_job(row), True
-
-            cur.execute(
-                """
-                INSERT INTO jobs(job_id, run_id, state, skill_id, profile, idempotency_key, request_hash, artifacts_json, created_at, updated_at)
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    job.job_id,
-                    job.run_id,
-                    job.state,
-                    job.skill_id,
-                    job.profile,
-                    job.idempotency_key,
-                    job.request_hash,
-                    json.dumps(job.artifacts, sort_keys=True),
-                    now,
-                    now,
-                ),
-            )
-            cur.execute(
-                """
-                INSERT INTO idempotency(client_id, idempotency_key, request_hash, job_id, created_at)
-                VALUES(?, ?, ?, ?, ?)
-                """,
-                (client_id, job.idempotency_key, job.request_hash, job.job_id, now),
-            )
-            self._conn.commit()
-            return job, False
+            try:
+                for job in jobs:
+                    try:
+                        out.append(self._submit_locked(cur, job, client_id, now))
+                    except ValueError as exc:
+                        out.append(exc)
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+        with self._append_cv:
+            for item in out:
+                if not isinstance(item, ValueError) and not item[1]:
+                    self._next_seq.setdefault(item[0].job_id, 1)
+        return out
 
     def get(self, job_id: str) -> JobRecord | None:
-        with self._lock:
-            cur = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+        with self._reader() as conn:
+            cur = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
             row = cur.fetchone()
             if row is None:
                 return None
             return self._decode_job(row)
 
+    def find_idempotent(self, idempotency_key: str, client_id: str = "default") -> JobRecord | None:
+        with self._reader() as conn:
+            row = conn.execute(
+                """
+                SELECT jobs.* FROM idempotency JOIN jobs ON jobs.job_id = idempotency.job_id
+                WHERE idempotency.client_id = ? AND idempotency.idempotency_key = ?
+                """,
+                (client_id, idempotency_key),
+            ).fetchone()
+        return self._decode_job(row) if row is not None else None
+
+    def get_many(self, job_ids: list[str]) -> dict[str, JobRecord]:
+        out: dict[str, JobRecord] = {}
+        unique = list(dict.fromkeys(job_ids))
+        with self._reader() as conn:
+            for start in range(0, len(unique), _SQL_PARAM_CHUNK):
+                chunk = unique[start : start + _SQL_PARAM_CHUNK]
+                qmarks = ",".join("?" for _ in chunk)
+                for row in conn.execute(f"SELECT * FROM jobs WHERE job_id IN ({qmarks})", chunk):
+                    out[row["job_id"]] = self._decode_job(row)
+        return out
+
+    def list_jobs(
+        self,
+        *,
+        states: list[str] | None = None,
+        skill_id: str = "",
+        profile: str = "",
+        updated_after: float | None = None,
+        updated_before: float | None = None,
+        after: tuple[float, str] | None = None,
+        limit: int = 100,
+    ) -> list[JobRecord]:
+        """Keyset page of jobs ordered by (updated_at, job_id) descending."""
+        self.flush()
+        clauses: list[str] = []
+        params: list[Any] = []
+        if states:
+            clauses.append(f"state IN ({','.join('?' for _ in states)})")
+            params.extend(states)
+        if skill_id:
+            clauses.append("skill_id = ?")
+            params.append(skill_id)
+        if profile:
+            clauses.append("profile = ?")
+            params.append(profile)
+        if updated_after is not None:
+            clauses.append("updated_at >= ?")
+            params.append(updated_after)
+        if updated_before is not None:
+            clauses.append("updated_at < ?")
+            params.append(updated_before)
+        if after is not None:
+            clauses.append("(updated_at < ? OR (updated_at = ? AND job_id < ?))")
+            params.extend([after[0], after[0], after[1]])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(max(int(limit), 0))
+        with self._reader() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM jobs {where} ORDER BY updated_at DESC, job_id DESC LIMIT ?",
+                params,
+            ).fetchall()
+        return [self._decode_job(row) for row in rows]
+
     def transition(self, *, job_id: str, to_state: str) -> JobRecord:
         with self._lock:
             cur = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
@@ -137,16 +328,10 @@ class SQLiteRuntimeStateStore:
                 (to_state, now, job_id),
             )
             self._conn.commit()
-            return JobRecord(
-                job_id=row["job_id"],
-                run_id=row["run_id"],
-                state=to_state,
-                skill_id=row["skill_id"],
-                profile=row["profile"],
-                idempotency_key=row["idempotency_key"],
-                request_hash=row["request_hash"],
-                artifacts=json.loads(row["artifacts_json"]),
-            )
+        self._notifier.notify(job_id)
+        job = self._decode_job(row)
+        job.state = to_state
+        return job
 
     def cancel(self, job_id: str) -> JobRecord:
         with self._lock:
@@ -162,64 +347,247 @@ class SQLiteRuntimeStateStore:
                 (target, now, job_id),
             )
             self._conn.commit()
-            job = self._decode_job(row)
-            job.state = target
-            return job
+        self._notifier.notify(job_id)
+        job = self._decode_job(row)
+        job.state = target
+        return job
+
+    def _allocate_seq(self, job_id: str, count: int) -> int:
+        with self._append_cv:
+            first = self._next_seq.get(job_id)
+            if first is not None:
+                self._next_seq[job_id] = first + count
+                return first
+        with self._reader() as conn:
+            cur = conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) + 1 AS next_seq FROM events WHERE job_id = ?",
+                (job_id,),
+            )
+            loaded = int(cur.fetchone()["next_seq"])
+        with self._append_cv:
+            first = self._next_seq.setdefault(job_id, loaded)
+            self._next_seq[job_id] = first + count
+            return first
 
     def append_event(self, *, job_id: str, event_type: str, payload: dict[str, Any]) -> EventRecord:
+        return self.append_events(job_id=job_id, events=[(event_type, payload)])[0]
+
+    def append_events(self, *, job_id: str, events: list[tuple[str, dict[str, Any]]]) -> list[EventRecord]:
+        if not events:
+            return []
+        first = self._allocate_seq(job_id, len(events))
+        records = [
+            EventRecord(seq=first + idx, event_type=event_type, payload=payload)
+            for idx, (event_type, payload) in enumerate(events)
+        ]
+        with self._append_cv:
+            self._pending.extend((job_id, evt, encode_payload(evt.payload)) for evt in records)
+            backlog = len(self._pending)
+            self._append_cv.notify()
+        self.metrics.inc("domed_store_events_appended_total", len(records), labels(store="sqlite"))
+        if self._writer is None or backlog >= self._max_batch:
+            self.flush()
+        return records
+
+    def flush(self) -> None:
+        with self._append_cv:
+            if not self._pending and not self._inflight:
+                return
         with self._lock:
-            cur = self._conn.execute("SELECT COALESCE(MAX(seq), 0) + 1 AS next_seq FROM events WHERE job_id = ?", (job_id,))
-            next_seq = int(cur.fetchone()["next_seq"])
-            evt = EventRecord(seq=next_seq, event_type=event_type, payload=payload)
-            self._conn.execute(
+            job_ids = self._flush_locked()
+        for job_id in job_ids:
+            self._notifier.notify(job_id)
+
+    def _flush_locked(self) -> set[str]:
+        with self._append_cv:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return set()
+            self._inflight += 1
+        try:
+            return self._write_batch(batch)
+        except Exception:
+            # The batch's seqs are already handed out; put it back in front of anything
+            # appended meanwhile so the next flush retries it in order instead of leaving gaps.
+            with self._append_cv:
+                self._pending[:0] = batch
+            self.metrics.inc("domed_store_write_errors_total", 1, labels(store="sqlite"))
+            raise
+        finally:
+            with self._append_cv:
+                self._inflight -= 1
+
+    def _write_batch(self, batch: list[tuple[str, EventRecord, str]]) -> set[str]:
+        updated: dict[str, float] = {}
+        for job_id, evt, _payload_json in batch:
+            updated[job_id] = max(updated.get(job_id, 0.0), evt.ts_epoch)
+        started = monotonic()
+        try:
+            self._conn.executemany(
                 "INSERT INTO events(job_id, seq, event_type, payload_json, ts_epoch) VALUES(?, ?, ?, ?, ?)",
-                (job_id, evt.seq, evt.event_type, json.dumps(evt.payload, sort_keys=True), evt.ts_epoch),
+                [
+                    (job_id, evt.seq, evt.event_type, payload_json, evt.ts_epoch)
+                    for job_id, evt, payload_json in batch
+                ],
+            )
+            self._conn.executemany(
+                "UPDATE jobs SET updated_at = MAX(updated_at, ?) WHERE job_id = ?",
+                [(ts, job_id) for job_id, ts in updated.items()],
             )
-            self._conn.execute("UPDATE jobs SET updated_at = ? WHERE job_id = ?", (time(), job_id))
             self._conn.commit()
-            return evt
+        except sqlite3.Error:
+            self._conn.rollback()
+            raise
+        self.metrics.observe("domed_store_commit_seconds", monotonic() - started, labels(store="sqlite"))
+        self.metrics.observe(
+            "domed_store_commit_batch_events",
+            len(batch),
+            labels(store="sqlite"),
+            buckets=_COMMIT_BATCH_BUCKETS,
+        )
+        return set(updated)
 
-    def events_since(self, *, job_id: str, since_seq: int) -> list[EventRecord]:
-        with self._lock:
-            cur = self._conn.execute(
+    def _writer_loop(self) -> None:
+        failures = 0
+        while True:
+            with self._append_cv:
+                while not self._pending and not self._closed:
+                    self._append_cv.wait()
+                if self._closed and not self._pending:
+                    return
+                if self._closed and failures:
+                    # close() flushes inline and surfaces the error to its caller.
+                    return
+            sleep(min(self._commit_window * (2**failures), _WRITER_MAX_BACKOFF_SECONDS))
+            try:
+                self.flush()
+                failures = 0
+            except Exception as exc:  # noqa: BLE001
+                failures = min(failures + 1, 16)
+                with self._append_cv:
+                    backlog = len(self._pending)
+                print(
+                    f"domed sqlite writer error attempt={failures} pending_events={backlog}: {exc}",
+                    flush=True,
+                )
+
+    def events_since(self, *, job_id: str, since_seq: int, limit: int | None = None) -> list[EventRecord]:
+        return [
+            EventRecord(
+                seq=evt.seq,
+                event_type=evt.event_type,
+                payload=json.loads(evt.payload_json),
+                ts_epoch=evt.ts_epoch,
+            )
+            for evt in self.events_since_raw(job_id=job_id, since_seq=since_seq, limit=limit)
+        ]
+
+    def events_since_raw(self, *, job_id: str, since_seq: int, limit: int | None = None) -> list[RawEventRecord]:
+        """Event rows with ``payload_json`` exactly as stored; no JSON decode on this path."""
+        self.flush()
+        with self._reader() as conn:
+            cur = conn.execute(
                 """
                 SELECT seq, event_type, payload_json, ts_epoch
                 FROM events
                 WHERE job_id = ? AND seq > ?
                 ORDER BY seq ASC
+                LIMIT ?
                 """,
-                (job_id, since_seq),
+                (job_id, since_seq, -1 if limit is None else int(limit)),
             )
-            out: list[EventRecord] = []
-            for row in cur.fetchall():
-                out.append(
-                    EventRecord(
-                        seq=int(row["seq"]),
-                        event_type=row["event_type"],
-                        payload=json.loads(row["payload_json"]),
-                        ts_epoch=float(row["ts_epoch"]),
-                    )
+            return [
+                RawEventRecord(
+                    seq=int(row["seq"]),
+                    event_type=row["event_type"],
+                    payload_json=row["payload_json"],
+                    ts_epoch=float(row["ts_epoch"]),
                 )
-            return out
+                for row in cur.fetchall()
+            ]
 
     def gc(self, ttl_seconds: int) -> int:
+        return self.gc_report(ttl_seconds=ttl_seconds).jobs
+
+    def gc_report(
+        self,
+        *,
+        ttl_seconds: int,
+        chunk_size: int = _SQL_PARAM_CHUNK,
+        vacuum_pages: int = 256,
+    ) -> GcReport:
+        """Delete stale terminal jobs in bounded chunks, then return free pages to the OS.
+
+        The writer lock is taken per chunk (and per ``incremental_vacuum`` step), so RPCs
+        interleave with a long collection instead of stalling behind it.
+        """
+        started = monotonic()
         cutoff = time() - ttl_seconds
-        with self._lock:
-            cur = self._conn.execute(
-                "SELECT job_id FROM jobs WHERE state IN ('succeeded','failed','canceled') AND updated_at < ?",
-                (cutoff,),
-            )
-            stale_ids = [r["job_id"] for r in cur.fetchall()]
-            if not stale_ids:
-                return 0
-            qmarks = ",".join("?" for _ in stale_ids)
-            self._conn.execute(f"DELETE FROM events WHERE job_id IN ({qmarks})", stale_ids)
-            self._conn.execute(f"DELETE FROM idempotency WHERE job_id IN ({qmarks})", stale_ids)
-            self._conn.execute(f"DELETE FROM jobs WHERE job_id IN ({qmarks})", stale_ids)
-            self._conn.commit()
-            return len(stale_ids)
+        chunk_size = min(max(int(chunk_size), 1), _SQL_PARAM_CHUNK)
+        report = GcReport()
+        self.flush()
+        while True:
+            with self._lock:
+                stale_ids = [
+                    r["job_id"]
+                    for r in self._conn.execute(
+                        """
+                        SELECT job_id FROM jobs
+                        WHERE state IN ('succeeded','failed','canceled') AND updated_at < ?
+                        LIMIT ?
+                        """,
+                        (cutoff, chunk_size),
+                    ).fetchall()
+                ]
+                if not stale_ids:
+                    break
+                qmarks = ",".join("?" for _ in stale_ids)
+                try:
+                    report.events += self._conn.execute(
+                        f"DELETE FROM events WHERE job_id IN ({qmarks})", stale_ids
+                    ).rowcount
+                    report.idempotency += self._conn.execute(
+                        f"DELETE FROM idempotency WHERE job_id IN ({qmarks})", stale_ids
+                    ).rowcount
+                    report.jobs += self._conn.execute(
+                        f"DELETE FROM jobs WHERE job_id IN ({qmarks})", stale_ids
+                    ).rowcount
+                    self._conn.commit()
+                except sqlite3.Error:
+                    self._conn.rollback()
+                    raise
+            report.chunks += 1
+            with self._append_cv:
+                for job_id in stale_ids:
+                    self._next_seq.pop(job_id, None)
+            if len(stale_ids) < chunk_size:
+                break
+        report.pages_reclaimed = self._incremental_vacuum(max(int(vacuum_pages), 1))
+        report.seconds = monotonic() - started
+        return report
+
+    def _incremental_vacuum(self, step_pages: int) -> int:
+        reclaimed = 0
+        while True:
+            with self._lock:
+                before = int(self._conn.execute("PRAGMA freelist_count").fetchone()[0])
+                if before == 0:
+                    return reclaimed
+                self._conn.execute(f"PRAGMA incremental_vacuum({step_pages})").fetchall()
+                after = int(self._conn.execute("PRAGMA freelist_count").fetchone()[0])
+            reclaimed += before - after
+            if after == 0 or after >= before:
+                return reclaimed
 
     def close(self) -> None:
+        with self._append_cv:
+            self._closed = True
+            self._append_cv.notify_all()
+        if self._writer is not None:
+            self._writer.join(timeout=5.0)
+        self.flush()
+        for conn in self._reader_conns:
+            conn.close()
         with self._lock:
             self._conn.close()
 
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from types import CodeType
+from typing import Any, Callable
+
+
+ToolLoader = Callable[[], list[dict[str, Any]]]
+
+_SNAPSHOT_FORMAT = 2
+
+
+def tool_manifest_hash(tool: dict[str, Any]) -> str:
+    payload = {
+        "tool_id": tool.get("tool_id"),
+        "version": tool.get("version"),
+        "executor_backend": tool.get("executor_backend"),
+        "entrypoint": tool.get("entrypoint", []),
+        "input_schema_ref": tool.get("input_schema_ref", ""),
+        "output_schema_ref": tool.get("output_schema_ref", ""),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def registry_version(tools: tuple[dict[str, Any], ...]) -> str:
+    """Hash of every tool entry as served, so any manifest edit changes it."""
+    ordered = sorted(tools, key=lambda item: str(item.get("tool_id", "")))
+    encoded = json.dumps(ordered, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def loader_code_version(*funcs: Callable[..., Any]) -> str:
+    """Hash of the bytecode of ``funcs``, which shape the entries a snapshot stores.
+
+    Line numbers and file paths are left out, so moving code around keeps snapshots valid;
+    changing what it does (or the Python version) invalidates them.
+    """
+    digest = hashlib.sha256()
+
+    def _feed(code: CodeType) -> None:
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode("utf-8"))
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                _feed(const)
+            else:
+                digest.update(repr(const).encode("utf-8"))
+
+    for func in funcs:
+        _feed(func.__code__)
+    return digest.hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
+class RegistrySnapshot:
+    tools: tuple[dict[str, Any], ...] = ()
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    manifest_hashes: dict[str, str] = field(default_factory=dict)
+    fingerprint: tuple[tuple[str, int], ...] = ()
+    version: str = ""
+    loader_version: str = ""
+
+
+def default_snapshot_path() -> Path:
+    return Path(__file__).resolve().parents[2] / "generated" / "tool_registry_snapshot.json"
+
+
+def write_registry_snapshot(path: Path, snap: RegistrySnapshot) -> None:
+    """Persist ``snap`` so a later process can skip manifest parsing (see ``ToolRegistry``)."""
+    payload = {
+        "format": _SNAPSHOT_FORMAT,
+        "loader_version": snap.loader_version,
+        "fingerprint": [list(entry) for entry in snap.fingerprint],
+        "version": snap.version,
+        "manifest_hashes": snap.manifest_hashes,
+        "tools": list(snap.tools),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(payload, sort_keys=True, indent=1) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_registry_snapshot(
+    path: Path,
+    fingerprint: tuple[tuple[str, int], ...],
+    loader_version: str = "",
+) -> RegistrySnapshot | None:
+    """Load a precompiled snapshot, or None when it is missing, malformed or stale.
+
+    Stale means the manifest tree's mtimes differ from ``fingerprint`` or the snapshot was
+    built by a different loader (``loader_version``, see ``loader_code_version``).
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("format") != _SNAPSHOT_FORMAT or payload.get("loader_version") != loader_version:
+            return None
+        if tuple((str(p), int(m)) for p, m in payload["fingerprint"]) != fingerprint:
+            return None
+        tools = tuple(payload["tools"])
+        by_id: dict[str, dict[str, Any]] = {}
+        for item in tools:
+            by_id.setdefault(item["tool_id"], item)
+        return RegistrySnapshot(
+            tools=tools,
+            by_id=by_id,
+            manifest_hashes=dict(payload["manifest_hashes"]),
+            fingerprint=fingerprint,
+            version=str(payload["version"]),
+            loader_version=loader_version,
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _stat_fingerprint(tools_root: Path, fallback: Path) -> tuple[tuple[str, int], ...]:
+    out: list[tuple[str, int]] = []
+    for path in (tools_root, fallback):
+        try:
+            out.append((str(path), path.stat().st_mtime_ns))
+        except OSError:
+            out.append((str(path), -1))
+    if tools_root.is_dir():
+        for manifest in sorted(tools_root.glob("*/manifest.yaml")):
+            try:
+                out.append((str(manifest), manifest.stat().st_mtime_ns))
+            except OSError:
+                continue
+    return tuple(out)
+
+
+class ToolRegistry:
+    """In-memory tool catalog indexed by tool_id.
+
+    The snapshot is rebuilt when the manifest tree's mtimes change (checked at most once per
+    ``check_interval_seconds``) or when ``reload()`` is called, e.g. from SIGHUP. Readers always
+    see one complete snapshot; rebuilds swap the reference atomically.
+
+    With ``snapshot_path``, a precompiled snapshot written by ``write_registry_snapshot`` is used
+    instead of calling ``loader`` whenever its recorded mtime fingerprint still matches the tree
+    and it was written under the same ``loader_version``; ``reload()`` always re-parses.
+    """
+
+    def __init__(
+        self,
+        loader: ToolLoader,
+        *,
+        tools_root: Path,
+        fallback_registry: Path,
+        check_interval_seconds: float = 1.0,
+        snapshot_path: Path | None = None,
+        loader_version: str = "",
+    ) -> None:
+        self._loader = loader
+        self._snapshot_path = snapshot_path
+        self._loader_version = loader_version
+        self._tools_root = tools_root
+        self._fallback_registry = fallback_registry
+        self._check_interval = max(float(check_interval_seconds), 0.0)
+        self._lock = Lock()
+        self._snapshot: RegistrySnapshot | None = None
+        self._checked_at = 0.0
+
+    def snapshot(self) -> RegistrySnapshot:
+        snap = self._snapshot
+        if snap is not None and monotonic() - self._checked_at < self._check_interval:
+            return snap
+        with self._lock:
+            snap = self._snapshot
+            if snap is not None and monotonic() - self._checked_at < self._check_interval:
+                return snap
+            fingerprint = _stat_fingerprint(self._tools_root, self._fallback_registry)
+            if snap is None or snap.fingerprint != fingerprint:
+                snap = self._build(fingerprint)
+                self._snapshot = snap
+            self._checked_at = monotonic()
+            return snap
+
+    def reload(self) -> RegistrySnapshot:
+        with self._lock:
+            snap = self._build(_stat_fingerprint(self._tools_root, self._fallback_registry), precompiled=False)
+            self._snapshot = snap
+            self._checked_at = monotonic()
+            return snap
+
+    def tools(self) -> tuple[dict[str, Any], ...]:
+        return self.snapshot().tools
+
+    def get(self, tool_id: str) -> dict[str, Any] | None:
+        return self.snapshot().by_id.get(tool_id.strip())
+
+    def version(self) -> str:
+        return self.snapshot().version
+
+    def manifest_hash(self, tool_id: str) -> str | None:
+        return self.snapshot().manifest_hashes.get(tool_id.strip())
+
+    def _build(self, fingerprint: tuple[tuple[str, int], ...], *, precompiled: bool = True) -> RegistrySnapshot:
+        if precompiled and self._snapshot_path is not None:
+            snap = read_registry_snapshot(self._snapshot_path, fingerprint, self._loader_version)
+            if snap is not None:
+                return snap
+        tools = tuple(self._loader())
+        by_id: dict[str, dict[str, Any]] = {}
+        for item in tools:
+            by_id.setdefault(item["tool_id"], item)
+        return RegistrySnapshot(
+            tools=tools,
+            by_id=by_id,
+            manifest_hashes={tool_id: tool_manifest_hash(item) for tool_id, item in by_id.items()},
+            fingerprint=fingerprint,
+            version=registry_version(tools),
+            loader_version=self._loader_version,
+        )
@@ -0,0 +1,323 @@
+"""Optional OpenTelemetry tracing for domed RPCs and job execution.
+
+Everything here degrades to a no-op when ``opentelemetry`` is not importable, so the daemon
+and client never require it. Trace context crosses the wire as standard W3C ``traceparent``
+gRPC metadata and crosses the scheduler queue as a small carrier dict on ``QueuedJob``.
+
+``opentelemetry`` is imported on first use rather than at module import: loading its
+propagators scans package entry points, which would otherwise dominate daemon startup.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import sys
+from typing import Any, Iterator, TextIO
+
+import grpc  # type: ignore
+
+propagate: Any = None
+trace: Any = None
+SpanKind: Any = None
+Status: Any = None
+StatusCode: Any = None
+_loaded = False
+
+_TRACER_NAME = "dome.domed"
+_EXPORTERS = ("none", "console", "file")
+
+
+def _load() -> bool:
+    global propagate, trace, SpanKind, Status, StatusCode, _loaded
+    if not _loaded:
+        try:
+            from opentelemetry import propagate as _propagate, trace as _trace  # type: ignore
+            from opentelemetry.trace import SpanKind as _kind, Status as _status, StatusCode as _code  # type: ignore
+        except Exception:  # pragma: no cover - optional dependency guard
+            pass
+        else:
+            propagate, trace = _propagate, _trace
+            SpanKind, Status, StatusCode = _kind, _status, _code
+        _loaded = True
+    return trace is not None
+
+
+def tracing_available() -> bool:
+    return _load()
+
+
+def configure_tracing(exporter: str, *, path: str = "", service_name: str = "domed") -> bool:
+    """Install an SDK tracer provider writing spans to stdout or a JSON-lines file.
+
+    Returns False (and leaves tracing off) for ``exporter="none"`` or when the SDK is missing.
+    """
+    if exporter not in _EXPORTERS:
+        raise ValueError(f"unknown trace exporter: {exporter}")
+    if exporter == "none" or not _load():
+        return False
+    try:
+        from opentelemetry.sdk.resources import Resource  # type: ignore
+        from opentelemetry.sdk.trace import TracerProvider  # type: ignore
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter  # type: ignore
+    except Exception:
+        return False
+
+    out: TextIO = sys.stdout
+    if exporter == "file":
+        if not path:
+            raise ValueError("file trace exporter needs a path")
+        out = open(path, "a", encoding="utf-8")  # noqa: SIM115 - owned by the exporter
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            ConsoleSpanExporter(out=out, formatter=lambda span: span.to_json(indent=None) + "\n")
+        )
+    )
+    trace.set_tracer_provider(provider)
+    return True
+
+
+def inject_context() -> dict[str, str]:
+    """Serialize the current trace context (empty when tracing is unavailable)."""
+    carrier: dict[str, str] = {}
+    if _load():
+        propagate.inject(carrier)
+    return carrier
+
+
+@contextmanager
+def job_span(name: str, carrier: dict[str, str], attrs: dict[str, Any]) -> Iterator[Any]:
+    """Span for work done on behalf of a job, parented to the context in ``carrier``."""
+    if not _load():
+        yield None
+        return
+    tracer = trace.get_tracer(_TRACER_NAME)
+    with tracer.start_as_current_span(
+        name,
+        context=propagate.extract(carrier) if carrier else None,
+        kind=SpanKind.INTERNAL,
+        attributes=_clean_attrs(attrs),
+    ) as span:
+        yield span
+
+
+def _clean_attrs(attrs: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attrs.items()
+        if value not in (None, "")
+    }
+
+
+def _request_attrs(method: str, request: Any) -> dict[str, Any]:
+    return _clean_attrs(
+        {
+            "rpc.system": "grpc",
+            "rpc.service": "domed.v1.DomedService",
+            "rpc.method": method,
+            "domed.job_id": getattr(request, "job_id", None),
+            "domed.tool_id": getattr(request, "skill_id", None) or getattr(request, "tool_id", None),
+            "domed.profile": getattr(request, "profile", None),
+        }
+    )
+
+
+def _record_response(span: Any, response: Any) -> None:
+    job_id = getattr(response, "job_id", "")
+    if job_id:
+        span.set_attribute("domed.job_id", job_id)
+    status = getattr(response, "status", None)
+    if status is not None and not status.ok:
+        span.set_attribute("domed.status_code", int(status.code))
+        span.set_attribute("domed.status_message", status.message)
+    span.set_attribute("rpc.grpc.status_code", grpc.StatusCode.OK.value[0])
+
+
+def _record_error(span: Any, exc: BaseException) -> None:
+    span.record_exception(exc)
+    span.set_status(Status(StatusCode.ERROR, str(exc)))
+    span.set_attribute("rpc.grpc.status_code", grpc.StatusCode.UNKNOWN.value[0])
+
+
+def _start_server_span(method: str, request: Any, context: Any) -> Any:
+    carrier = {str(k): str(v) for k, v in (context.invocation_metadata() or ())}
+    return trace.get_tracer(_TRACER_NAME).start_span(
+        f"domed/{method}",
+        context=propagate.extract(carrier),
+        kind=SpanKind.SERVER,
+        attributes=_request_attrs(method, request),
+    )
+
+
+class TracingServerInterceptor(grpc.ServerInterceptor):
+    """Open one SERVER span per RPC, parented to the caller's ``traceparent`` metadata.
+
+    Unary handlers run with the span as the current context so work they hand off (queued
+    jobs) can link back to it; a streaming span covers the stream until it is drained.
+    """
+
+    def intercept_service(self, continuation: Any, handler_call_details: Any) -> Any:
+        handler = continuation(handler_call_details)
+        if handler is None or not _load():
+            return handler
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        if handler.unary_unary is not None:
+            inner = handler.unary_unary
+
+            def _unary(request: Any, context: Any) -> Any:
+                span = _start_server_span(method, request, context)
+                with trace.use_span(span, end_on_exit=True, record_exception=False, set_status_on_exception=False):
+                    try:
+                        response = inner(request, context)
+                    except Exception as exc:
+                        _record_error(span, exc)
+                        raise
+                    _record_response(span, response)
+                    return response
+
+            return grpc.unary_unary_rpc_method_handler(
+                _unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream is not None:
+            stream = handler.unary_stream
+
+            def _stream(request: Any, context: Any) -> Any:
+                span = _start_server_span(method, request, context)
+                sent = 0
+                try:
+                    for item in stream(request, context):
+                        sent += 1
+                        yield item
+                except Exception as exc:
+                    _record_error(span, exc)
+                    raise
+                finally:
+                    span.set_attribute("domed.stream_messages", sent)
+                    span.end()
+
+            return grpc.unary_stream_rpc_method_handler(
+                _stream,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+
+class AsyncTracingServerInterceptor(grpc.aio.ServerInterceptor):
+    """grpc.aio counterpart of ``TracingServerInterceptor``."""
+
+    async def intercept_service(self, continuation: Any, handler_call_details: Any) -> Any:
+        handler = await continuation(handler_call_details)
+        if handler is None or not _load():
+            return handler
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        if handler.unary_unary is not None:
+            inner = handler.unary_unary
+
+            async def _unary(request: Any, context: Any) -> Any:
+                span = _start_server_span(method, request, context)
+                with trace.use_span(span, end_on_exit=True, record_exception=False, set_status_on_exception=False):
+                    try:
+                        response = await inner(request, context)
+                    except Exception as exc:
+                        _record_error(span, exc)
+                        raise
+                    _record_response(span, response)
+                    return response
+
+            return grpc.unary_unary_rpc_method_handler(
+                _unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream is not None:
+            stream = handler.unary_stream
+
+            async def _stream(request: Any, context: Any) -> Any:
+                span = _start_server_span(method, request, context)
+                sent = 0
+                try:
+                    async for item in stream(request, context):
+                        sent += 1
+                        yield item
+                except Exception as exc:
+                    _record_error(span, exc)
+                    raise
+                finally:
+                    span.set_attribute("domed.stream_messages", sent)
+                    span.end()
+
+            return grpc.unary_stream_rpc_method_handler(
+                _stream,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return handler
+
+
+class _ClientCallDetails(grpc.ClientCallDetails):
+    def __init__(self, details: Any, metadata: list[tuple[str, str]]) -> None:
+        self.method = details.method
+        self.timeout = details.timeout
+        self.metadata = metadata
+        self.credentials = details.credentials
+        self.wait_for_ready = getattr(details, "wait_for_ready", None)
+        self.compression = getattr(details, "compression", None)
+
+
+class TracingClientInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """Open a CLIENT span per call and forward its context as ``traceparent`` metadata."""
+
+    def _call(self, continuation: Any, details: Any, request: Any) -> Any:
+        method = details.method.rsplit("/", 1)[-1]
+        tracer = trace.get_tracer(_TRACER_NAME)
+        with tracer.start_as_current_span(
+            f"domed.client/{method}",
+            kind=SpanKind.CLIENT,
+            attributes=_request_attrs(method, request),
+        ):
+            metadata = list(details.metadata or ())
+            metadata.extend(inject_context().items())
+            return continuation(_ClientCallDetails(details, metadata), request)
+
+    def intercept_unary_unary(self, continuation: Any, client_call_details: Any, request: Any) -> Any:
+        return self._call(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation: Any, client_call_details: Any, request: Any) -> Any:
+        return self._call(continuation, client_call_details, request)
+
+
+class _AsyncTracingClientInterceptor:
+    async def _call(self, continuation: Any, details: Any, request: Any) -> Any:
+        method = details.method.decode() if isinstance(details.method, bytes) else details.method
+        method = method.rsplit("/", 1)[-1]
+        with trace.get_tracer(_TRACER_NAME).start_as_current_span(
+            f"domed.client/{method}",
+            kind=SpanKind.CLIENT,
+            attributes=_request_attrs(method, request),
+        ):
+            metadata = grpc.aio.Metadata(*(details.metadata or ()))
+            for key, value in inject_context().items():
+                metadata.add(key, value)
+            return await continuation(details._replace(metadata=metadata), request)
+
+
+class _AsyncTracingUnaryInterceptor(_AsyncTracingClientInterceptor, grpc.aio.UnaryUnaryClientInterceptor):
+    async def intercept_unary_unary(self, continuation: Any, client_call_details: Any, request: Any) -> Any:
+        return await self._call(continuation, client_call_details, request)
+
+
+class _AsyncTracingStreamInterceptor(_AsyncTracingClientInterceptor, grpc.aio.UnaryStreamClientInterceptor):
+    async def intercept_unary_stream(self, continuation: Any, client_call_details: Any, request: Any) -> Any:
+        return await self._call(continuation, client_call_details, request)
+
+
+def async_tracing_client_interceptors() -> list[Any]:
+    """grpc.aio counterparts of ``TracingClientInterceptor``.
+
+    grpc.aio files each interceptor under a single call type, so unary and streaming calls
+    need separate instances.
+    """
+    return [_AsyncTracingUnaryInterceptor(), _AsyncTracingStreamInterceptor()]